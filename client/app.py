@@ -1,5 +1,6 @@
 import pygame
 import os
+import time
 
 # --------------------------------------------------
 # Ρυθμίσεις παιχνιδιού (ανάλυση, fps, τίτλος)
@@ -11,10 +12,23 @@ from shared.config.game_config import GameConfig
 # --------------------------------------------------
 from shared.core.scene import SceneManager
 
+# --------------------------------------------------
+# Μέτρηση χρόνων frame (F3 overlay, F4 εξαγωγή)
+# --------------------------------------------------
+from shared.core.profiler import Profiler
+from client.views.profiler_overlay import ProfilerOverlay
+
+# --------------------------------------------------
+# High scores (SQLite)
+# --------------------------------------------------
+from shared.persistence.score_repository import ScoreRepository
+from shared.persistence.score_writer import ScoreWriter
+
 # --------------------------------------------------
 # Σύστημα εισόδου (πληκτρολόγιο)
 # --------------------------------------------------
 from client.controllers.input_controller import InputController
+from shared.services.input import InputSnapshot
 
 # --------------------------------------------------
 # Σκηνές του παιχνιδιού
@@ -44,11 +58,11 @@ class GameApp:
     - εκτέλεση του κύριου game loop
     """
 
-    def __init__(self) -> None:
+    def __init__(self, config: GameConfig = None) -> None:
         # --------------------------------------------------
-        # Φόρτωση default ρυθμίσεων παιχνιδιού
+        # Φόρτωση ρυθμίσεων παιχνιδιού (default αν δεν δοθούν)
         # --------------------------------------------------
-        self.config = GameConfig.default()
+        self.config = config if config is not None else GameConfig.default()
 
         # --------------------------------------------------
         # Προ-αρχικοποίηση audio mixer
@@ -103,6 +117,24 @@ class GameApp:
         self.scene_manager = SceneManager()
         self._running = True
 
+        # Χρονική στιγμή του τελευταίου input (για τον ρυθμό αδράνειας)
+        self._last_activity = time.perf_counter()
+
+        # Χρονική στιγμή έναρξης του τρέχοντος frame
+        self._frame_start = time.perf_counter()
+
+        # Profiler: ανενεργός μέχρι να πατηθεί F3
+        # (ή ενεργός από την αρχή μέσω GameConfig.profiling)
+        self.profiler = Profiler(enabled=self.config.profiling)
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+
+        # Βάση high scores: μία σύνδεση για όλες τις σκηνές
+        self.scores = ScoreRepository(self.config.scores_db or None)
+
+        # Οι εγγραφές scores γίνονται σε background thread,
+        # ώστε ένα αργό commit να μη σταματά το game loop
+        self.score_writer = ScoreWriter(self.scores.db_path)
+
         # --------------------------------------------------
         # Καταχώρηση όλων των σκηνών
         # --------------------------------------------------
@@ -113,7 +145,7 @@ class GameApp:
 
         self.scene_manager.register_scene(
             "game",
-            GameScene(self.scene_manager)
+            GameScene(self.scene_manager, profiler=self.profiler, config=self.config)
         )
 
         self.scene_manager.register_scene(
@@ -123,7 +155,7 @@ class GameApp:
 
         self.scene_manager.register_scene(
             "highscores",
-            HighScoresScene(self.scene_manager)
+            HighScoresScene(self.scene_manager, repo=self.scores)
         )
 
         self.scene_manager.register_scene(
@@ -133,13 +165,21 @@ class GameApp:
 
         self.scene_manager.register_scene(
             "gameover",
-            GameOverScene(self.scene_manager)
+            GameOverScene(
+                self.scene_manager,
+                repo=self.scores,
+                score_writer=self.score_writer,
+            )
         )
 
         # --------------------------------------------------
         # Εκκίνηση από το κεντρικό μενού
+        # (ή κατευθείαν στο παιχνίδι αν ζητήθηκε replay)
         # --------------------------------------------------
-        self.scene_manager.set_scene("menu", {})
+        if self.config.replay_path:
+            self.scene_manager.set_scene("game", {})
+        else:
+            self.scene_manager.set_scene("menu", {})
 
     # ==================================================
     # Τερματισμός εφαρμογής
@@ -158,31 +198,223 @@ class GameApp:
         """
         Ο βασικός game loop.
 
+        Η προσομοίωση τρέχει με σταθερό βήμα (1 / tick_rate),
+        ανεξάρτητα από τον ρυθμό σχεδίασης. Ο χρόνος κάθε frame
+        συσσωρεύεται και καταναλώνεται σε ολόκληρα ticks. Το υπόλοιπο
+        δίνεται στη σκηνή ως alpha για ομαλή σχεδίαση.
+
         Εκτελείται συνεχώς μέχρι το _running να γίνει False.
         """
-        while self._running:
-            # Υπολογισμός delta time σε δευτερόλεπτα
-            dt = self.clock.tick(self.config.fps) / 1000.0
-
+        tick_dt = 1.0 / self.config.tick_rate
+        max_ticks = self.config.max_ticks_per_frame
+
+        # Χρόνος που δεν έχει ακόμα προσομοιωθεί (δευτερόλεπτα)
+        accumulator = 0.0
+
+        # Είσοδος που δεν έχει ακόμα περάσει σε κάποιο tick
+        pending = None
+
+        # Το finally τρέχει και όταν update / render πετάξει exception,
+        # ώστε τα scores της ουράς να γραφτούν πριν τερματίσει η διεργασία
+        try:
+            while self._running:
+                # --------------------------------------------------
+                # Αναμονή μέχρι το επόμενο frame
+                # --------------------------------------------------
+                # Σε αδρανή σκηνή (π.χ. μενού χωρίς input) το loop κοιμάται
+                # μέχρι το επόμενο frame του χαμηλού ρυθμού ή μέχρι το
+                # πρώτο event, ώστε να ξυπνά αμέσως με το πάτημα πλήκτρου.
+                fps = self._frame_rate()
+                if fps < self.config.fps:
+                    self._wait_idle(fps)
+                    frame_ms = self.clock.tick()
+                else:
+                    frame_ms = self.clock.tick(fps)
+
+                # Χρόνος του frame σε δευτερόλεπτα
+                accumulator += frame_ms / 1000.0
+                self._frame_start = time.perf_counter()
+
+                # Ο χρόνος του frame μετρά από εδώ (χωρίς την αναμονή του tick)
+                profiler = self.profiler
+                profiler.begin_frame()
+
+                with profiler.section("input"):
+                    # --------------------------------------------------
+                    # Διαχείριση events (κλείσιμο παραθύρου, profiler)
+                    # --------------------------------------------------
+                    for event in pygame.event.get():
+                        # Κάθε event (πλήκτρο, ποντίκι, παράθυρο) = δραστηριότητα
+                        self._last_activity = self._frame_start
+
+                        if event.type == pygame.QUIT:
+                            self.stop()
+
+                        # Το παράθυρο χρειάζεται ξανά ολόκληρο το περιεχόμενο
+                        if event.type == pygame.VIDEOEXPOSE:
+                            self.scene_manager.invalidate()
+
+                        if event.type == pygame.KEYDOWN:
+                            if event.key == pygame.K_F3:
+                                profiler.toggle()
+                                self.scene_manager.invalidate()
+                            elif event.key == pygame.K_F4:
+                                self._export_profile()
+
+                    # --------------------------------------------------
+                    # Ανάγνωση input
+                    # --------------------------------------------------
+                    # Αν σε κάποιο frame δεν τρέξει tick, το στιγμιαίο
+                    # input (κείμενο, backspace) κρατιέται για το επόμενο
+                    pending = self._merge_input(pending, self.input_controller.capture())
+
+                    # Πλήκτρο που κρατιέται πατημένο κρατά το πλήρες fps
+                    if self._has_held_keys(pending):
+                        self._last_activity = self._frame_start
+
+                # --------------------------------------------------
+                # Σταθερά βήματα προσομοίωσης
+                # --------------------------------------------------
+                with profiler.section("update"):
+                    ticks = 0
+                    while accumulator >= tick_dt and ticks < max_ticks:
+                        self.scene_manager.handle_input(pending)
+                        self.scene_manager.update(tick_dt)
+
+                        # Τα στιγμιαία events καταναλώνονται από το πρώτο tick
+                        pending = self._held_only(pending)
+
+                        accumulator -= tick_dt
+                        ticks += 1
+
+                # Αν το frame άργησε πολύ (π.χ. μετακίνηση παραθύρου),
+                # πετάμε τον επιπλέον χρόνο αντί να τον κυνηγάμε
+                if ticks == max_ticks:
+                    accumulator = min(accumulator, tick_dt)
+
+                # --------------------------------------------------
+                # Σχεδίαση με interpolation ανάμεσα στα ticks
+                # --------------------------------------------------
+                with profiler.section("render"):
+                    # Το overlay ζωγραφίζεται πάνω από ολόκληρο το frame
+                    if profiler.enabled:
+                        self.scene_manager.invalidate()
+
+                    dirty = self.scene_manager.render(self.screen, accumulator / tick_dt)
+
+                    if dirty is None:
+                        self.profiler_overlay.draw(self.screen)
+
+                # --------------------------------------------------
+                # Ενημέρωση οθόνης
+                # --------------------------------------------------
+                # None : άλλαξε όλη η οθόνη
+                # [..] : άλλαξαν μόνο αυτά τα Rect
+                # []   : τίποτα (π.χ. στατικό μενού) → καμία ενημέρωση
+                with profiler.section("flip"):
+                    if dirty is None:
+                        pygame.display.flip()
+                    elif dirty:
+                        pygame.display.update(dirty)
+
+                profiler.end_frame()
+        finally:
             # --------------------------------------------------
-            # Διαχείριση events (π.χ. κλείσιμο παραθύρου)
+            # Αποθήκευση όσων scores περιμένουν ακόμα στην ουρά
             # --------------------------------------------------
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.stop()
+            self.score_writer.close()
+            self.scores.close()
 
             # --------------------------------------------------
-            # Ανάγνωση input και ενημέρωση σκηνής
+            # Καθαρός τερματισμός pygame
             # --------------------------------------------------
-            snapshot = self.input_controller.capture()
-            self.scene_manager.handle_input(snapshot)
-            self.scene_manager.update(dt)
-            self.scene_manager.render(self.screen)
+            pygame.quit()
 
-            # Ενημέρωση οθόνης
-            pygame.display.flip()
+    # ==================================================
+    # Ρυθμός frames
+    # ==================================================
+    def _frame_rate(self) -> int:
+        """
+        Ρυθμός του επόμενου frame: το desired_fps() της σκηνής
+        αν δεν έχει υπάρξει input για config.idle_delay δευτερόλεπτα,
+        αλλιώς το πλήρες config.fps.
+        """
+        fps = self.config.fps
 
-        # --------------------------------------------------
-        # Καθαρός τερματισμός pygame
-        # --------------------------------------------------
-        pygame.quit()
+        desired = self.scene_manager.desired_fps()
+        if desired is None or self.profiler.enabled:
+            return fps
+
+        if time.perf_counter() - self._last_activity < self.config.idle_delay:
+            return fps
+
+        return min(fps, desired)
+
+    def _wait_idle(self, fps: int) -> None:
+        """
+        Κοιμάται μέχρι να έρθει η ώρα του επόμενου frame (με ρυθμό fps)
+        ή μέχρι να φτάσει κάποιο event, όποιο γίνει πρώτο.
+        """
+        remaining = self._frame_start + 1.0 / fps - time.perf_counter()
+        if remaining <= 0.0:
+            return
+
+        event = pygame.event.wait(int(remaining * 1000))
+
+        # Το event επιστρέφει στην ουρά για τον κανονικό χειρισμό
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+
+    @staticmethod
+    def _has_held_keys(snapshot) -> bool:
+        return (
+            snapshot.up or snapshot.down or snapshot.left
+            or snapshot.right or snapshot.fire or snapshot.pause
+        )
+
+    # ==================================================
+    # Profiling
+    # ==================================================
+    def _export_profile(self) -> None:
+        """
+        Εξαγωγή των χρόνων του profiler σε CSV και JSON
+        (στον τρέχοντα φάκελο, με timestamp στο όνομα).
+        """
+        if not self.profiler.enabled:
+            return
+
+        base = time.strftime("profile_%Y%m%d_%H%M%S")
+        self.profiler.export_csv(base + ".csv")
+        self.profiler.export_json(base + ".json")
+        print(f"Profile saved: {base}.csv, {base}.json")
+
+    # ==================================================
+    # Βοηθητικά input
+    # ==================================================
+    @staticmethod
+    def _merge_input(pending, snapshot):
+        """
+        Ενώνει την είσοδο που περιμένει με το νέο snapshot.
+        Τα πλήκτρα που κρατιούνται έρχονται από το νέο snapshot,
+        το κείμενο και το backspace συσσωρεύονται.
+        """
+        if pending is None:
+            return snapshot
+
+        snapshot.text = pending.text + snapshot.text
+        snapshot.backspace = pending.backspace or snapshot.backspace
+        return snapshot
+
+    @staticmethod
+    def _held_only(snapshot):
+        """
+        Αντίγραφο του snapshot χωρίς τα στιγμιαία events.
+        """
+        return InputSnapshot(
+            up=snapshot.up,
+            down=snapshot.down,
+            left=snapshot.left,
+            right=snapshot.right,
+            fire=snapshot.fire,
+            pause=snapshot.pause,
+        )
@@ -1,4 +1,31 @@
+import argparse
+
 from client.app import GameApp
+from shared.config.game_config import GameConfig
+
+
+def parse_config(argv=None) -> GameConfig:
+    """
+    Διαβάζει τις (προαιρετικές) παραμέτρους γραμμής εντολών:
+
+    --record FILE : καταγραφή κάθε παιχνιδιού σε FILE
+    --replay FILE : αναπαραγωγή του FILE αντί για πληκτρολόγιο
+    --profile     : profiler ενεργός από την εκκίνηση (F3 overlay)
+    --scores-db FILE : αρχείο βάσης των high scores
+    """
+    parser = argparse.ArgumentParser(description="Digger")
+    parser.add_argument("--record", metavar="FILE", default="")
+    parser.add_argument("--replay", metavar="FILE", default="")
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--scores-db", metavar="FILE", default="")
+    args = parser.parse_args(argv)
+
+    return GameConfig(
+        record_path=args.record,
+        replay_path=args.replay,
+        profiling=args.profile,
+        scores_db=args.scores_db,
+    )
 
 
 def main() -> None:
@@ -12,7 +39,7 @@ def main() -> None:
     - επιτρέπει ευκολότερο testing
     - αποφεύγει εκτέλεση κώδικα κατά το import
     """
-    GameApp().run()
+    GameApp(parse_config()).run()
 
 
 if __name__ == "__main__":
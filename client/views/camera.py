@@ -26,6 +26,15 @@ class Camera2D:
         self.x = 0
         self.y = 0
 
+        # Θέση κάμερας στο προηγούμενο tick (για interpolation)
+        self.prev_x = 0
+        self.prev_y = 0
+
+        # Θέση που χρησιμοποιείται στη σχεδίαση
+        # (ίδια με x, y εκτός αν κληθεί η interpolate)
+        self.view_x = 0
+        self.view_y = 0
+
     def follow(self, entity):
         """
         Κεντράρει την κάμερα πάνω σε ένα entity (π.χ. player).
@@ -43,6 +52,27 @@ class Camera2D:
         self.x = world_x - self.screen_w // 2
         self.y = world_y - self.screen_h // 2
 
+        self.view_x = self.x
+        self.view_y = self.y
+
+    def store_previous(self):
+        """
+        Κρατά την τρέχουσα θέση ως "προηγούμενη".
+        Καλείται στην αρχή κάθε tick, πριν από τη follow().
+        """
+
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def interpolate(self, alpha):
+        """
+        Θέτει τη θέση σχεδίασης ανάμεσα στην προηγούμενη (alpha = 0)
+        και στην τρέχουσα θέση (alpha = 1).
+        """
+
+        self.view_x = round(self.prev_x + (self.x - self.prev_x) * alpha)
+        self.view_y = round(self.prev_y + (self.y - self.prev_y) * alpha)
+
     def world_to_screen(self, wx, wy):
         """
         Μετατρέπει συντεταγμένες κόσμου (world)
@@ -51,6 +81,72 @@ class Camera2D:
         Αυτή η μέθοδος χρησιμοποιείται από ΟΛΑ τα render συστήματα.
         """
 
-        # Αφαιρούμε τη θέση της κάμερας από τις world συντεταγμένες
-        # ώστε να πάρουμε screen συντεταγμένες
-        return wx - self.x, wy - self.y
+        # Αφαιρούμε τη θέση (σχεδίασης) της κάμερας από τις world
+        # συντεταγμένες ώστε να πάρουμε screen συντεταγμένες
+        return wx - self.view_x, wy - self.view_y
+
+    # ==================================================
+    # Culling (τι φαίνεται από την κάμερα)
+    # ==================================================
+
+    def visible_tile_rect(self, level_w=None, level_h=None):
+        """
+        Επιστρέφει τα tiles που φαίνονται (έστω και εν μέρει) ως
+        (x0, y0, x1, y1), όπου x1 / y1 είναι ΕΚΤΟΣ ορίου (όπως στο range).
+
+        Αν δοθούν διαστάσεις πίστας (σε tiles), το ορθογώνιο
+        περιορίζεται μέσα στην πίστα.
+        """
+
+        ts = self.tile_size
+
+        x0 = self.view_x // ts
+        y0 = self.view_y // ts
+        x1 = -(-(self.view_x + self.screen_w) // ts)
+        y1 = -(-(self.view_y + self.screen_h) // ts)
+
+        if level_w is not None:
+            x0 = max(0, x0)
+            x1 = min(level_w, x1)
+        if level_h is not None:
+            y0 = max(0, y0)
+            y1 = min(level_h, y1)
+
+        return x0, y0, x1, y1
+
+    def visible_tiles(self, level_w, level_h):
+        """
+        Διατρέχει τις θέσεις (x, y) των ορατών tiles της πίστας.
+        """
+
+        x0, y0, x1, y1 = self.visible_tile_rect(level_w, level_h)
+
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                yield x, y
+
+    def is_tile_visible(self, tx, ty):
+        """
+        True αν το tile (tx, ty) φαίνεται έστω και εν μέρει.
+        """
+
+        ts = self.tile_size
+        sx = tx * ts - self.view_x
+        sy = ty * ts - self.view_y
+
+        return -ts < sx < self.screen_w and -ts < sy < self.screen_h
+
+    def is_visible(self, rect):
+        """
+        True αν το ορθογώνιο (x, y, w, h) σε world pixels
+        τέμνει το παράθυρο της κάμερας.
+        """
+
+        x, y, w, h = rect
+
+        return (
+            x < self.view_x + self.screen_w
+            and y < self.view_y + self.screen_h
+            and x + w > self.view_x
+            and y + h > self.view_y
+        )
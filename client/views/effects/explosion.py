@@ -1,31 +1,100 @@
+import math
 import random
+from array import array
+
 import pygame
 
 
+# ==================================================
+# Τύποι particles
+# ==================================================
+# Ο τύπος αποθηκεύεται ως μικρός ακέραιος (βλ. KIND_COLORS)
+KIND_SPARK = 0
+KIND_DUST = 1
+
+# Χρώμα ανά τύπο particle
+KIND_COLORS = (
+    (255, 210, 90),   # spark
+    (180, 140, 90),   # dust
+)
+
+# Σε πόσα επίπεδα διαφάνειας χωρίζεται το fade-out
+# (ένας έτοιμος κύκλος ανά (τύπος, ακτίνα, επίπεδο) στο atlas)
+ALPHA_BUCKETS = 16
+
+# Ακτίνες particles (pixels)
+RADIUS_MIN = 2
+RADIUS_MAX = 4
+
+# Μέγεθος κελιού του atlas (ο μεγαλύτερος κύκλος + 1 pixel περιθώριο)
+ATLAS_CELL = RADIUS_MAX * 2 + 2
+
+
 class ExplosionSystem:
     """
     Σύστημα διαχείρισης εκρήξεων τύπου particle.
 
     Χαρακτηριστικά:
-    - Δεν χρησιμοποιεί sprites ή εικόνες
+    - Δεν χρησιμοποιεί sprites ή εικόνες από αρχεία
     - Κάθε έκρηξη αποτελείται από πολλά μικρά particles
     - Τα particles έχουν φυσική συμπεριφορά (ταχύτητα, βαρύτητα, τριβή)
     - Το σύστημα είναι ανεξάρτητο από το gameplay
 
+    Αποθήκευση (structure of arrays):
+    - κάθε ιδιότητα είναι μία στήλη array (x, y, vx, vy, ttl, life, r, kind)
+    - το particle i είναι η θέση i σε όλες τις στήλες
+    - όταν ένα particle σβήνει, στη θέση του μπαίνει το τελευταίο
+      (swap-remove), οπότε δεν ξαναφτιάχνεται καμία λίστα
+
+    Σχεδίαση:
+    - όλοι οι κύκλοι (τύπος x ακτίνα x διαφάνεια) σχεδιάζονται ΜΙΑ φορά
+      στη δημιουργία, σε ένα κοινό Surface (atlas)
+    - σε κάθε frame όλα τα particles σχεδιάζονται με ΕΝΑ Surface.blits,
+      με το κατάλληλο κομμάτι (area) του atlas για το καθένα
+
     Παρέχει τρεις βασικές λειτουργίες:
     - spawn / spawn_world : δημιουργία έκρηξης
     - update              : ενημέρωση φυσικής
     - draw                : σχεδίαση στην οθόνη
     """
 
-    def __init__(self, tile_size: int = 32):
+    def __init__(self, tile_size: int = 32, rng=None):
         # Μέγεθος πλακιδίου (tile) σε pixels
         # Χρησιμοποιείται για μετατροπή από tile coordinates σε world coordinates
         self.tile_size = tile_size
 
-        # Λίστα particles
-        # Κάθε particle αποθηκεύεται ως dictionary με φυσικές ιδιότητες
-        self._particles = []
+        # Πηγή τυχαιότητας για τα particles
+        # (π.χ. random.Random με seed ώστε ένα replay να φαίνεται ίδιο)
+        # Αν δεν δοθεί, χρησιμοποιείται το global random
+        self.rng = rng if rng is not None else random
+
+        # --------------------------------------------------
+        # Στήλες particles
+        # --------------------------------------------------
+        self._x = array("d")       # θέση x (world pixels)
+        self._y = array("d")       # θέση y (world pixels)
+        self._vx = array("d")      # ταχύτητα x
+        self._vy = array("d")      # ταχύτητα y
+        self._ttl = array("d")     # χρόνος που έχει περάσει
+        self._life = array("d")    # συνολικός χρόνος ζωής
+        self._r = array("B")       # ακτίνα (pixels)
+        self._kind = array("B")    # KIND_SPARK / KIND_DUST
+
+        self._columns = (
+            self._x, self._y, self._vx, self._vy,
+            self._ttl, self._life, self._r, self._kind,
+        )
+
+        # Atlas με όλους τους κύκλους και το κομμάτι (Rect) του καθενός
+        self._atlas, self._areas = self._build_atlas()
+
+    def __len__(self):
+        # Πλήθος ενεργών particles
+        return len(self._ttl)
+
+    def clear(self):
+        for column in self._columns:
+            del column[:]
 
     def spawn(self, tile_x: int, tile_y: int, intensity: int = 18):
         """
@@ -55,49 +124,35 @@ class ExplosionSystem:
         cx = world_x_px + self.tile_size / 2
         cy = world_y_px + self.tile_size / 2
 
+        rng = self.rng
+        uniform = rng.uniform
+
         # Δημιουργία πολλών particles
         for _ in range(intensity):
 
             # Τυχαία γωνία εκτόξευσης (0 έως 2π)
-            angle = random.uniform(0.0, 6.28318)
+            angle = uniform(0.0, 6.28318)
 
             # Τυχαία αρχική ταχύτητα
-            speed = random.uniform(90.0, 240.0)
-
-            # Υπολογισμός διανύσματος ταχύτητας με περιστροφή
-            vx = (
-                speed
-                * random.uniform(0.6, 1.0)
-                * pygame.math.Vector2(1, 0).rotate_rad(angle).x
-            )
-            vy = (
-                speed
-                * random.uniform(0.6, 1.0)
-                * pygame.math.Vector2(1, 0).rotate_rad(angle).y
-            )
-
-            # Δημιουργία particle ως dictionary
-            self._particles.append({
-                # Θέση (με μικρή τυχαιότητα)
-                "x": cx + random.uniform(-3, 3),
-                "y": cy + random.uniform(-3, 3),
-
-                # Ταχύτητα
-                "vx": vx,
-                "vy": vy,
-
-                # Συνολικός χρόνος ζωής
-                "life": random.uniform(0.25, 0.55),
-
-                # Χρόνος που έχει περάσει
-                "ttl": 0.0,
-
-                # Ακτίνα particle (pixels)
-                "r": random.randint(2, 4),
-
-                # Τύπος particle (οπτική διαφοροποίηση)
-                "kind": random.choice(["spark", "dust"]),
-            })
+            speed = uniform(90.0, 240.0)
+
+            # Διάνυσμα ταχύτητας στη γωνία εκτόξευσης
+            self._vx.append(speed * uniform(0.6, 1.0) * math.cos(angle))
+            self._vy.append(speed * uniform(0.6, 1.0) * math.sin(angle))
+
+            # Θέση (με μικρή τυχαιότητα)
+            self._x.append(cx + uniform(-3, 3))
+            self._y.append(cy + uniform(-3, 3))
+
+            # Συνολικός χρόνος ζωής / χρόνος που έχει περάσει
+            self._life.append(uniform(0.25, 0.55))
+            self._ttl.append(0.0)
+
+            # Ακτίνα particle (pixels)
+            self._r.append(rng.randint(RADIUS_MIN, RADIUS_MAX))
+
+            # Τύπος particle (οπτική διαφοροποίηση)
+            self._kind.append(rng.choice((KIND_SPARK, KIND_DUST)))
 
     def update(self, dt: float):
         """
@@ -106,51 +161,133 @@ class ExplosionSystem:
         dt : χρόνος που πέρασε από το προηγούμενο frame (σε δευτερόλεπτα)
         """
 
+        ttl = self._ttl
+        n = len(ttl)
+        if n == 0:
+            return
+
+        x, y, vx, vy = self._x, self._y, self._vx, self._vy
+        life = self._life
+        columns = self._columns
+
         # Συντελεστής "βαρύτητας"
         g = 420.0
+        gdt = g * dt
 
-        # Λίστα για τα ζωντανά particles
-        alive = []
+        # Μικρή τριβή (drag) για πιο φυσική κίνηση
+        drag_x = 1.0 - 1.6 * dt
+        drag_y = 1.0 - 1.2 * dt
 
-        for p in self._particles:
+        i = 0
+        while i < n:
             # Αύξηση χρόνου ζωής
-            p["ttl"] += dt
-
-            # Αν το particle έχει ξεπεράσει τον χρόνο ζωής του, απορρίπτεται
-            if p["ttl"] >= p["life"]:
+            t = ttl[i] + dt
+
+            # Αν το particle έχει ξεπεράσει τον χρόνο ζωής του:
+            # στη θέση του μπαίνει το τελευταίο (swap-remove)
+            # και ξαναελέγχεται η ίδια θέση
+            if t >= life[i]:
+                n -= 1
+                if i != n:
+                    for column in columns:
+                        column[i] = column[n]
                 continue
 
+            ttl[i] = t
+
             # Εφαρμογή βαρύτητας στην κατακόρυφη ταχύτητα
-            p["vy"] += g * dt
+            v = vy[i] + gdt
 
             # Ενημέρωση θέσης
-            p["x"] += p["vx"] * dt
-            p["y"] += p["vy"] * dt
+            x[i] += vx[i] * dt
+            y[i] += v * dt
 
-            # Μικρή τριβή (drag) για πιο φυσική κίνηση
-            p["vx"] *= (1.0 - 1.6 * dt)
-            p["vy"] *= (1.0 - 1.2 * dt)
+            # Τριβή
+            vx[i] *= drag_x
+            vy[i] = v * drag_y
 
-            # Το particle παραμένει ενεργό
-            alive.append(p)
+            i += 1
 
-        # Αντικατάσταση λίστας με μόνο τα ζωντανά particles
-        self._particles = alive
+        # Αφαίρεση των σβησμένων από το τέλος των στηλών
+        if n < len(ttl):
+            for column in columns:
+                del column[n:]
 
-    def draw(self, surface, camera):
+    @staticmethod
+    def _build_atlas():
         """
-        Σχεδιάζει όλα τα ενεργά particles στην οθόνη.
+        Δημιουργεί το atlas των particles.
 
-        surface : επιφάνεια pygame (συνήθως η οθόνη)
-        camera  : Camera2D για μετατροπή world → screen
+        Γραμμή   : (τύπος, ακτίνα)
+        Στήλη    : επίπεδο διαφάνειας (0 .. ALPHA_BUCKETS - 1)
+
+        Επιστρέφει (atlas, areas) όπου areas[kind][r][bucket] είναι
+        το Rect του κύκλου μέσα στο atlas.
         """
 
-        # Κάθε particle σχεδιάζεται σε μικρή προσωρινή επιφάνεια
-        # Αυτό επιτρέπει alpha blending χωρίς να επηρεάζει την κύρια οθόνη
-        for p in self._particles:
+        radii = range(RADIUS_MIN, RADIUS_MAX + 1)
+        rows = len(KIND_COLORS) * len(radii)
+
+        atlas = pygame.Surface(
+            (ATLAS_CELL * ALPHA_BUCKETS, ATLAS_CELL * rows), pygame.SRCALPHA
+        )
+
+        areas = []
+        row = 0
+        for color in KIND_COLORS:
+            by_radius = [None] * (RADIUS_MAX + 1)
+
+            for r in radii:
+                size = r * 2 + 2
+                cells = []
+
+                for bucket in range(ALPHA_BUCKETS):
+                    alpha = (bucket + 1) * 256 // ALPHA_BUCKETS - 1
+                    left = bucket * ATLAS_CELL
+                    top = row * ATLAS_CELL
+
+                    pygame.draw.circle(
+                        atlas,
+                        (*color, alpha),
+                        (left + r + 1, top + r + 1),
+                        r
+                    )
+                    cells.append(pygame.Rect(left, top, size, size))
+
+                by_radius[r] = cells
+                row += 1
+
+            areas.append(by_radius)
+
+        return atlas, areas
+
+    def batch(self, camera):
+        """
+        Εγγραφές blits (atlas, θέση, area) για όλα τα ορατά particles
+        (όσα είναι εκτός κάμερας παραλείπονται).
+
+        camera : Camera2D για μετατροπή world → screen
+        """
+
+        x, y, ttl, life = self._x, self._y, self._ttl, self._life
+        radius, kind = self._r, self._kind
+
+        atlas = self._atlas
+        areas = self._areas
+        to_screen = camera.world_to_screen
+
+        # Όρια view για culling (particles εκτός κάμερας αγνοούνται)
+        view_w = camera.screen_w
+        view_h = camera.screen_h
+
+        # Λίστα (atlas, θέση, area) για ένα μόνο blits
+        batch = []
+        append = batch.append
+
+        for i in range(len(ttl)):
 
             # Υπολογισμός ποσοστού ζωής (0.0 → 1.0)
-            t = p["ttl"] / max(0.0001, p["life"])
+            t = ttl[i] / max(0.0001, life[i])
 
             # Fade-out όσο πλησιάζει στο τέλος ζωής
             alpha = int(255 * (1.0 - t))
@@ -158,26 +295,25 @@ class ExplosionSystem:
                 continue
 
             # Μετατροπή από world σε screen coordinates
-            sx, sy = camera.world_to_screen(p["x"], p["y"])
+            sx, sy = to_screen(x[i], y[i])
+
+            r = radius[i]
+            if sx + r < 0 or sy + r < 0 or sx - r >= view_w or sy - r >= view_h:
+                continue
 
-            # Επιλογή χρώματος ανάλογα με τον τύπο particle
-            if p["kind"] == "spark":
-                color = (255, 210, 90)
-            else:
-                color = (180, 140, 90)
+            area = areas[kind[i]][r][alpha * ALPHA_BUCKETS >> 8]
+            append((atlas, (sx - r, sy - r), area))
 
-            r = p["r"]
+        return batch
 
-            # Δημιουργία προσωρινής επιφάνειας με διαφάνεια
-            tmp = pygame.Surface((r * 2 + 2, r * 2 + 2), pygame.SRCALPHA)
+    def draw(self, surface, camera):
+        """
+        Σχεδιάζει όλα τα ενεργά particles στην οθόνη.
 
-            # Σχεδίαση κύκλου με alpha
-            pygame.draw.circle(
-                tmp,
-                (*color, alpha),
-                (r + 1, r + 1),
-                r
-            )
+        surface : επιφάνεια pygame (συνήθως η οθόνη)
+        camera  : Camera2D για μετατροπή world → screen
+        """
 
-            # Σχεδίαση του particle στην κύρια επιφάνεια
-            surface.blit(tmp, (sx - r, sy - r))
+        batch = self.batch(camera)
+        if batch:
+            surface.blits(batch, doreturn=False)
@@ -0,0 +1,93 @@
+import pygame
+
+
+class ProfilerOverlay:
+    """
+    Πίνακας πάνω από το παιχνίδι με τους χρόνους του Profiler.
+
+    Για κάθε section δείχνει p50 / p95 / p99 (ms) του κυλιόμενου
+    παραθύρου. Τα κείμενα ξαναφτιάχνονται λίγες φορές το δευτερόλεπτο
+    (όχι σε κάθε frame), ώστε το ίδιο το overlay να μη φορτώνει το frame.
+    """
+
+    # Χρώματα
+    BG_COLOR = (0, 0, 0, 170)
+    TEXT_COLOR = (220, 220, 220)
+    HEADER_COLOR = (255, 210, 90)
+
+    # Κάθε πόσα frames ξαναϋπολογίζονται τα στατιστικά
+    REFRESH_FRAMES = 15
+
+    def __init__(self, profiler, font_size: int = 14):
+        # Πηγή δεδομένων
+        self.profiler = profiler
+
+        self.font_size = font_size
+        self._font = None
+
+        # Έτοιμο surface του πίνακα (ξαναφτιάχνεται ανά REFRESH_FRAMES)
+        self._panel = None
+        self._frames_since_refresh = self.REFRESH_FRAMES
+
+    def _build_panel(self):
+        if self._font is None:
+            self._font = pygame.font.Font(
+                "assets/fonts/Orbitron-Bold.ttf", self.font_size
+            )
+
+        font = self._font
+        stats = self.profiler.stats()
+
+        rows = [("section", "p50", "p95", "p99")]
+        for name, entry in stats.items():
+            rows.append((
+                name,
+                f"{entry['p50']:.2f}",
+                f"{entry['p95']:.2f}",
+                f"{entry['p99']:.2f}",
+            ))
+
+        # Πλάτος στηλών: όνομα + τρεις αριθμητικές στήλες
+        name_w = max(font.size(r[0])[0] for r in rows)
+        num_w = max(font.size(v)[0] for r in rows for v in r[1:])
+
+        pad = 8
+        gap = 14
+        line_h = font.get_linesize()
+
+        width = pad * 2 + name_w + 3 * (num_w + gap)
+        height = pad * 2 + line_h * len(rows)
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill(self.BG_COLOR)
+
+        for i, row in enumerate(rows):
+            color = self.HEADER_COLOR if i == 0 else self.TEXT_COLOR
+            y = pad + i * line_h
+
+            panel.blit(font.render(row[0], True, color), (pad, y))
+
+            # Αριθμοί στοιχισμένοι δεξιά
+            x = pad + name_w + gap
+            for value in row[1:]:
+                surf = font.render(value, True, color)
+                panel.blit(surf, (x + num_w - surf.get_width(), y))
+                x += num_w + gap
+
+        return panel
+
+    def draw(self, surface):
+        """
+        Σχεδιάζει τον πίνακα στην πάνω δεξιά γωνία.
+        """
+
+        if not self.profiler.enabled:
+            return
+
+        self._frames_since_refresh += 1
+        if self._panel is None or self._frames_since_refresh >= self.REFRESH_FRAMES:
+            self._panel = self._build_panel()
+            self._frames_since_refresh = 0
+
+        x = surface.get_width() - self._panel.get_width() - 12
+        surface.blit(self._panel, (x, 44))
@@ -0,0 +1,81 @@
+class RenderQueue:
+    """
+    Ουρά σχεδίασης ανά layer για ΜΙΑ άποψη (view) του κόσμου.
+
+    Αντί κάθε sprite να κάνει δικό του surface.blit:
+    - τα αντικείμενα προστίθενται με world συντεταγμένες (add)
+    - όσα είναι εκτός κάμερας απορρίπτονται αμέσως (culling)
+    - στο flush κάθε layer σχεδιάζεται με ΕΝΑ Surface.blits
+
+    Τα layers σχεδιάζονται με τη σειρά του LAYERS
+    (το tilemap σχεδιάζεται πριν, από το TilemapView).
+
+    Χρήση:
+
+        queue.begin(camera, surface.get_size())
+        queue.add("actors", image, world_x, world_y)
+        queue.flush(surface)
+    """
+
+    # Σειρά σχεδίασης (από πίσω προς τα μπροστά)
+    LAYERS = ("tiles", "pickups", "actors", "bullets", "effects")
+
+    def __init__(self):
+        # layer -> λίστα (image, (sx, sy)) ή (image, (sx, sy), area)
+        self._layers = {name: [] for name in self.LAYERS}
+
+        # Θέση κάμερας και μέγεθος view (για culling)
+        self._cam_x = 0
+        self._cam_y = 0
+        self._view_w = 0
+        self._view_h = 0
+
+    def begin(self, camera, view_size) -> None:
+        """
+        Ξεκινά νέο frame για την κάμερα και το μέγεθος του view.
+        """
+
+        for items in self._layers.values():
+            items.clear()
+
+        self._cam_x = camera.view_x
+        self._cam_y = camera.view_y
+        self._view_w, self._view_h = view_size
+
+    def add(self, layer, image, wx, wy) -> None:
+        """
+        Προσθέτει μια εικόνα στη θέση (wx, wy) του κόσμου (pixels).
+        Αν δεν φαίνεται καθόλου στο view, αγνοείται.
+        """
+
+        sx = wx - self._cam_x
+        sy = wy - self._cam_y
+
+        if (
+            sx >= self._view_w
+            or sy >= self._view_h
+            or sx + image.get_width() <= 0
+            or sy + image.get_height() <= 0
+        ):
+            return
+
+        self._layers[layer].append((image, (sx, sy)))
+
+    def extend(self, layer, items) -> None:
+        """
+        Προσθέτει έτοιμες εγγραφές blits (σε screen συντεταγμένες),
+        π.χ. τα particles του ExplosionSystem. Δεν γίνεται culling.
+        """
+
+        self._layers[layer].extend(items)
+
+    def flush(self, surface) -> None:
+        """
+        Σχεδιάζει όλα τα layers (ένα blits ανά layer) και αδειάζει την ουρά.
+        """
+
+        for name in self.LAYERS:
+            items = self._layers[name]
+            if items:
+                surface.blits(items, doreturn=False)
+                items.clear()
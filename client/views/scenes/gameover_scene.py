@@ -2,6 +2,7 @@ import pygame
 import os
 from shared.core.scene import Scene
 from shared.persistence.score_repository import ScoreRepository
+from client.views.text_cache import TEXT_CACHE
 
 
 class GameOverScene(Scene):
@@ -17,13 +18,16 @@ class GameOverScene(Scene):
     Δεν επιτρέπει άλλη ενέργεια εκτός από ESC → επιστροφή στο menu.
     """
 
-    def __init__(self, scene_manager):
+    def __init__(self, scene_manager, repo=None, score_writer=None):
         # Αναφορά στον SceneManager για αλλαγή σκηνών
         self.sm = scene_manager
 
         # Repository για αποθήκευση / ανάγνωση scores
-        # (μπορεί να χρησιμοποιηθεί για μελλοντική επέκταση)
-        self.repo = ScoreRepository()
+        self.repo = repo if repo is not None else ScoreRepository()
+
+        # Αποθήκευση scores σε background thread (ScoreWriter)
+        # Αν δεν δοθεί, τα scores γράφονται απευθείας από το repo
+        self.score_writer = score_writer
 
         # -------------------------
         # Paths για assets
@@ -76,6 +80,19 @@ class GameOverScene(Scene):
         # Ανάκτηση σκορ από το payload
         self.score_p1 = payload.get("score_p1", 0)
         self.score_p2 = payload.get("score_p2", 0)
+        players = payload.get("players", 1)
+
+        # Καταχώρηση στα high scores (P2 όποτε έπαιξε, ακόμη και με 0)
+        scores = [self.score_p1]
+        if players == 2:
+            scores.append(self.score_p2)
+
+        if self.score_writer is not None:
+            # Χωρίς αναμονή: το commit γίνεται στο background thread
+            for score in scores:
+                self.score_writer.submit(score)
+        else:
+            self.repo.add_scores(scores)
 
         # Μικρή καθυστέρηση ώστε να μη φύγει άμεσα
         # αν ο παίκτης κρατά πατημένο ESC
@@ -118,6 +135,18 @@ class GameOverScene(Scene):
         if self._input.pause:
             self.sm.set_scene("menu", {})
 
+    def desired_fps(self):
+        """
+        Στατική οθόνη: χαμηλός ρυθμός μέχρι να πατηθεί ESC.
+        """
+        return 10
+
+    def render_state(self):
+        """
+        Η οθόνη Game Over δείχνει μόνο τα τελικά σκορ.
+        """
+        return self.score_p1, self.score_p2
+
     def render(self, surface):
         """
         Σχεδίαση της σκηνής Game Over.
@@ -132,9 +161,7 @@ class GameOverScene(Scene):
         # -------------------------
         # Τίτλος GAME OVER
         # -------------------------
-        title = self.font_title.render(
-            "GAME OVER", True, (255, 255, 255)
-        )
+        title = TEXT_CACHE.render(self.font_title, "GAME OVER", (255, 255, 255))
 
         surface.blit(
             title,
@@ -144,9 +171,9 @@ class GameOverScene(Scene):
         # -------------------------
         # Εμφάνιση σκορ παικτών
         # -------------------------
-        score_txt = self.font.render(
+        score_txt = TEXT_CACHE.render(
+            self.font,
             f"P1: {self.score_p1}   P2: {self.score_p2}",
-            True,
             (255, 255, 255)
         )
 
@@ -158,11 +185,7 @@ class GameOverScene(Scene):
         # -------------------------
         # Οδηγία επιστροφής
         # -------------------------
-        info = self.font.render(
-            "ESC: MAIN MENU",
-            True,
-            (200, 200, 200)
-        )
+        info = TEXT_CACHE.render(self.font, "ESC: MAIN MENU", (200, 200, 200))
 
         surface.blit(
             info,
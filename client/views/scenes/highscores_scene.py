@@ -2,6 +2,7 @@ import pygame
 import os
 from shared.core.scene import Scene
 from shared.persistence.score_repository import ScoreRepository
+from client.views.text_cache import TEXT_CACHE
 
 
 class HighScoresScene(Scene):
@@ -17,12 +18,13 @@ class HighScoresScene(Scene):
     - επιστρέφει στο main menu με το πλήκτρο ESC
     """
 
-    def __init__(self, scene_manager):
+    def __init__(self, scene_manager, repo=None):
         # Αναφορά στον SceneManager για αλλαγή σκηνών
         self.sm = scene_manager
 
         # Repository για πρόσβαση στη βάση δεδομένων scores
-        self.repo = ScoreRepository()
+        # (κοινό με τις άλλες σκηνές, αν δοθεί από το GameApp)
+        self.repo = repo if repo is not None else ScoreRepository()
 
         # Αποθήκευση του τελευταίου InputSnapshot
         self._input = None
@@ -56,6 +58,16 @@ class HighScoresScene(Scene):
             os.path.join(fonts_dir, "Orbitron-Bold.ttf"), 22
         )
 
+        # -------------------------
+        # Cache
+        # -------------------------
+        # Κατάταξη όπως φορτώθηκε στο enter
+        self._scores = ()
+
+        # Έτοιμη εικόνα ολόκληρης της σκηνής
+        # (background + τίτλος + πίνακας), φτιάχνεται μία φορά
+        self._table = None
+
     # ==================================================
     # REQUIRED by abstract Scene
     # ==================================================
@@ -63,9 +75,11 @@ class HighScoresScene(Scene):
     def enter(self, payload=None):
         """
         Καλείται όταν η σκηνή ενεργοποιείται.
-        Δεν απαιτείται αρχικοποίηση κατά την είσοδο.
+        Φορτώνει την κατάταξη (από το cache του repository)
+        μία φορά, αντί για ερώτημα στη βάση σε κάθε frame.
         """
-        pass
+        self._scores = self.repo.leaderboard()
+        self._table = None
 
     def exit(self):
         """
@@ -89,11 +103,35 @@ class HighScoresScene(Scene):
         if self._input and self._input.pause:
             self.sm.set_scene("menu", {})
 
+    def desired_fps(self):
+        """
+        Ο πίνακας δεν κινείται, οπότε αρκούν 10 fps.
+        """
+        return 10
+
+    def render_state(self):
+        """
+        Ο πίνακας δεν αλλάζει όσο είναι ανοιχτή η σκηνή.
+        """
+        return ()
+
     def render(self, surface):
         """
         Σχεδίαση της σκηνής High Scores.
         """
 
+        if self._table is None or self._table.get_size() != surface.get_size():
+            self._table = self._build_table(surface.get_size())
+
+        surface.blit(self._table, (0, 0))
+
+    def _build_table(self, size):
+        """
+        Σχεδιάζει μία φορά ολόκληρη τη σκηνή σε ένα Surface.
+        """
+
+        surface = pygame.Surface(size).convert()
+
         # -------------------------
         # Background
         # -------------------------
@@ -104,7 +142,7 @@ class HighScoresScene(Scene):
         # -------------------------
         # Τίτλος
         # -------------------------
-        title = self.font_title.render("HIGH SCORES", True, (255, 255, 255))
+        title = TEXT_CACHE.render(self.font_title, "HIGH SCORES", (255, 255, 255))
 
         # Το +160 χρησιμοποιείται για να ευθυγραμμιστεί
         # οπτικά με το layout του main menu
@@ -114,9 +152,9 @@ class HighScoresScene(Scene):
         )
 
         # -------------------------
-        # Ανάκτηση scores από τη βάση
+        # Scores (φορτώθηκαν στο enter)
         # -------------------------
-        scores = self.repo.top_10()
+        scores = self._scores
 
         # -------------------------
         # Εμφάνιση λίστας
@@ -128,7 +166,7 @@ class HighScoresScene(Scene):
             # θέση, όνομα παιχνιδιού, ημερομηνία, ώρα, σκορ
             line = f"{i:>2}. {name:<6} {date} {time}   {score:>6}"
 
-            txt = self.font.render(line, True, (230, 230, 230))
+            txt = TEXT_CACHE.render(self.font, line, (230, 230, 230))
 
             surface.blit(
                 txt,
@@ -137,3 +175,5 @@ class HighScoresScene(Scene):
 
             # Μετακίνηση στην επόμενη γραμμή
             y += 32
+
+        return surface
@@ -1,6 +1,7 @@
 import pygame
 import os
 from shared.core.scene import Scene
+from client.views.text_cache import TEXT_CACHE
 
 
 class HowToPlayScene(Scene):
@@ -109,6 +110,18 @@ class HowToPlayScene(Scene):
     # Render
     # ===============================
 
+    def desired_fps(self):
+        """
+        Μόνο κείμενο: 10 fps είναι αρκετά.
+        """
+        return 10
+
+    def render_state(self):
+        """
+        Στατικό κείμενο: σχεδιάζεται μία φορά.
+        """
+        return ()
+
     def render(self, surface):
         """
         Σχεδίαση της σκηνής οδηγιών.
@@ -123,7 +136,7 @@ class HowToPlayScene(Scene):
         # Τίτλος
         # -------------------------
         title = "HOW TO PLAY"
-        title_surf = self.font_title.render(title, True, (255, 255, 255))
+        title_surf = TEXT_CACHE.render(self.font_title, title, (255, 255, 255))
         surface.blit(
             title_surf,
             (w // 2 - title_surf.get_width() // 2, 60)
@@ -165,7 +178,7 @@ class HowToPlayScene(Scene):
 
         # Σχεδίαση κάθε γραμμής
         for line in text_lines:
-            surf = self.font.render(line, True, (230, 230, 230))
+            surf = TEXT_CACHE.render(self.font, line, (230, 230, 230))
             surface.blit(
                 surf,
                 (w // 2 - surf.get_width() // 2, y)
@@ -4,6 +4,7 @@ import os
 from shared.core.scene import Scene, SceneManager
 from shared.services.input import InputSnapshot
 from shared.services.audio_manager import AudioManager
+from client.views.text_cache import TEXT_CACHE
 
 
 class MainMenuScene(Scene):
@@ -46,12 +47,30 @@ class MainMenuScene(Scene):
         # Δείκτης τρέχουσας επιλογής
         self.selected = 0
 
+        # Επιλογή που φαίνεται αυτή τη στιγμή στην οθόνη
+        # (None = δεν έχει σχεδιαστεί ακόμα)
+        self._drawn_selected = None
+
         # -------------------------
         # Fonts
         # -------------------------
-        self._font_title = None
-        self._font_item = None
-        self._font_hint = None
+        # Φορτώνονται μία φορά: το TEXT_CACHE έχει κλειδί το Font,
+        # οπότε νέα Font σε κάθε enter() θα άδειαζαν στην ουσία το cache
+        fonts_dir = os.path.join(
+            os.path.dirname(__file__), "..", "..", "assets", "fonts"
+        )
+
+        self._font_title = pygame.font.Font(
+            os.path.join(fonts_dir, "Orbitron-Bold.ttf"), 64
+        )
+
+        self._font_item = pygame.font.Font(
+            os.path.join(fonts_dir, "Orbitron-Bold.ttf"), 30
+        )
+
+        self._font_hint = pygame.font.Font(
+            os.path.join(fonts_dir, "Orbitron-Bold.ttf"), 18
+        )
 
         # Background εικόνα
         self._bg = None
@@ -71,7 +90,6 @@ class MainMenuScene(Scene):
         Καλείται όταν η σκηνή ενεργοποιείται.
 
         Φορτώνει:
-        - γραμματοσειρές
         - background
         - αρχικοποιεί δείκτες και timers
         """
@@ -79,23 +97,6 @@ class MainMenuScene(Scene):
         base_dir = os.path.dirname(__file__)
         assets_dir = os.path.join(base_dir, "..", "..", "assets")
 
-        # -------------------------
-        # Fonts
-        # -------------------------
-        fonts_dir = os.path.join(assets_dir, "fonts")
-
-        self._font_title = pygame.font.Font(
-            os.path.join(fonts_dir, "Orbitron-Bold.ttf"), 64
-        )
-
-        self._font_item = pygame.font.Font(
-            os.path.join(fonts_dir, "Orbitron-Bold.ttf"), 30
-        )
-
-        self._font_hint = pygame.font.Font(
-            os.path.join(fonts_dir, "Orbitron-Bold.ttf"), 18
-        )
-
         # -------------------------
         # Background
         # -------------------------
@@ -108,6 +109,7 @@ class MainMenuScene(Scene):
 
         # Reset κατάστασης
         self.selected = 0
+        self._drawn_selected = None
         self._nav_cooldown = 0.0
         self._confirm_cooldown = 0.0
 
@@ -199,9 +201,24 @@ class MainMenuScene(Scene):
     # Render
     # ==================================================
 
-    def render(self, surface) -> None:
+    def desired_fps(self):
+        """
+        Το μενού δεν έχει κίνηση: όσο δεν πατιέται πλήκτρο αρκούν 10 fps.
+        """
+        return 10
+
+    def render_state(self):
+        """
+        Το μενού αλλάζει μόνο όταν αλλάξει η επιλογή.
+        """
+        return self.selected, self.title
+
+    def render(self, surface):
         """
         Σχεδίαση γραφικών του main menu.
+
+        Αν άλλαξε μόνο η επιλογή, επιστρέφει τις δύο γραμμές
+        του μενού που άλλαξαν (η υπόλοιπη οθόνη μένει ίδια).
         """
 
         w, h = surface.get_width(), surface.get_height()
@@ -229,26 +246,42 @@ class MainMenuScene(Scene):
         line_h = 48
         menu_x = int(w * 0.28)
 
+        # Rect κάθε γραμμής (για ενημέρωση μόνο όσων άλλαξαν)
+        rows = []
+
         for i, (text, _) in enumerate(self.items):
             y = start_y + i * line_h
 
             if i == self.selected:
-                self._draw_glow_text(surface, text, self._font_item, menu_x, y)
+                rect = self._draw_glow_text(surface, text, self._font_item, menu_x, y)
             else:
-                item = self._font_item.render(text, True, (220, 220, 220))
+                item = TEXT_CACHE.render(self._font_item, text, (220, 220, 220))
                 rect = item.get_rect(center=(menu_x, y))
                 surface.blit(item, rect)
 
+            rows.append(rect)
+
         # -------------------------
         # Hint
         # -------------------------
         hint = "UP / DOWN to navigate • SPACE to select"
-        hint_surf = self._font_hint.render(hint, True, (160, 160, 160))
+        hint_surf = TEXT_CACHE.render(self._font_hint, hint, (160, 160, 160))
         surface.blit(
             hint_surf,
             (w // 2 - hint_surf.get_width() // 2, h - 50),
         )
 
+        # -------------------------
+        # Τι άλλαξε στην οθόνη
+        # -------------------------
+        previous = self._drawn_selected
+        self._drawn_selected = self.selected
+
+        if previous is not None and previous != self.selected:
+            return [rows[previous], rows[self.selected]]
+
+        return None
+
     # ==================================================
     # Glow effect
     # ==================================================
@@ -256,6 +289,7 @@ class MainMenuScene(Scene):
     def _draw_glow_text(self, surface, text, font, cx, cy):
         """
         Δημιουργεί glow effect για επιλεγμένο κείμενο.
+        Επιστρέφει το Rect του κειμένου.
         """
 
         glow_color = (255, 180, 80)
@@ -263,12 +297,13 @@ class MainMenuScene(Scene):
 
         # Επικάλυψη glow layers
         for alpha in (50, 35, 20):
-            glow = font.render(text, True, glow_color)
-            glow.set_alpha(alpha)
+            glow = TEXT_CACHE.render(font, text, glow_color, alpha=alpha)
             rect = glow.get_rect(center=(cx, cy))
             surface.blit(glow, rect)
 
         # Κεντρικό κείμενο
-        main = font.render(text, True, main_color)
+        main = TEXT_CACHE.render(font, text, main_color)
         rect = main.get_rect(center=(cx, cy))
         surface.blit(main, rect)
+
+        return rect
@@ -4,6 +4,7 @@ import os
 from shared.core.scene import Scene, SceneManager
 from shared.services.input import InputSnapshot
 from shared.services.audio_manager import AudioManager
+from client.views.text_cache import TEXT_CACHE
 
 
 class SettingsScene(Scene):
@@ -36,11 +37,27 @@ class SettingsScene(Scene):
         # Δείκτης επιλεγμένου στοιχείου
         self.selected = 0
 
+        # Επιλογή που φαίνεται αυτή τη στιγμή στην οθόνη
+        # (None = δεν έχει σχεδιαστεί ακόμα)
+        self._drawn_selected = None
+
         # -------------------------
         # Πόροι γραφικών
         # -------------------------
-        self._font_item = None
-        self._font_hint = None
+        # Fonts (ίδιες με main menu), φορτώνονται μία φορά ώστε
+        # τα κλειδιά του TEXT_CACHE να μένουν ίδια σε κάθε enter()
+        fonts_dir = os.path.join(
+            os.path.dirname(__file__), "..", "..", "assets", "fonts"
+        )
+
+        self._font_item = pygame.font.Font(
+            os.path.join(fonts_dir, "Orbitron-Bold.ttf"), 30
+        )
+
+        self._font_hint = pygame.font.Font(
+            os.path.join(fonts_dir, "Orbitron-Bold.ttf"), 18
+        )
+
         self._bg = None
 
         # -------------------------
@@ -60,7 +77,6 @@ class SettingsScene(Scene):
         Καλείται όταν η σκηνή γίνεται ενεργή.
 
         Φορτώνει:
-        - γραμματοσειρές
         - background
         - αρχικοποιεί επιλογές και timers
         """
@@ -69,19 +85,6 @@ class SettingsScene(Scene):
         base_dir = os.path.dirname(__file__)
         assets_dir = os.path.join(base_dir, "..", "..", "assets")
 
-        # -------------------------
-        # Fonts (ίδιες με main menu)
-        # -------------------------
-        fonts_dir = os.path.join(assets_dir, "fonts")
-
-        self._font_item = pygame.font.Font(
-            os.path.join(fonts_dir, "Orbitron-Bold.ttf"), 30
-        )
-
-        self._font_hint = pygame.font.Font(
-            os.path.join(fonts_dir, "Orbitron-Bold.ttf"), 18
-        )
-
         # -------------------------
         # Background εικόνα
         # -------------------------
@@ -96,6 +99,7 @@ class SettingsScene(Scene):
         # Reset κατάστασης
         # -------------------------
         self.selected = 0
+        self._drawn_selected = None
         self._nav_cooldown = 0.0
         self._confirm_cooldown = 0.0
         self._back_cooldown = 0.25
@@ -179,12 +183,26 @@ class SettingsScene(Scene):
     # Render
     # ==================================================
 
-    def render(self, surface) -> None:
+    def desired_fps(self):
+        """
+        Ίδιος ρυθμός με το main menu όταν δεν υπάρχει input.
+        """
+        return 10
+
+    def render_state(self):
+        """
+        Η σκηνή αλλάζει μόνο όταν αλλάξει η επιλογή.
+        """
+        return self.selected
+
+    def render(self, surface):
         """
         Σχεδίαση της σκηνής:
         - background
         - επιλογές
         - hint στο κάτω μέρος
+
+        Αν άλλαξε μόνο η επιλογή, επιστρέφει τις δύο γραμμές που άλλαξαν.
         """
 
         w, h = surface.get_width(), surface.get_height()
@@ -201,26 +219,38 @@ class SettingsScene(Scene):
         line_h = 52
         cx = w // 2
 
+        rows = []
+
         for i, (text, _) in enumerate(self.items):
             y = start_y + i * line_h
 
             if i == self.selected:
-                self._draw_glow_text(surface, text, self._font_item, cx, y)
+                rect = self._draw_glow_text(surface, text, self._font_item, cx, y)
             else:
-                item = self._font_item.render(text, True, (220, 220, 220))
+                item = TEXT_CACHE.render(self._font_item, text, (220, 220, 220))
                 rect = item.get_rect(center=(cx, y))
                 surface.blit(item, rect)
 
+            rows.append(rect)
+
         # -------------------------
         # Hint
         # -------------------------
         hint = "UP / DOWN to navigate • SPACE to select • ESC to return"
-        hint_surf = self._font_hint.render(hint, True, (160, 160, 160))
+        hint_surf = TEXT_CACHE.render(self._font_hint, hint, (160, 160, 160))
         surface.blit(
             hint_surf,
             (w // 2 - hint_surf.get_width() // 2, h - 60),
         )
 
+        previous = self._drawn_selected
+        self._drawn_selected = self.selected
+
+        if previous is not None and previous != self.selected:
+            return [rows[previous], rows[self.selected]]
+
+        return None
+
     # ==================================================
     # Glow effect
     # ==================================================
@@ -228,6 +258,7 @@ class SettingsScene(Scene):
     def _draw_glow_text(self, surface, text, font, cx, cy):
         """
         Βοηθητική μέθοδος για glow effect στο επιλεγμένο item.
+        Επιστρέφει το Rect του κειμένου.
         """
 
         glow_color = (255, 180, 80)
@@ -235,12 +266,13 @@ class SettingsScene(Scene):
 
         # Πολλαπλά layers glow με διαφορετική διαφάνεια
         for alpha in (50, 35, 20):
-            glow = font.render(text, True, glow_color)
-            glow.set_alpha(alpha)
+            glow = TEXT_CACHE.render(font, text, glow_color, alpha=alpha)
             rect = glow.get_rect(center=(cx, cy))
             surface.blit(glow, rect)
 
         # Κεντρικό κείμενο
-        main = font.render(text, True, main_color)
+        main = TEXT_CACHE.render(font, text, main_color)
         rect = main.get_rect(center=(cx, cy))
         surface.blit(main, rect)
+
+        return rect
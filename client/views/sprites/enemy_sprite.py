@@ -70,13 +70,11 @@ class EnemySprite:
     # ==================================================
     # Σχεδίαση enemy
     # ==================================================
-    def draw(self, surface, enemy, sx, sy):
+    def image_for(self, enemy):
         """
-        Σχεδιάζει τον enemy στην οθόνη.
+        Επιστρέφει το sprite του enemy (μορφή + κατεύθυνση).
 
-        surface : pygame Surface (οθόνη ή υπο-οθόνη)
-        enemy   : αντικείμενο Enemy (μοντέλο παιχνιδιού)
-        sx, sy  : συντεταγμένες οθόνης (screen coordinates)
+        enemy : αντικείμενο Enemy (μοντέλο παιχνιδιού)
         """
 
         # Χρησιμοποιούμε το id(enemy) ώστε να ξεχωρίζουμε
@@ -126,7 +124,15 @@ class EnemySprite:
                 else self.nobbin_right
             )
 
-        # --------------------------------------------------
-        # Σχεδίαση sprite στην οθόνη
-        # --------------------------------------------------
-        surface.blit(sprite, (sx, sy))
+        return sprite
+
+    def draw(self, surface, enemy, sx, sy):
+        """
+        Σχεδιάζει τον enemy στην οθόνη.
+
+        surface : pygame Surface (οθόνη ή υπο-οθόνη)
+        enemy   : αντικείμενο Enemy (μοντέλο παιχνιδιού)
+        sx, sy  : συντεταγμένες οθόνης (screen coordinates)
+        """
+
+        surface.blit(self.image_for(enemy), (sx, sy))
@@ -51,13 +51,12 @@ class GoldBagSprite:
             os.path.join(assets_dir, "gold_pile.png")
         ).convert_alpha()
 
-    def draw(self, surface, bag, sx, sy):
+    def image_for(self, bag):
         """
-        Σχεδιάζει το gold bag στην οθόνη.
+        Επιστρέφει την εικόνα του gold bag ανάλογα με την κατάστασή του
+        (ή None αν έχει συλλεχθεί και δεν σχεδιάζεται).
 
-        surface : pygame Surface (οθόνη ή υπο-οθόνη)
-        bag     : αντικείμενο GoldBag (κατάσταση gameplay)
-        sx, sy  : συντεταγμένες οθόνης (screen coordinates)
+        bag : αντικείμενο GoldBag (κατάσταση gameplay)
         """
 
         # --------------------------------------------------
@@ -65,25 +64,36 @@ class GoldBagSprite:
         # δεν σχεδιάζεται τίποτα
         # --------------------------------------------------
         if bag.collected:
-            return
+            return None
 
         # --------------------------------------------------
         # Αν έχει μετατραπεί σε gold pile,
-        # σχεδιάζουμε την εικόνα του χρυσού
+        # επιστρέφουμε την εικόνα του χρυσού
         # --------------------------------------------------
         if bag.is_gold:
-            surface.blit(self.gold_image, (sx, sy))
-            return
+            return self.gold_image
 
         # --------------------------------------------------
         # Αν βρίσκεται σε πτώση,
-        # σχεδιάζουμε το falling sprite
+        # επιστρέφουμε το falling sprite
         # --------------------------------------------------
         if bag.falling:
-            surface.blit(self.falling_image, (sx, sy))
-            return
+            return self.falling_image
 
         # --------------------------------------------------
-        # Διαφορετικά, σχεδιάζουμε τον κανονικό σάκο
+        # Διαφορετικά, τον κανονικό σάκο
         # --------------------------------------------------
-        surface.blit(self.bag_image, (sx, sy))
+        return self.bag_image
+
+    def draw(self, surface, bag, sx, sy):
+        """
+        Σχεδιάζει το gold bag στην οθόνη.
+
+        surface : pygame Surface (οθόνη ή υπο-οθόνη)
+        bag     : αντικείμενο GoldBag (κατάσταση gameplay)
+        sx, sy  : συντεταγμένες οθόνης (screen coordinates)
+        """
+
+        image = self.image_for(bag)
+        if image is not None:
+            surface.blit(image, (sx, sy))
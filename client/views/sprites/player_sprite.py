@@ -41,15 +41,21 @@ class PlayerSprite:
             self.base_image, (self.SIZE, self.SIZE)
         )
 
-    def draw(self, surface, x, y, direction):
+        # Έτοιμα sprites ανά κατεύθυνση (γεμίζει στην image_for)
+        self._images = {}
+
+    def image_for(self, direction):
         """
-        Σχεδιάζει το sprite του παίκτη στην οθόνη.
+        Επιστρέφει το sprite του παίκτη για την κατεύθυνση που κοιτάει.
 
-        surface   : pygame Surface (οθόνη ή υπο-οθόνη)
-        x, y      : συντεταγμένες οθόνης (screen coordinates)
-        direction : κατεύθυνση που κοιτάει ο παίκτης
+        Οι μετασχηματισμοί (flip / rotate) γίνονται μία φορά ανά
+        κατεύθυνση και κρατιούνται, όχι σε κάθε frame.
         """
 
+        image = self._images.get(direction)
+        if image is not None:
+            return image
+
         # Από προεπιλογή χρησιμοποιούμε το βασικό sprite
         image = self.base_image
 
@@ -69,11 +75,20 @@ class PlayerSprite:
         elif direction == Direction.DOWN:
             image = pygame.transform.rotate(self.base_image, -90)
 
-        # Direction.RIGHT:
+        # Direction.RIGHT (ή None):
         # Δεν χρειάζεται καμία αλλαγή, γιατί το sprite
         # έχει σχεδιαστεί αρχικά προς τα δεξιά
 
-        # --------------------------------------------------
-        # Τελική σχεδίαση του sprite στην οθόνη
-        # --------------------------------------------------
-        surface.blit(image, (x, y))
+        self._images[direction] = image
+        return image
+
+    def draw(self, surface, x, y, direction):
+        """
+        Σχεδιάζει το sprite του παίκτη στην οθόνη.
+
+        surface   : pygame Surface (οθόνη ή υπο-οθόνη)
+        x, y      : συντεταγμένες οθόνης (screen coordinates)
+        direction : κατεύθυνση που κοιτάει ο παίκτης
+        """
+
+        surface.blit(self.image_for(direction), (x, y))
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    Cache έτοιμων surfaces κειμένου.
+
+    Το font.render() κάνει rasterization του κειμένου κάθε φορά που
+    καλείται. Στο HUD και στα μενού το ίδιο κείμενο σχεδιάζεται σε
+    κάθε frame, οπότε κρατάμε το αποτέλεσμα με κλειδί
+    (font, κείμενο, χρώμα, alpha) και το ξαναφτιάχνουμε μόνο όταν
+    αλλάξει το περιεχόμενο.
+
+    Όταν γεμίσει, πετιέται το κείμενο που χρησιμοποιήθηκε
+    λιγότερο πρόσφατα (LRU).
+
+    Τα surfaces ανήκουν στο cache: δεν πρέπει να τροποποιούνται
+    (π.χ. με set_alpha) από όποιον τα παίρνει.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+
+        # (font, text, color, antialias, alpha) -> Surface
+        self._entries = OrderedDict()
+
+    def render(self, font, text, color, antialias=True, alpha=None):
+        """
+        Ίδιο με font.render(text, antialias, color), αλλά από το cache.
+
+        alpha : διαφάνεια ολόκληρου του surface (set_alpha) ή None
+        """
+
+        key = (font, text, color, antialias, alpha)
+
+        entries = self._entries
+        surf = entries.get(key)
+
+        if surf is not None:
+            entries.move_to_end(key)
+            return surf
+
+        surf = font.render(text, antialias, color)
+        if alpha is not None:
+            surf.set_alpha(alpha)
+
+        entries[key] = surf
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+        return surf
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Κοινό cache για όλες τις σκηνές
+TEXT_CACHE = TextCache()
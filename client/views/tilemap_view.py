@@ -16,6 +16,17 @@ class TilemapView:
     - διαβάζει τα tiles του Level
     - τα μετατρέπει σε εικόνες
     - τα σχεδιάζει στην οθόνη με βάση την κάμερα
+
+    Για απόδοση, ολόκληρος ο χάρτης προ-σχεδιάζεται ΜΙΑ φορά
+    ανά Level σε ένα μεγάλο Surface (world surface).
+    Στη συνέχεια ξανασχεδιάζονται μόνο τα tiles που άλλαξαν
+    (μέσω των ειδοποιήσεων του Level.set_tile), και σε κάθε frame
+    γίνεται ένα μόνο blit του παραθύρου της κάμερας.
+
+    Εικόνες που ανήκουν σε tile (π.χ. emerald) δηλώνονται με
+    set_overlay() και σχεδιάζονται κι αυτές στο world surface.
+    Έτσι το ίδιο έτοιμο surface μοιράζεται σε όλες τις κάμερες
+    (π.χ. split screen) και κανένα view δεν τις ξανασχεδιάζει.
     """
 
     def __init__(self, tile_size: int):
@@ -52,63 +63,172 @@ class TilemapView:
         self.black_tile = pygame.Surface((tile_size, tile_size))
         self.black_tile.fill((0, 0, 0))
 
-    def render(self, surface, level, camera):
+        # --------------------------------------------------
+        # Cache προ-σχεδιασμένου κόσμου
+        # --------------------------------------------------
+
+        # Το Level για το οποίο έχει χτιστεί το cache
+        self._level = None
+
+        # Surface με ΟΛΟ το tilemap σε world συντεταγμένες
+        self._world = None
+
+        # Tiles που άλλαξαν από το τελευταίο render
+        # και πρέπει να ξανασχεδιαστούν στο world surface
+        self._dirty = set()
+
+        # Κλιμακωμένο μπλε background (ανά μέγεθος επιφάνειας)
+        self._bg_scaled = None
+
+        # TileType -> εικόνα που σχεδιάζεται πάνω από το tile
+        self._overlays = {}
+
+    def set_overlay(self, tile, image):
+        """
+        Δηλώνει εικόνα που σχεδιάζεται πάνω από κάθε tile τύπου tile
+        (π.χ. TileType.EMERALD → emerald sprite) μέσα στο world surface.
         """
-        Σχεδιάζει ΟΛΟ το tilemap στην οθόνη.
 
-        surface : pygame Surface (η οθόνη ή υπο-οθόνη)
-        level   : αντικείμενο Level (δεδομένα map)
-        camera  : Camera2D (μετατροπή world → screen)
+        self._overlays[tile] = image
+
+        # Αν υπάρχει ήδη cache, ξαναχτίζεται με την εικόνα
+        if self._level is not None:
+            self._bind(self._level)
+
+    # ==================================================
+    # Cache διαχείριση
+    # ==================================================
+
+    def _bind(self, level):
+        """
+        Χτίζει από την αρχή το world surface για ένα νέο Level
+        και εγγράφεται στις αλλαγές tiles του.
+        """
+
+        # Αποσύνδεση από το προηγούμενο Level (αν υπάρχει)
+        if self._level is not None:
+            self._level.remove_listener(self._on_tile_changed)
+
+        self._level = level
+        level.add_listener(self._on_tile_changed)
+
+        # Δημιουργία surface μεγέθους ολόκληρου του χάρτη
+        self._world = pygame.Surface(
+            (level.width * self.tile_size, level.height * self.tile_size)
+        ).convert()
+
+        # Πλήρες σχέδιο του χάρτη (μόνο μία φορά ανά Level)
+        for y in range(level.height):
+            for x in range(level.width):
+                self._draw_tile(x, y, level.get_tile(x, y))
+
+        self._dirty.clear()
+
+    def _on_tile_changed(self, x, y, old_tile, new_tile):
+        """
+        Listener του Level: σημειώνει το tile ως "βρώμικο".
+        Το πραγματικό σχέδιο γίνεται στο επόμενο render().
+        """
+        self._dirty.add((x, y))
+
+    def _draw_tile(self, x, y, tile):
+        """
+        Σχεδιάζει ένα μόνο tile πάνω στο world surface.
+        """
+
+        # TUNNEL → μαύρο πλακίδιο
+        if tile == TileType.TUNNEL:
+            image = self.black_tile
+
+        # Πάνω σειρά του map → grass
+        elif y == 0:
+            image = self.grass_tile
+
+        # Όλα τα υπόλοιπα tiles → dirt
+        else:
+            image = self.dirt_tile
+
+        pos = (x * self.tile_size, y * self.tile_size)
+        self._world.blit(image, pos)
+
+        # Εικόνα πάνω από το tile (π.χ. emerald)
+        overlay = self._overlays.get(tile)
+        if overlay is not None:
+            self._world.blit(overlay, pos)
+
+    def _background(self, size):
         """
+        Επιστρέφει το μπλε background κλιμακωμένο στο δοσμένο μέγεθος.
+        Η κλιμάκωση γίνεται μόνο όταν αλλάξει το μέγεθος.
+        """
+
+        if self._bg_scaled is None or self._bg_scaled.get_size() != size:
+            self._bg_scaled = pygame.transform.scale(self.blue_bg, size)
 
-        # Αριθμός γραμμών και στηλών του map
-        rows = level.height
-        cols = level.width
+        return self._bg_scaled
+
+    # ==================================================
+    # Render
+    # ==================================================
+
+    def draw_commands(self, level, camera, view_size):
+        """
+        Επιστρέφει τις εγγραφές blits (image, θέση[, area]) του tilemap
+        για ένα view μεγέθους view_size (π.χ. για το layer "tiles"
+        του RenderQueue).
+
+        level     : αντικείμενο Level (δεδομένα map)
+        camera    : Camera2D (μετατροπή world → screen)
+        view_size : (πλάτος, ύψος) της επιφάνειας σχεδίασης
+        """
 
         # --------------------------------------------------
-        # Γέμισμα background εκτός map με μπλε χρώμα
+        # Νέο Level → πλήρες χτίσιμο cache
         # --------------------------------------------------
-        surface.blit(
-            pygame.transform.scale(self.blue_bg, surface.get_size()),
-            (0, 0),
-        )
+        if level is not self._level:
+            self._bind(level)
 
         # --------------------------------------------------
-        # Διπλός βρόχος: traversal όλων των tiles
+        # Ξανασχεδιάζουμε ΜΟΝΟ τα tiles που άλλαξαν
+        # --------------------------------------------------
+        if self._dirty:
+            for x, y in self._dirty:
+                self._draw_tile(x, y, level.get_tile(x, y))
+            self._dirty.clear()
+
+        view_w, view_h = view_size
+
         # --------------------------------------------------
-        for y in range(rows):
-            for x in range(cols):
-                # Τύπος πλακιδίου από το Level
-                tile = level.tiles[y][x]
-
-                # Συντεταγμένες στον κόσμο (world coordinates)
-                world_x = x * self.tile_size
-                world_y = y * self.tile_size
-
-                # Μετατροπή world → screen μέσω κάμερας
-                sx, sy = camera.world_to_screen(world_x, world_y)
-
-                # --------------------------------------------------
-                # Απόρριψη πλακιδίων εκτός οθόνης
-                # --------------------------------------------------
-                if sx + self.tile_size < 0 or sy + self.tile_size < 0:
-                    continue
-
-                # --------------------------------------------------
-                # TUNNEL → μαύρο πλακίδιο
-                # --------------------------------------------------
-                if tile == TileType.TUNNEL:
-                    surface.blit(self.black_tile, (sx, sy))
-                    continue
-
-                # --------------------------------------------------
-                # Πάνω σειρά του map → grass
-                # --------------------------------------------------
-                if y == 0:
-                    surface.blit(self.grass_tile, (sx, sy))
-                    continue
-
-                # --------------------------------------------------
-                # Όλα τα υπόλοιπα tiles → dirt
-                # --------------------------------------------------
-                surface.blit(self.dirt_tile, (sx, sy))
+        # Μόνο τα ορατά tiles της κάμερας
+        # --------------------------------------------------
+        # Ένα blit με area = το ορατό ορθογώνιο tiles του χάρτη
+        x0, y0, x1, y1 = camera.visible_tile_rect(level.width, level.height)
+        if x0 >= x1 or y0 >= y1:
+            return [(self._background(view_size), (0, 0))]
+
+        ts = self.tile_size
+        area = pygame.Rect(x0 * ts, y0 * ts, (x1 - x0) * ts, (y1 - y0) * ts)
+        sx, sy = camera.world_to_screen(area.x, area.y)
+
+        commands = [(self._world, (sx, sy), area)]
+
+        # Γέμισμα background εκτός map με μπλε χρώμα
+        # (μόνο αν ο χάρτης δεν καλύπτει όλο το view)
+        if sx > 0 or sy > 0 or sx + area.w < view_w or sy + area.h < view_h:
+            commands.insert(0, (self._background(view_size), (0, 0)))
+
+        return commands
+
+    def render(self, surface, level, camera):
+        """
+        Σχεδιάζει το tilemap στην οθόνη.
+
+        surface : pygame Surface (η οθόνη ή υπο-οθόνη)
+        level   : αντικείμενο Level (δεδομένα map)
+        camera  : Camera2D (μετατροπή world → screen)
+        """
+
+        surface.blits(
+            self.draw_commands(level, camera, surface.get_size()),
+            doreturn=False,
+        )
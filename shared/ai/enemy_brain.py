@@ -1,5 +1,7 @@
-from collections import deque
-from shared.model.types import Direction, TileType, MonsterForm, GameMode
+from shared.model.types import Direction, GameMode
+from shared.ai.flow_field import FlowFieldCache
+from shared.ai.path_cache import PathCache
+from shared.ai.search import BfsSearch, make_strategy
 
 
 # Λεξικό που μετατρέπει μια κατεύθυνση σε μεταβολή συντεταγμένων (dx, dy)
@@ -22,8 +24,58 @@ class EnemyBrain:
     Η συμπεριφορά εξαρτάται από:
     - τη μορφή του εχθρού (Nobbin / Hobbin)
     - την κατάσταση του παιχνιδιού (Normal / Bonus)
+
+    Προαιρετικά (use_flow_field=True) χρησιμοποιεί κοινόχρηστα
+    flow fields: ένα BFS ανά παίκτη και μορφή εχθρού, από το οποίο
+    ΟΛΟΙ οι εχθροί διαβάζουν το επόμενο βήμα τους σε O(1).
+    Σε μεγάλους χάρτες τα fields υπολογίζονται με NumPy (αν υπάρχει).
+
+    Οι διαδρομές του κλασικού BFS κρατιούνται σε PathCache και
+    ξαναχρησιμοποιούνται μέχρι να αλλάξει κάποιο tile πάνω ή δίπλα
+    στη διαδρομή ή να μετακινηθεί ο στόχος.
+
+    Η αναζήτηση ανά εχθρό γίνεται από μια αλλάξιμη στρατηγική
+    (BFS, A*, bidirectional BFS) με προαιρετικό όριο επεκτάσεων
+    κόμβων, ώστε το κόστος AI ανά tick να είναι φραγμένο.
     """
 
+    def __init__(
+        self,
+        use_flow_field: bool = False,
+        use_path_cache: bool = True,
+        strategy=None,
+        flow_backend: str = "auto",
+    ):
+        # Backend των flow fields ("auto" / "python" / "numpy")
+        self.flow_backend = flow_backend
+
+        # Κοινόχρηστα flow fields (None = αναζήτηση ανά εχθρό)
+        self.flow_fields = FlowFieldCache(flow_backend) if use_flow_field else None
+
+        # Cache ΠΛΗΡΩΝ διαδρομών (None = χωρίς cache)
+        self.path_cache = PathCache() if use_path_cache else None
+
+        # Στρατηγική αναζήτησης (προεπιλογή: BFS χωρίς όριο)
+        self.strategy = strategy if strategy is not None else BfsSearch()
+
+    def configure(self, strategy_name: str, max_expansions=None):
+        """
+        Επιλέγει τρόπο εύρεσης διαδρομής (π.χ. ανά πίστα από το DifficultyScaler).
+
+        strategy_name:
+        - "flow"                          : κοινόχρηστα flow fields
+        - "bfs" / "astar" / "bidirectional": αναζήτηση ανά εχθρό
+        max_expansions : όριο επεκτάσεων κόμβων (None = χωρίς όριο)
+        """
+
+        if strategy_name == "flow":
+            if self.flow_fields is None:
+                self.flow_fields = FlowFieldCache(self.flow_backend)
+            return
+
+        self.flow_fields = None
+        self.strategy = make_strategy(strategy_name, max_expansions)
+
     def decide(self, enemy, player, level, game_mode):
         """
         Αποφασίζει προς ποια κατεύθυνση θα κινηθεί ο εχθρός στο επόμενο βήμα.
@@ -52,84 +104,45 @@ class EnemyBrain:
             # Κανονικό mode: στόχος είναι η θέση του παίκτη
             goal = (player.tile_x, player.tile_y)
 
-        # =========================
-        # BFS ΑΝΑΖΗΤΗΣΗ ΔΙΑΔΡΟΜΗΣ
-        # =========================
-
-        # Ουρά BFS (First In – First Out)
-        queue = deque([start])
-
-        # Λεξικό που κρατά από ποιο tile ήρθαμε σε κάθε tile
-        # Χρησιμοποιείται για ανακατασκευή της διαδρομής
-        came_from = {start: None}
-
-        # Όσο υπάρχουν κόμβοι προς εξερεύνηση
-        while queue:
-            cx, cy = queue.popleft()
-
-            # Αν φτάσαμε στο στόχο, σταματάμε
-            if (cx, cy) == goal:
-                break
-
-            # Εξερεύνηση γειτονικών tiles
-            for direction, (dx, dy) in DIRS.items():
-                nx, ny = cx + dx, cy + dy
-
-                # Έλεγχος ορίων πίστας
-                if not level.in_bounds(nx, ny):
-                    continue
-
-                # Τύπος πλακιδίου
-                tile = level.get_tile(nx, ny)
-
-                # =========================
-                # ΚΑΝΟΝΕΣ ΚΙΝΗΣΗΣ ΑΝΑ ΜΟΡΦΗ
-                # =========================
-
-                # Nobbin: κινείται ΜΟΝΟ σε tunnels
-                if enemy.form == MonsterForm.NOBBIN:
-                    if tile != TileType.TUNNEL:
-                        continue
-
-                # Hobbin: μπορεί να σκάβει
-                elif enemy.form == MonsterForm.HOBBIN:
-                    if tile not in (
-                        TileType.TUNNEL,
-                        TileType.DIRT,
-                        TileType.EMERALD,
-                    ):
-                        continue
-
-                # Αν το tile δεν έχει επισκεφθεί ακόμα
-                if (nx, ny) not in came_from:
-                    # Καταγράφουμε από πού ήρθαμε
-                    came_from[(nx, ny)] = (cx, cy)
-                    queue.append((nx, ny))
-
-        # =========================
-        # ΑΝ ΔΕΝ ΒΡΕΘΗΚΕ ΔΙΑΔΡΟΜΗ
-        # =========================
-        if goal not in came_from:
-            return None
+            # =========================
+            # FLOW FIELD MODE
+            # =========================
+            # Ο στόχος είναι κοινός για όλους τους εχθρούς,
+            # οπότε διαβάζουμε το βήμα από το κοινόχρηστο field
+            if self.flow_fields is not None:
+                return self.flow_fields.next_step(enemy, player, level)
 
         # =========================
-        # ΑΝΑΚΑΤΑΣΚΕΥΗ ΠΡΩΤΟΥ ΒΗΜΑΤΟΣ
+        # CACHE ΔΙΑΔΡΟΜΩΝ
         # =========================
+        # Αν υπάρχει ακόμα έγκυρη διαδρομή από προηγούμενο tick,
+        # την ξαναχρησιμοποιούμε χωρίς νέα αναζήτηση
+        nxt = None
+        if self.path_cache is not None:
+            nxt = self.path_cache.next_position(level, enemy.form, start, goal)
+
+        if nxt is None:
+            result = self.strategy.find_route(start, goal, enemy.form, level)
+            route = result.route
+
+            # =========================
+            # ΑΝ ΔΕΝ ΒΡΕΘΗΚΕ ΔΙΑΔΡΟΜΗ
+            # =========================
+            # (ή ο εχθρός βρίσκεται ήδη πάνω στον στόχο,
+            #  ή το best-effort δεν βρήκε καλύτερο tile από το τρέχον)
+            if route is None or len(route) < 2:
+                return None
 
-        # Ξεκινάμε από τον στόχο
-        cur = goal
-
-        # Πηγαίνουμε πίσω μέχρι το tile που είναι ακριβώς δίπλα στον εχθρό
-        while came_from[cur] != start:
-            cur = came_from[cur]
+            # Στο cache μπαίνουν ΜΟΝΟ πλήρεις διαδρομές προς τον στόχο.
+            # Μια best-effort διαδρομή είναι απλώς κατεύθυνση για αυτό το tick.
+            if self.path_cache is not None and result.complete:
+                self.path_cache.store(level, enemy.form, route)
 
-            # Ασφαλιστική δικλείδα
-            if cur is None:
-                return None
+            nxt = route[1]
 
         # Υπολογισμός διαφοράς θέσης
-        dx = cur[0] - enemy.tile_x
-        dy = cur[1] - enemy.tile_y
+        dx = nxt[0] - enemy.tile_x
+        dy = nxt[1] - enemy.tile_y
 
         # Μετατροπή διαφοράς σε Direction
         for direction, (vx, vy) in DIRS.items():
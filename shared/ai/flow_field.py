@@ -0,0 +1,341 @@
+from collections import deque
+from shared.model.types import Direction
+from shared.model.passability import FORM_BITS
+
+try:
+    import numpy as np
+except ImportError:
+    # Το NumPy είναι προαιρετικό.
+    # Χωρίς αυτό, χρησιμοποιείται πάντα το pure-Python FlowField.
+    np = None
+
+
+# Λεξικό που μετατρέπει μια κατεύθυνση σε μεταβολή συντεταγμένων (dx, dy)
+# Η σειρά καθορίζει και την προτεραιότητα σε ισοπαλία αποστάσεων
+DIRS = {
+    Direction.UP: (0, -1),
+    Direction.DOWN: (0, 1),
+    Direction.LEFT: (-1, 0),
+    Direction.RIGHT: (1, 0),
+}
+
+
+class FlowField:
+    """
+    Χάρτης αποστάσεων (distance map) προς έναν στόχο.
+
+    Υπολογίζεται με ΕΝΑ BFS που ξεκινά από τον στόχο (π.χ. τον παίκτη)
+    και απλώνεται σε όλη την προσβάσιμη περιοχή για μία μορφή εχθρού.
+    Μετά, κάθε εχθρός βρίσκει το επόμενο βήμα του σε O(1):
+    απλώς επιλέγει τον γείτονα με τη μικρότερη απόσταση.
+
+    Σημαντικό:
+    Για να ισχύουν οι ίδιοι κανόνες με το κλασικό BFS από τον εχθρό,
+    tiles που ΔΕΝ είναι προσβάσιμα παίρνουν απόσταση (ώστε ένας εχθρός
+    που στέκεται πάνω τους να βρει δρόμο), αλλά δεν επεκτείνονται.
+    """
+
+    # Τιμή για tiles που δεν έχουν προσεγγιστεί
+    UNREACHED = -1
+
+    def __init__(self, level, goal, form):
+        """
+        level : το επίπεδο του παιχνιδιού
+        goal  : (x, y) του στόχου
+        form  : MonsterForm για την οποία ισχύουν οι κανόνες κίνησης
+        """
+
+        self.goal = goal
+        self.form = form
+
+        # Έκδοση του Level τη στιγμή του υπολογισμού
+        self.version = level.version
+
+        # Επίπεδος (flat) πίνακας αποστάσεων: index = y * width + x
+        self.width = level.width
+        self.dist = self._compute(level)
+
+    def _compute(self, level):
+        index = level.passability
+        bits = index.bits
+        neighbours = index.neighbours
+        mask = FORM_BITS[self.form]
+
+        w, h = level.width, level.height
+        unreached = self.UNREACHED
+        dist = [unreached] * (w * h)
+
+        gx, gy = self.goal
+
+        # Ο στόχος πρέπει να είναι εντός ορίων και προσβάσιμος,
+        # αλλιώς (όπως και στο κλασικό BFS) δεν υπάρχει διαδρομή
+        if not level.in_bounds(gx, gy):
+            return dist
+
+        g = gy * w + gx
+        if not bits[g] & mask:
+            return dist
+
+        dist[g] = 0
+        queue = deque([g])
+
+        while queue:
+            cur = queue.popleft()
+            nd = dist[cur] + 1
+
+            for n in neighbours[cur]:
+                if dist[n] != unreached:
+                    continue
+
+                dist[n] = nd
+
+                # Επεκτείνουμε ΜΟΝΟ από προσβάσιμα tiles
+                if bits[n] & mask:
+                    queue.append(n)
+
+        return dist
+
+    def distance(self, x, y):
+        """
+        Απόσταση (σε βήματα) από το (x, y) μέχρι τον στόχο,
+        ή UNREACHED αν δεν υπάρχει διαδρομή.
+        """
+
+        return self.dist[y * self.width + x]
+
+    def next_step(self, level, x, y):
+        """
+        Επιστρέφει την κατεύθυνση του επόμενου βήματος από το (x, y)
+        προς τον στόχο, ή None αν δεν υπάρχει έγκυρη κίνηση.
+        """
+
+        if (x, y) == self.goal:
+            return None
+
+        bits = level.passability.bits
+        mask = FORM_BITS[self.form]
+        best_dir = None
+        best = None
+
+        for direction, (dx, dy) in DIRS.items():
+            nx, ny = x + dx, y + dy
+
+            if not level.in_bounds(nx, ny):
+                continue
+
+            idx = ny * self.width + nx
+            d = self.dist[idx]
+            if d == self.UNREACHED:
+                continue
+
+            # Ο εχθρός μπορεί να μπει μόνο σε προσβάσιμο tile
+            if not bits[idx] & mask:
+                continue
+
+            if best is None or d < best:
+                best = d
+                best_dir = direction
+
+        return best_dir
+
+
+class NumpyFlowField(FlowField):
+    """
+    FlowField με υπολογισμό σε NumPy (ίδιο API, ίδιες αποστάσεις).
+
+    Αντί για ουρά BFS κόμβο-κόμβο, προχωρά ολόκληρο το μέτωπο
+    (wavefront) σε κάθε βήμα με πράξεις πινάκων:
+    - γείτονες όλων των κόμβων του μετώπου από τον πίνακα γειτνίασης
+    - κρατάμε όσους δεν έχουν απόσταση ακόμα
+    - τους δίνουμε απόσταση d, και επεκτείνονται μόνο οι προσβάσιμοι
+
+    Αξίζει σε μεγάλους χάρτες. Σε μικρούς (π.χ. 60x40) το κόστος
+    κάθε κλήσης NumPy είναι συγκρίσιμο με όλο το pure-Python BFS.
+    """
+
+    # (width, height) -> πίνακας γειτνίασης (N, 4)
+    _neighbour_tables = {}
+
+    @classmethod
+    def _neighbour_table(cls, w, h):
+        """
+        Πίνακας (N, 4) με τα indices των γειτόνων κάθε tile
+        (σειρά: πάνω, κάτω, αριστερά, δεξιά). Γείτονες εκτός ορίων
+        δείχνουν στο "φρουρό" κελί N, που θεωρείται ήδη επισκεμμένο.
+        """
+
+        table = cls._neighbour_tables.get((w, h))
+        if table is not None:
+            return table
+
+        n = w * h
+        idx = np.arange(n, dtype=np.int64)
+        xs = idx % w
+        ys = idx // w
+
+        table = np.full((n, 4), n, dtype=np.int64)
+        for col, (dx, dy) in enumerate(DIRS.values()):
+            nx = xs + dx
+            ny = ys + dy
+            ok = (nx >= 0) & (nx < w) & (ny >= 0) & (ny < h)
+            table[ok, col] = ny[ok] * w + nx[ok]
+
+        cls._neighbour_tables[(w, h)] = table
+        return table
+
+    def _compute(self, level):
+        w, h = level.width, level.height
+        n = w * h
+
+        # +1 κελί "φρουρός" για γείτονες εκτός ορίων
+        dist = np.full(n + 1, self.UNREACHED, dtype=np.int32)
+        dist[n] = 0
+
+        gx, gy = self.goal
+
+        if not level.in_bounds(gx, gy):
+            return dist[:n]
+
+        # Μάσκα προσβασιμότητας (zero-copy πάνω στα bits του Level)
+        bits = np.frombuffer(level.passability.bits, dtype=np.uint8)
+        passable = (bits & FORM_BITS[self.form]) != 0
+
+        g = gy * w + gx
+        if not passable[g]:
+            return dist[:n]
+
+        table = self._neighbour_table(w, h)
+
+        # Βοηθητικός πίνακας για αφαίρεση διπλοτύπων χωρίς ταξινόμηση:
+        # κάθε υποψήφιος γράφει τη θέση του, και κρατάμε μόνο
+        # όποιον "κέρδισε" (η τελευταία εγγραφή ανά κελί)
+        slot = np.empty(n + 1, dtype=np.int64)
+
+        dist[g] = 0
+        frontier = np.array([g], dtype=np.int64)
+        d = 0
+
+        while frontier.size:
+            d += 1
+
+            # Όλοι οι γείτονες του μετώπου που δεν έχουν απόσταση
+            cand = table[frontier].ravel()
+            cand = cand[dist[cand] == self.UNREACHED]
+
+            order = np.arange(cand.size)
+            slot[cand] = order
+            cand = cand[slot[cand] == order]
+
+            dist[cand] = d
+
+            # Επεκτείνουμε ΜΟΝΟ από προσβάσιμα tiles
+            frontier = cand[passable[cand]]
+
+        return dist[:n]
+
+
+# ==================================================
+# Επιλογή backend
+# ==================================================
+# Από αυτό το πλήθος tiles και πάνω, το "auto" προτιμά το NumPy
+# (βλ. python -m shared.ai.pathfinding_benchmark)
+NUMPY_MIN_CELLS = 128 * 128
+
+
+def field_class_for(level, backend="auto"):
+    """
+    Επιστρέφει την κλάση FlowField που θα χρησιμοποιηθεί.
+
+    backend:
+    - "python" : πάντα pure-Python
+    - "numpy"  : NumPy αν είναι διαθέσιμο, αλλιώς pure-Python
+    - "auto"   : NumPy μόνο για μεγάλους χάρτες (>= NUMPY_MIN_CELLS)
+    """
+
+    if np is None or backend == "python":
+        return FlowField
+
+    if backend == "numpy":
+        return NumpyFlowField
+
+    if level.width * level.height >= NUMPY_MIN_CELLS:
+        return NumpyFlowField
+
+    return FlowField
+
+
+class FlowFieldCache:
+    """
+    Κοινόχρηστα flow fields για ΟΛΟΥΣ τους εχθρούς.
+
+    Κρατά ένα FlowField ανά (μορφή εχθρού, θέση στόχου).
+    Ένα field ξαναϋπολογίζεται μόνο όταν:
+    - αλλάξει ο χάρτης (Level.version) ή το ίδιο το Level
+    - μετακινηθεί ο στόχος (νέο κλειδί)
+
+    Fields παλιών θέσεων στόχου δεν ξαναδιαβάζονται: το cache κρατά
+    το πολύ max_fields fields και, όταν γεμίσει, πετά αυτό που
+    χρησιμοποιήθηκε λιγότερο πρόσφατα (LRU).
+
+    Έτσι, σε κάθε tick γίνεται το πολύ ένα BFS ανά ζωντανό παίκτη
+    και ανά μορφή (Nobbin / Hobbin), ανεξάρτητα από το πλήθος εχθρών.
+
+    backend    : "auto" / "python" / "numpy" (βλ. field_class_for)
+    max_fields : μέγιστο πλήθος αποθηκευμένων fields
+    """
+
+    def __init__(self, backend: str = "auto", max_fields: int = 8):
+        # Backend υπολογισμού των fields
+        self.backend = backend
+
+        # Μέγιστο πλήθος fields (αρκεί ένα ανά παίκτη και μορφή)
+        self.max_fields = max_fields
+
+        # Το Level για το οποίο ισχύουν τα fields
+        self._level = None
+
+        # Έκδοση του Level στην οποία ισχύουν τα fields
+        self._version = None
+
+        # (form, goal) -> FlowField
+        # Το dict κρατά σειρά χρήσης: τα πρώτα είναι τα παλαιότερα
+        self._fields = {}
+
+    def field_for(self, level, goal, form):
+        """
+        Επιστρέφει (και αν χρειάζεται υπολογίζει) το field
+        για τον δοσμένο στόχο και μορφή εχθρού.
+        """
+
+        # Αλλαγή χάρτη -> όλα τα fields είναι πλέον άκυρα
+        if level is not self._level or level.version != self._version:
+            self._level = level
+            self._version = level.version
+            self._fields.clear()
+
+        fields = self._fields
+        key = (form, goal)
+        field = fields.pop(key, None)
+
+        if field is None:
+            # Απόσυρση των λιγότερο πρόσφατα χρησιμοποιημένων
+            while len(fields) >= self.max_fields:
+                del fields[next(iter(fields))]
+
+            field = field_class_for(level, self.backend)(level, goal, form)
+
+        # (Ξανα)εισαγωγή στο τέλος = πιο πρόσφατα χρησιμοποιημένο
+        fields[key] = field
+
+        return field
+
+    def next_step(self, enemy, player, level):
+        """
+        Επόμενο βήμα του εχθρού προς τον παίκτη, σε O(1)
+        (μετά τον πρώτο υπολογισμό του field στο τρέχον tick).
+        """
+
+        field = self.field_for(
+            level, (player.tile_x, player.tile_y), enemy.form
+        )
+        return field.next_step(level, enemy.tile_x, enemy.tile_y)
@@ -0,0 +1,193 @@
+from shared.ai.flow_field import DIRS
+from shared.model.passability import FORM_BITS, TILE_BITS
+# DIRS       : οι 4 κατευθύνσεις (για τα γειτονικά tiles μιας διαδρομής)
+# FORM_BITS  : bit προσβασιμότητας ανά μορφή εχθρού
+# TILE_BITS  : bits προσβασιμότητας ανά τύπο tile
+
+
+class PathCache:
+    """
+    Cache διαδρομών για το EnemyBrain.
+
+    Κάθε διαδρομή [start, ..., goal] που υπολογίζεται για μία μορφή
+    εχθρού αποθηκεύεται μαζί με ΟΛΑ τα επιθέματά της: αφού ο εχθρός
+    κάνει ένα βήμα, η υπόλοιπη διαδρομή είναι επίσης η συντομότερη,
+    οπότε το επόμενο tick βρίσκει έτοιμη απάντηση για (form, start, goal).
+
+    Ακύρωση:
+    - όταν αλλάξει η προσβασιμότητα (για τη μορφή της διαδρομής)
+      σε tile πάνω ή ακριβώς δίπλα στη διαδρομή
+      (ειδοποίηση μέσω Level.add_listener)
+    - όταν μετακινηθεί ο στόχος: το κλειδί αλλάζει, οπότε η παλιά
+      διαδρομή απλώς δεν ξαναβρίσκεται και αποσύρεται όταν
+      γεμίσει το cache (οι παλαιότερες διαδρομές φεύγουν πρώτες)
+    - όταν αλλάξει το ίδιο το Level
+
+    Οι μετρητές hits / misses είναι διαθέσιμοι για profiling.
+    """
+
+    def __init__(self, max_routes: int = 256):
+        # Μέγιστο πλήθος αποθηκευμένων διαδρομών
+        self.max_routes = max_routes
+
+        # Το Level στο οποίο ανήκουν οι διαδρομές
+        self._level = None
+
+        # route_id -> (form, route)
+        # Το dict κρατά σειρά εισαγωγής, άρα οι πρώτες είναι οι παλαιότερες
+        self._routes = {}
+
+        # (form, start, goal) -> (route_id, index του start στη διαδρομή)
+        self._entries = {}
+
+        # (x, y) -> σύνολο route_id που περνούν πάνω ή δίπλα από το tile
+        self._by_tile = {}
+
+        # Αύξων αριθμός για νέες διαδρομές
+        self._next_id = 0
+
+        # Μετρητές για profiling
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # ==================================================
+    # Δημόσιο API
+    # ==================================================
+
+    def next_position(self, level, form, start, goal):
+        """
+        Επιστρέφει την επόμενη θέση (x, y) της αποθηκευμένης διαδρομής
+        από το start προς το goal, ή None αν δεν υπάρχει στο cache.
+        """
+
+        self._bind(level)
+
+        entry = self._entries.get((form, start, goal))
+        if entry is None:
+            self.misses += 1
+            return None
+
+        route_id, index = entry
+        _, route = self._routes[route_id]
+
+        self.hits += 1
+        return route[index + 1]
+
+    def store(self, level, form, route):
+        """
+        Αποθηκεύει μία πλήρη διαδρομή [start, ..., goal].
+        """
+
+        self._bind(level)
+
+        if len(route) < 2:
+            return
+
+        # Απόσυρση παλαιότερων διαδρομών αν γεμίσαμε
+        while len(self._routes) >= self.max_routes:
+            self._drop(next(iter(self._routes)))
+
+        route = tuple(route)
+        route_id = self._next_id
+        self._next_id += 1
+        self._routes[route_id] = (form, route)
+
+        goal = route[-1]
+
+        # Κάθε επίθεμα της διαδρομής (εκτός από τον ίδιο τον στόχο)
+        for index, pos in enumerate(route[:-1]):
+            self._entries[(form, pos, goal)] = (route_id, index)
+
+        # Ευρετήριο tiles πάνω και δίπλα στη διαδρομή
+        for x, y in route:
+            self._by_tile.setdefault((x, y), set()).add(route_id)
+            for dx, dy in DIRS.values():
+                self._by_tile.setdefault((x + dx, y + dy), set()).add(route_id)
+
+    def clear(self):
+        """
+        Αδειάζει πλήρως το cache (οι μετρητές διατηρούνται).
+        """
+
+        self._routes.clear()
+        self._entries.clear()
+        self._by_tile.clear()
+
+    def stats(self) -> dict:
+        """
+        Στατιστικά για profiling.
+        """
+
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / total if total else 0.0,
+            "routes": len(self._routes),
+        }
+
+    # ==================================================
+    # Εσωτερικά
+    # ==================================================
+
+    def _bind(self, level):
+        """
+        Συνδέει το cache με το τρέχον Level.
+        Σε αλλαγή Level, όλες οι διαδρομές είναι άκυρες.
+        """
+
+        if level is self._level:
+            return
+
+        if self._level is not None:
+            self._level.remove_listener(self._on_tile_changed)
+
+        self.clear()
+        self._level = level
+        level.add_listener(self._on_tile_changed)
+
+    def _on_tile_changed(self, x, y, old_tile, new_tile):
+        """
+        Listener του Level: ακυρώνει τις διαδρομές γύρω από το tile,
+        ΜΟΝΟ αν άλλαξε η προσβασιμότητα για τη μορφή τους.
+        """
+
+        route_ids = self._by_tile.get((x, y))
+        if not route_ids:
+            return
+
+        # Μορφές για τις οποίες άλλαξε η προσβασιμότητα του tile
+        changed = TILE_BITS[old_tile] ^ TILE_BITS[new_tile]
+        if not changed:
+            return
+
+        for route_id in list(route_ids):
+            form, _ = self._routes[route_id]
+
+            if changed & FORM_BITS[form]:
+                self._drop(route_id)
+                self.invalidations += 1
+
+    def _drop(self, route_id):
+        """
+        Αφαιρεί μία διαδρομή και όλες τις αναφορές της.
+        """
+
+        form, route = self._routes.pop(route_id)
+        goal = route[-1]
+
+        for pos in route[:-1]:
+            key = (form, pos, goal)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == route_id:
+                del self._entries[key]
+
+        for x, y in route:
+            for pos in [(x, y)] + [(x + dx, y + dy) for dx, dy in DIRS.values()]:
+                ids = self._by_tile.get(pos)
+                if ids is not None:
+                    ids.discard(route_id)
+                    if not ids:
+                        del self._by_tile[pos]
@@ -0,0 +1,109 @@
+"""
+Benchmark των backends υπολογισμού flow fields (pure-Python / NumPy).
+
+Για κάθε μέγεθος χάρτη δημιουργείται πίστα με τυχαία τούνελ
+(σταθερό seed) και μετριέται ο μέσος χρόνος υπολογισμού ενός field
+από τη θέση του παίκτη, για κάθε μορφή εχθρού και κάθε backend.
+Ελέγχεται επίσης ότι τα δύο backends δίνουν ΙΔΙΕΣ αποστάσεις.
+
+Εκτέλεση (από τον φάκελο του project):
+
+    python -m shared.ai.pathfinding_benchmark
+    python -m shared.ai.pathfinding_benchmark --sizes 60x40 256x256 --repeat 3
+"""
+
+import argparse
+import random
+import time
+
+from shared.ai.flow_field import FlowField, NumpyFlowField, np
+from shared.model.compact_level import CompactLevel
+from shared.model.types import TileType, MonsterForm
+
+
+# Μεγέθη χαρτών (πλάτος, ύψος) από το πραγματικό 60x40 μέχρι 512x512
+DEFAULT_SIZES = ((60, 40), (128, 128), (256, 256), (512, 512))
+
+
+def build_level(width, height, seed=1):
+    """
+    Δημιουργεί πίστα με τούνελ "τυχαίου περιπάτου" που καλύπτουν
+    περίπου το 1/3 του χάρτη, και μερικά σακιά χρυσού ως εμπόδια.
+    """
+
+    rnd = random.Random(seed)
+    level = CompactLevel(width, height)
+
+    x, y = width // 2, height // 2
+    for _ in range(width * height // 2):
+        level.set_tile(x, y, TileType.TUNNEL)
+
+        dx, dy = rnd.choice(((0, -1), (0, 1), (-1, 0), (1, 0)))
+        x = min(max(x + dx, 0), width - 1)
+        y = min(max(y + dy, 0), height - 1)
+
+    for _ in range(width * height // 50):
+        level.set_tile(rnd.randrange(width), rnd.randrange(height), TileType.GOLD_BAG)
+
+    level.set_tile(width // 2, height // 2, TileType.TUNNEL)
+    return level
+
+
+def time_field(field_class, level, goal, form, repeat):
+    """
+    Μέσος χρόνος (ms) υπολογισμού ενός field και το τελευταίο field.
+    """
+
+    # Ένας υπολογισμός "ζεστάματος" (π.χ. πίνακας γειτνίασης του NumPy)
+    field = field_class(level, goal, form)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        field = field_class(level, goal, form)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    return elapsed * 1000.0, field
+
+
+def run(sizes, repeat):
+    print(f"{'map':>9} {'form':>7} {'python ms':>10} {'numpy ms':>10} {'speedup':>8}  same")
+
+    for width, height in sizes:
+        level = build_level(width, height)
+        goal = (width // 2, height // 2)
+
+        for form in MonsterForm:
+            py_ms, py_field = time_field(FlowField, level, goal, form, repeat)
+
+            if np is None:
+                print(f"{width:>4}x{height:<4} {form.name:>7} {py_ms:>10.2f} {'-':>10} {'-':>8}  -")
+                continue
+
+            np_ms, np_field = time_field(NumpyFlowField, level, goal, form, repeat)
+            same = list(py_field.dist) == np_field.dist.tolist()
+
+            print(
+                f"{width:>4}x{height:<4} {form.name:>7} {py_ms:>10.2f} "
+                f"{np_ms:>10.2f} {py_ms / np_ms:>7.1f}x  {'yes' if same else 'NO'}"
+            )
+
+    if np is None:
+        print("NumPy is not installed: only the pure-Python backend was measured.")
+
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flow field backend benchmark")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
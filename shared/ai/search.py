@@ -0,0 +1,352 @@
+import heapq
+from abc import ABC, abstractmethod
+from collections import deque
+
+from shared.model.passability import FORM_BITS
+# FORM_BITS : bit προσβασιμότητας ανά μορφή εχθρού
+#             (τα bits κάθε tile βρίσκονται στο level.passability)
+
+
+class SearchResult:
+    """
+    Αποτέλεσμα μιας αναζήτησης διαδρομής.
+
+    route    : λίστα θέσεων [start, ..., τελευταίο tile] ή None
+    complete : True αν η διαδρομή φτάνει στον στόχο,
+               False αν είναι best-effort (εξαντλήθηκε το budget)
+    expanded : πόσοι κόμβοι επεκτάθηκαν (για profiling)
+    """
+
+    def __init__(self, route, complete, expanded):
+        self.route = route
+        self.complete = complete
+        self.expanded = expanded
+
+
+class SearchStrategy(ABC):
+    """
+    Βασική κλάση στρατηγικής αναζήτησης για το EnemyBrain.
+
+    Κάθε στρατηγική υλοποιεί τη find_route() πάνω στο
+    level.passability: οι κόμβοι είναι επίπεδα indices
+    (y * width + x), οι γείτονες είναι προϋπολογισμένοι και ο
+    έλεγχος προσβασιμότητας είναι ένα bit test ανά γείτονα.
+
+    max_expansions:
+    - None : χωρίς όριο (πλήρης αναζήτηση)
+    - int  : μέγιστος αριθμός επεκτάσεων κόμβων ανά κλήση.
+             Αν εξαντληθεί, επιστρέφεται best-effort διαδρομή προς
+             τον εξερευνημένο κόμβο που είναι πιο κοντά στον στόχο.
+    """
+
+    # Όνομα στρατηγικής (χρησιμοποιείται από το DifficultyScaler)
+    name = ""
+
+    def __init__(self, max_expansions=None):
+        self.max_expansions = max_expansions
+
+    def find_route(self, start, goal, form, level) -> SearchResult:
+        """
+        start, goal : (x, y) του εχθρού και του στόχου
+        form        : MonsterForm (κανόνες κίνησης)
+        level       : το επίπεδο του παιχνιδιού
+        """
+
+        index = level.passability
+        w = index.width
+
+        s = start[1] * w + start[0]
+
+        # Στόχος εκτός ορίων (π.χ. flee στο BONUS mode):
+        # δεν ταιριάζει ποτέ με κανέναν κόμβο
+        if level.in_bounds(goal[0], goal[1]):
+            g = goal[1] * w + goal[0]
+        else:
+            g = -1
+
+        return self._search(index, s, g, goal, FORM_BITS[form])
+
+    @abstractmethod
+    def _search(self, index, s, g, goal, mask) -> SearchResult:
+        """
+        Η αναζήτηση κάθε στρατηγικής πάνω στο PassabilityIndex.
+
+        s, g : επίπεδα indices αρχής / στόχου (g = -1 αν ο στόχος είναι εκτός ορίων)
+        goal : (x, y) του στόχου (για ευρετικές)
+        mask : bit προσβασιμότητας της μορφής του εχθρού
+        """
+        ...
+
+    # ==================================================
+    # Βοηθητικά
+    # ==================================================
+
+    @staticmethod
+    def _heuristic(node, w, goal):
+        """
+        Manhattan απόσταση (grid χωρίς διαγώνιες κινήσεις).
+        """
+
+        return abs(node % w - goal[0]) + abs(node // w - goal[1])
+
+    def _out_of_budget(self, expanded):
+        return self.max_expansions is not None and expanded >= self.max_expansions
+
+    @staticmethod
+    def _walk_back(came_from, end, w):
+        """
+        Ανακατασκευή διαδρομής [start, ..., end] ως θέσεις (x, y)
+        από το λεξικό came_from (index -> index προγόνου ή -1).
+        """
+
+        route = []
+        cur = end
+        while cur != -1:
+            route.append((cur % w, cur // w))
+            cur = came_from[cur]
+
+        route.reverse()
+        return route
+
+    def _best_effort(self, came_from, w, goal, expanded):
+        """
+        Διαδρομή προς τον εξερευνημένο κόμβο με τη μικρότερη
+        Manhattan απόσταση από τον στόχο (fallback κατεύθυνση).
+        """
+
+        best = min(came_from, key=lambda node: self._heuristic(node, w, goal))
+        return SearchResult(self._walk_back(came_from, best, w), False, expanded)
+
+
+class BfsSearch(SearchStrategy):
+    """
+    Κλασικό BFS από τον εχθρό προς τον στόχο.
+    Βρίσκει πάντα τη συντομότερη διαδρομή, αλλά χωρίς budget
+    εξερευνά ΟΛΗ την προσβάσιμη περιοχή αν ο στόχος δεν είναι προσβάσιμος.
+    """
+
+    name = "bfs"
+
+    def _search(self, index, s, g, goal, mask) -> SearchResult:
+        bits = index.bits
+        neighbours = index.neighbours
+        w = index.width
+
+        # Ουρά BFS (First In – First Out)
+        queue = deque([s])
+
+        # Λεξικό που κρατά από ποιο tile ήρθαμε σε κάθε tile
+        # Χρησιμοποιείται για ανακατασκευή της διαδρομής
+        came_from = {s: -1}
+
+        expanded = 0
+
+        # Όσο υπάρχουν κόμβοι προς εξερεύνηση
+        while queue:
+            cur = queue.popleft()
+
+            # Αν φτάσαμε στο στόχο, σταματάμε
+            if cur == g:
+                return SearchResult(self._walk_back(came_from, g, w), True, expanded)
+
+            if self._out_of_budget(expanded):
+                return self._best_effort(came_from, w, goal, expanded)
+
+            expanded += 1
+
+            # Εξερεύνηση γειτονικών tiles (μόνο προσβάσιμα για τη μορφή)
+            for n in neighbours[cur]:
+                if bits[n] & mask and n not in came_from:
+                    came_from[n] = cur
+                    queue.append(n)
+
+        # Ο στόχος δεν είναι προσβάσιμος
+        return SearchResult(None, False, expanded)
+
+
+class AStarSearch(SearchStrategy):
+    """
+    A* με Manhattan heuristic.
+
+    Κατευθύνει την αναζήτηση προς τον στόχο, οπότε συνήθως
+    επεκτείνει πολύ λιγότερους κόμβους από το BFS.
+    Η Manhattan απόσταση δεν υπερεκτιμά ποτέ το κόστος,
+    άρα η διαδρομή παραμένει η συντομότερη.
+    """
+
+    name = "astar"
+
+    def _search(self, index, s, g, goal, mask) -> SearchResult:
+        bits = index.bits
+        neighbours = index.neighbours
+        w = index.width
+        gx, gy = goal
+
+        # Κόστος από την αρχή (g) και πρόγονοι
+        g_cost = {s: 0}
+        came_from = {s: -1}
+
+        # Σωρός προτεραιότητας: (f, h, σειρά εισαγωγής, κόμβος)
+        # Η σειρά εισαγωγής σπάει τις ισοπαλίες σταθερά (FIFO)
+        h0 = self._heuristic(s, w, goal)
+        heap = [(h0, h0, 0, s)]
+        counter = 1
+
+        closed = set()
+        expanded = 0
+
+        while heap:
+            _, _, _, cur = heapq.heappop(heap)
+
+            if cur in closed:
+                continue
+
+            if cur == g:
+                return SearchResult(self._walk_back(came_from, g, w), True, expanded)
+
+            if self._out_of_budget(expanded):
+                return self._best_effort(came_from, w, goal, expanded)
+
+            closed.add(cur)
+            expanded += 1
+
+            ng = g_cost[cur] + 1
+
+            for n in neighbours[cur]:
+                if not bits[n] & mask:
+                    continue
+
+                if ng < g_cost.get(n, ng + 1):
+                    g_cost[n] = ng
+                    came_from[n] = cur
+                    h = abs(n % w - gx) + abs(n // w - gy)
+                    heapq.heappush(heap, (ng + h, h, counter, n))
+                    counter += 1
+
+        return SearchResult(None, False, expanded)
+
+
+class BidirectionalSearch(SearchStrategy):
+    """
+    BFS ταυτόχρονα από τον εχθρό και από τον στόχο.
+
+    Σε κάθε γύρο επεκτείνεται ολόκληρο το μικρότερο από τα δύο
+    μέτωπα. Όταν τα δύο δέντρα συναντηθούν, η διαδρομή ενώνεται
+    στον κόμβο συνάντησης με το μικρότερο συνολικό μήκος.
+
+    Κανόνες κίνησης:
+    - προς τα εμπρός: μπαίνουμε μόνο σε προσβάσιμα tiles
+    - προς τα πίσω: ο στόχος πρέπει να είναι προσβάσιμος, και
+      ένα tile μπορεί να είναι ενδιάμεσο μόνο αν είναι προσβάσιμο
+      (εκτός από την αρχική θέση του εχθρού)
+    """
+
+    name = "bidirectional"
+
+    def _search(self, index, s, g, goal, mask) -> SearchResult:
+        bits = index.bits
+        neighbours = index.neighbours
+        w = index.width
+
+        if s == g:
+            return SearchResult([goal], True, 0)
+
+        # Στόχος εκτός ορίων ή μη προσβάσιμος → καμία διαδρομή
+        # (όπως στο BFS, όπου ο στόχος μπαίνει μόνο ως γείτονας)
+        if g == -1 or not bits[g] & mask:
+            return SearchResult(None, False, 0)
+
+        fwd = {s: -1}
+        bwd = {g: -1}
+
+        # Βάθος κάθε κόμβου σε κάθε κατεύθυνση
+        fwd_depth = {s: 0}
+        bwd_depth = {g: 0}
+
+        fwd_frontier = [s]
+        bwd_frontier = [g]
+        expanded = 0
+
+        while fwd_frontier and bwd_frontier:
+            forward = len(fwd_frontier) <= len(bwd_frontier)
+
+            if forward:
+                tree, depth, other = fwd, fwd_depth, bwd_depth
+                frontier = fwd_frontier
+            else:
+                tree, depth, other = bwd, bwd_depth, fwd_depth
+                frontier = bwd_frontier
+
+            next_frontier = []
+            meet = -1
+            meet_len = 0
+
+            for cur in frontier:
+                if self._out_of_budget(expanded):
+                    return self._best_effort(fwd, w, goal, expanded)
+
+                expanded += 1
+                nd = depth[cur] + 1
+
+                for n in neighbours[cur]:
+                    if n in tree:
+                        continue
+                    if not bits[n] & mask and (forward or n != s):
+                        continue
+
+                    tree[n] = cur
+                    depth[n] = nd
+                    next_frontier.append(n)
+
+                    # Συνάντηση με το άλλο δέντρο
+                    if n in other:
+                        total = nd + other[n]
+                        if meet == -1 or total < meet_len:
+                            meet = n
+                            meet_len = total
+
+            if meet != -1:
+                return SearchResult(self._join(fwd, bwd, meet, w), True, expanded)
+
+            if forward:
+                fwd_frontier = next_frontier
+            else:
+                bwd_frontier = next_frontier
+
+        return SearchResult(None, False, expanded)
+
+    def _join(self, fwd, bwd, meet, w):
+        """
+        Ενώνει [start, ..., meet] με [meet, ..., goal].
+        """
+
+        route = self._walk_back(fwd, meet, w)
+
+        cur = bwd[meet]
+        while cur != -1:
+            route.append((cur % w, cur // w))
+            cur = bwd[cur]
+
+        return route
+
+
+# ==================================================
+# Κατάλογος στρατηγικών
+# ==================================================
+STRATEGIES = {
+    BfsSearch.name: BfsSearch,
+    AStarSearch.name: AStarSearch,
+    BidirectionalSearch.name: BidirectionalSearch,
+}
+
+
+def make_strategy(name, max_expansions=None) -> SearchStrategy:
+    """
+    Δημιουργεί στρατηγική αναζήτησης από το όνομά της
+    ("bfs", "astar", "bidirectional").
+    """
+
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown search strategy: {name}")
+
+    return STRATEGIES[name](max_expansions)
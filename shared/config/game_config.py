@@ -21,9 +21,40 @@ class GameConfig:
     screen_height: int = 720
 
     # Frames Per Second (FPS)
-    # Καθορίζει πόσες φορές το παιχνίδι ενημερώνεται και σχεδιάζεται ανά δευτερόλεπτο
+    # Καθορίζει πόσες φορές το παιχνίδι σχεδιάζεται ανά δευτερόλεπτο
     fps: int = 60
 
+    # Ρυθμός προσομοίωσης (ticks ανά δευτερόλεπτο)
+    # Η λογική ενημερώνεται ΠΑΝΤΑ με σταθερό dt = 1 / tick_rate,
+    # ανεξάρτητα από το πόσο γρήγορα σχεδιάζεται η οθόνη
+    tick_rate: int = 60
+
+    # Μέγιστος αριθμός ticks ανά frame
+    # Αν ένα frame αργήσει πολύ, δεν "κυνηγάμε" όλο τον χαμένο χρόνο
+    # (αποφυγή spiral of death): ο υπόλοιπος χρόνος απορρίπτεται
+    max_ticks_per_frame: int = 5
+
+    # Δευτερόλεπτα με πλήρες fps μετά από το τελευταίο input
+    # Μετά, σκηνές χωρίς κίνηση (π.χ. μενού) πέφτουν στο δικό τους
+    # desired_fps() και το loop κοιμάται μέχρι το επόμενο frame ή event
+    idle_delay: float = 1.0
+
+    # Profiler ενεργός από την εκκίνηση
+    # (αλλιώς ενεργοποιείται με F3 κατά τη διάρκεια του παιχνιδιού)
+    profiling: bool = False
+
+    # Καταγραφή κάθε παιχνιδιού (seed + είσοδος ανά tick) σε αυτό το αρχείο
+    # Κενό = χωρίς καταγραφή
+    record_path: str = ""
+
+    # Αναπαραγωγή καταγεγραμμένου παιχνιδιού αντί για είσοδο πληκτρολογίου
+    # Κενό = κανονικό παιχνίδι
+    replay_path: str = ""
+
+    # Αρχείο βάσης των high scores (SQLite)
+    # Κενό = μεταβλητή DIGGER_SCORES_DB ή το προεπιλεγμένο scores.db
+    scores_db: str = ""
+
     # Τίτλος παραθύρου εφαρμογής
     title: str = "Digger (Beta Version)"
 
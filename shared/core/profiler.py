@@ -0,0 +1,257 @@
+"""
+Μέτρηση χρόνου ανά frame και ανά σύστημα (profiling).
+
+Ο Profiler είναι ΑΠΕΝΕΡΓΟΠΟΙΗΜΕΝΟΣ από προεπιλογή:
+- η section() επιστρέφει ένα κοινό "κενό" context manager
+- δεν γίνεται καμία μέτρηση χρόνου ούτε αποθήκευση
+
+Όταν ενεργοποιηθεί (enabled = True):
+- κάθε section μετρά χρόνο με time.perf_counter
+- οι χρόνοι ενός frame αθροίζονται ανά όνομα section
+  (π.χ. το "ai" καλείται μία φορά για κάθε εχθρό)
+- στο end_frame() το άθροισμα μπαίνει σε κυλιόμενο παράθυρο
+  των τελευταίων `window` frames
+- από το παράθυρο υπολογίζονται p50 / p95 / p99
+- τα δεδομένα εξάγονται σε CSV ή JSON
+
+Χρήση:
+
+    with profiler.section("render"):
+        scene_manager.render(screen)
+"""
+
+import csv
+import json
+import time
+from collections import deque
+
+
+class _NullSection:
+    """
+    Context manager που δεν κάνει τίποτα (profiler απενεργοποιημένος).
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    """
+    Context manager που μετρά ένα section και προσθέτει
+    τη διάρκειά του στο τρέχον frame του Profiler.
+    """
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._profiler.add(self._name, time.perf_counter() - self._start)
+        return False
+
+
+class Profiler:
+    """
+    Κυλιόμενα στατιστικά χρόνου (σε δευτερόλεπτα) ανά section.
+
+    Το "frame" είναι ειδικό section: μετρά από το begin_frame()
+    μέχρι το end_frame() (χωρίς την αναμονή του clock.tick).
+    """
+
+    # Όνομα του section για ολόκληρο το frame
+    FRAME = "frame"
+
+    # Ποσοστημόρια που εμφανίζονται / εξάγονται
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, enabled: bool = False, window: int = 300):
+        # Αν είναι False, η section() δεν μετρά τίποτα
+        self.enabled = enabled
+
+        # Πόσα frames κρατάμε στο κυλιόμενο παράθυρο
+        self.window = window
+
+        # Σειρά εμφάνισης των sections (με τη σειρά που πρωτοεμφανίστηκαν)
+        self._names = []
+
+        # Ιστορικό: ένα dict {section: δευτερόλεπτα} ανά frame
+        self._frames = deque(maxlen=window)
+
+        # Χρόνοι του τρέχοντος frame
+        self._current = {}
+        self._frame_start = None
+
+        # Ένας μετρητής ανά όνομα (αποφεύγουμε νέα αντικείμενα κάθε frame)
+        self._sections = {}
+
+    # ==================================================
+    # Μέτρηση
+    # ==================================================
+
+    def section(self, name: str):
+        """
+        Context manager που μετρά το σώμα του with.
+        """
+
+        if not self.enabled:
+            return _NULL_SECTION
+
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def add(self, name: str, seconds: float) -> None:
+        """
+        Προσθέτει χρόνο σε ένα section του τρέχοντος frame.
+        """
+
+        if name not in self._current:
+            self._current[name] = seconds
+            if name not in self._names:
+                self._names.append(name)
+        else:
+            self._current[name] += seconds
+
+    def begin_frame(self) -> None:
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """
+        Κλείνει το τρέχον frame και το προσθέτει στο ιστορικό.
+        """
+
+        if not self.enabled or self._frame_start is None:
+            return
+
+        self.add(self.FRAME, time.perf_counter() - self._frame_start)
+        self._frames.append(self._current)
+
+        self._current = {}
+        self._frame_start = None
+
+    def toggle(self) -> bool:
+        """
+        Ενεργοποίηση / απενεργοποίηση. Επιστρέφει τη νέα κατάσταση.
+        Κάθε ενεργοποίηση ξεκινά με καθαρό ιστορικό.
+        """
+
+        self.enabled = not self.enabled
+        self.reset()
+        return self.enabled
+
+    def reset(self) -> None:
+        self._names.clear()
+        self._frames.clear()
+        self._current = {}
+        self._frame_start = None
+
+    # ==================================================
+    # Στατιστικά
+    # ==================================================
+
+    @staticmethod
+    def _percentile(sorted_values, pct):
+        # Nearest-rank ποσοστημόριο σε ήδη ταξινομημένη λίστα
+        if not sorted_values:
+            return 0.0
+        rank = max(1, -(-pct * len(sorted_values) // 100))
+        return sorted_values[int(rank) - 1]
+
+    @property
+    def section_names(self):
+        """
+        Τα sections με τη σειρά εμφάνισης ("frame" πρώτο, αν υπάρχει).
+        """
+
+        names = [n for n in self._names if n != self.FRAME]
+        if self.FRAME in self._names:
+            names.insert(0, self.FRAME)
+        return names
+
+    def stats(self) -> dict:
+        """
+        Στατιστικά του παραθύρου σε milliseconds:
+
+            {section: {"p50": .., "p95": .., "p99": .., "max": .., "mean": ..}}
+
+        Frames όπου ένα section δεν εκτελέστηκε μετρούν ως 0 ms,
+        ώστε όλα τα sections να αφορούν το ίδιο πλήθος frames.
+        """
+
+        frames = self._frames
+        result = {}
+
+        for name in self.section_names:
+            values = sorted(f.get(name, 0.0) * 1000.0 for f in frames)
+
+            entry = {
+                f"p{pct}": self._percentile(values, pct)
+                for pct in self.PERCENTILES
+            }
+            entry["max"] = values[-1] if values else 0.0
+            entry["mean"] = sum(values) / len(values) if values else 0.0
+
+            result[name] = entry
+
+        return result
+
+    # ==================================================
+    # Εξαγωγή
+    # ==================================================
+
+    def export_csv(self, path: str) -> None:
+        """
+        Ένα row ανά frame του παραθύρου, μία στήλη (ms) ανά section.
+        """
+
+        names = self.section_names
+
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + [f"{n}_ms" for n in names])
+
+            for i, frame in enumerate(self._frames):
+                writer.writerow(
+                    [i] + [f"{frame.get(n, 0.0) * 1000.0:.4f}" for n in names]
+                )
+
+    def export_json(self, path: str) -> None:
+        """
+        Σύνοψη (stats) και τα frames του παραθύρου σε ms.
+        """
+
+        names = self.section_names
+
+        data = {
+            "window": self.window,
+            "frames_recorded": len(self._frames),
+            "summary": self.stats(),
+            "frames": [
+                {n: frame.get(n, 0.0) * 1000.0 for n in names}
+                for frame in self._frames
+            ],
+        }
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
+# Κοινός απενεργοποιημένος profiler (προεπιλογή για GameWorld / σκηνές)
+NULL_PROFILER = Profiler(enabled=False)
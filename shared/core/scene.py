@@ -1,6 +1,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 
 from shared.services.input import InputSnapshot
 
@@ -64,15 +64,51 @@ class Scene(ABC):
         ...
 
     @abstractmethod
-    def render(self, surface) -> None:
+    def render(self, surface) -> Optional[List]:
         """
         Σχεδίαση (rendering) της σκηνής στην οθόνη.
 
         surface:
         - το pygame Surface της κύριας οθόνης
+
+        Επιστρέφει (προαιρετικά) τη λίστα με τα Rect της οθόνης
+        που άλλαξαν. None σημαίνει ότι άλλαξε όλη η οθόνη.
         """
         ...
 
+    def render_state(self):
+        """
+        Τιμή που περιγράφει ό,τι δείχνει αυτή τη στιγμή η σκηνή
+        (π.χ. ποια επιλογή του μενού είναι ενεργή).
+
+        Αν είναι ίδια με του προηγούμενου frame, το SceneManager
+        δεν καλεί καθόλου render() και η οθόνη δεν ενημερώνεται.
+
+        None (προεπιλογή): η σκηνή αλλάζει σε κάθε frame
+        (π.χ. GameScene) και σχεδιάζεται πάντα.
+        """
+        return None
+
+    def desired_fps(self) -> Optional[int]:
+        """
+        Ρυθμός frames που αρκεί στη σκηνή όταν ο χρήστης δεν κάνει τίποτα
+        (π.χ. 10 για ένα μενού χωρίς κίνηση).
+
+        Με το πρώτο input το GameApp επιστρέφει αμέσως στο πλήρες fps.
+        None (προεπιλογή): πάντα πλήρες fps.
+        """
+        return None
+
+    def set_interpolation(self, alpha: float) -> None:
+        """
+        Καλείται πριν από το render() με το ποσοστό (0.0 - 1.0)
+        του χρόνου που έχει περάσει από το τελευταίο tick προς το επόμενο.
+
+        Σκηνές με κίνηση μπορούν να το χρησιμοποιούν για ομαλή
+        σχεδίαση ανάμεσα σε δύο ticks. Από προεπιλογή αγνοείται.
+        """
+        pass
+
 
 class SceneManager:
     """
@@ -96,6 +132,13 @@ class SceneManager:
         # Αντικείμενο της τρέχουσας σκηνής
         self._current_scene: Optional[Scene] = None
 
+        # render_state() της σκηνής στο τελευταίο render
+        self._last_state = None
+
+        # Αν True, το επόμενο render σχεδιάζει ολόκληρη την οθόνη
+        # (π.χ. μετά από αλλαγή σκηνής)
+        self._full_redraw = True
+
     def register_scene(self, scene_id: str, scene: Scene) -> None:
         """
         Καταχωρεί μία σκηνή στο σύστημα.
@@ -132,6 +175,9 @@ class SceneManager:
         self._current_id = scene_id
         self._current_scene = self._scenes[scene_id]
 
+        # Η νέα σκηνή σχεδιάζεται ολόκληρη στο πρώτο της frame
+        self._full_redraw = True
+
         # Ενεργοποίηση νέας σκηνής
         self._current_scene.enter(payload or {})
 
@@ -149,12 +195,56 @@ class SceneManager:
         if self._current_scene is not None:
             self._current_scene.update(dt)
 
-    def render(self, surface) -> None:
+    def render(self, surface, alpha: float = 1.0) -> Optional[List]:
         """
         Προωθεί το render στην ενεργή σκηνή.
+
+        alpha:
+        - θέση ανάμεσα στο προηγούμενο και στο τρέχον tick (interpolation)
+
+        Επιστρέφει τι πρέπει να ενημερωθεί στην οθόνη:
+        - None       : ολόκληρη η οθόνη (display.flip)
+        - λίστα Rect : μόνο αυτά τα κομμάτια (display.update)
+        - []         : τίποτα (η σκηνή δεν άλλαξε)
         """
-        if self._current_scene is not None:
-            self._current_scene.render(surface)
+        scene = self._current_scene
+        if scene is None:
+            return []
+
+        scene.set_interpolation(alpha)
+
+        # Σκηνή που δεν άλλαξε από το προηγούμενο frame: κανένα render
+        state = scene.render_state()
+        if (
+            state is not None
+            and not self._full_redraw
+            and state == self._last_state
+        ):
+            return []
+
+        dirty = scene.render(surface)
+
+        full = self._full_redraw
+        self._full_redraw = False
+        self._last_state = state
+
+        return None if full else dirty
+
+    def desired_fps(self) -> Optional[int]:
+        """
+        Ο ρυθμός frames που ζητά η ενεργή σκηνή όταν είναι αδρανής
+        (None = πλήρες fps).
+        """
+        if self._current_scene is None:
+            return None
+        return self._current_scene.desired_fps()
+
+    def invalidate(self) -> None:
+        """
+        Ζητά πλήρη σχεδίαση στο επόμενο render, π.χ. όταν κάτι άλλο
+        ζωγράφισε πάνω στην οθόνη ή το παράθυρο χρειάζεται ανανέωση.
+        """
+        self._full_redraw = True
 
     @property
     def current_scene_id(self) -> Optional[str]:
@@ -0,0 +1,131 @@
+from shared.model.level import Level
+# Εισαγωγή της βασικής κλάσης Level.
+# Το CompactLevel κρατά ΑΚΡΙΒΩΣ το ίδιο API (get_tile / set_tile / in_bounds,
+# listeners, emeralds) και αλλάζει μόνο τον τρόπο αποθήκευσης των tiles.
+
+from shared.model.types import TileType
+# Εισαγωγή του Enum TileType (οι τιμές του χρησιμοποιούνται ως ακέραιοι κωδικοί)
+
+try:
+    import numpy as np
+except ImportError:
+    # Το NumPy είναι προαιρετικό.
+    # Χωρίς αυτό, το CompactLevel λειτουργεί κανονικά
+    # και απλώς η as_array() επιστρέφει None.
+    np = None
+
+
+# ==================================================
+# Ακέραιοι κωδικοί tiles
+# ==================================================
+# Κάθε TileType αποθηκεύεται ως ένα byte ίσο με το .value του.
+# Ο πίνακας CODE_TO_TILE κάνει την αντίστροφη μετατροπή
+# (κωδικός -> TileType) με ένα απλό indexing.
+TILE_CODES = {tile: tile.value for tile in TileType}
+
+CODE_TO_TILE = tuple(
+    next((t for t in TileType if t.value == code), None)
+    for code in range(max(TILE_CODES.values()) + 1)
+)
+
+
+class CompactLevel(Level):
+    """
+    Εναλλακτική υλοποίηση του Level με συμπαγή αποθήκευση.
+
+    Αντί για λίστα από λίστες με TileType, τα tiles αποθηκεύονται
+    σε ένα επίπεδο (flat) bytearray μεγέθους width * height,
+    όπου κάθε byte είναι ο ακέραιος κωδικός του tile.
+
+    Πλεονεκτήματα:
+    - πολύ μικρότερη μνήμη
+    - get_tile / set_tile με ένα μόνο indexing
+    - ο buffer μπορεί να δοθεί απευθείας σε μαζικές λειτουργίες
+      (μέτρημα, σάρωση, NumPy, pathfinding)
+
+    Δείκτης κελιού: index = y * width + x
+    """
+
+    def _alloc_tiles(self):
+        """
+        Δημιουργεί τον buffer tiles γεμάτο χώμα (DIRT).
+        """
+
+        self._cells = bytearray([TILE_CODES[TileType.DIRT]]) * (
+            self.width * self.height
+        )
+
+    def _put(self, x: int, y: int, tile: TileType):
+        """
+        Γράφει τον κωδικό του tile στον buffer.
+        """
+
+        self._cells[y * self.width + x] = tile.value
+
+    def get_tile(self, x: int, y: int) -> TileType:
+        """
+        Επιστρέφει τον τύπο του tile στη θέση (x, y).
+        Όπως και στο Level, δεν γίνεται έλεγχος ορίων.
+        """
+
+        return CODE_TO_TILE[self._cells[y * self.width + x]]
+
+    def get_code(self, x: int, y: int) -> int:
+        """
+        Επιστρέφει τον ακέραιο κωδικό του tile στη θέση (x, y),
+        χωρίς μετατροπή σε TileType.
+        """
+
+        return self._cells[y * self.width + x]
+
+    # ==================================================
+    # Πρόσβαση στον buffer
+    # ==================================================
+
+    def raw_buffer(self) -> memoryview:
+        """
+        Επιστρέφει memoryview πάνω στον buffer των tiles.
+
+        Ο buffer είναι ΜΟΝΟ για ανάγνωση από τον καλούντα:
+        αλλαγές πρέπει να γίνονται πάντα μέσω set_tile(),
+        ώστε να ενημερώνονται emeralds, dirty tiles και listeners.
+        """
+
+        return memoryview(self._cells).toreadonly()
+
+    def as_array(self):
+        """
+        Επιστρέφει NumPy πίνακα uint8 σχήματος (height, width)
+        που μοιράζεται την ίδια μνήμη με τον buffer (χωρίς αντιγραφή).
+
+        Επιστρέφει None αν το NumPy δεν είναι διαθέσιμο.
+        """
+
+        if np is None:
+            return None
+
+        return np.frombuffer(self.raw_buffer(), dtype=np.uint8).reshape(
+            self.height, self.width
+        )
+
+    def count_tiles(self, tile: TileType) -> int:
+        """
+        Μετρά πόσα tiles ενός τύπου υπάρχουν, με σάρωση του buffer σε C.
+        """
+
+        return self._cells.count(TILE_CODES[tile])
+
+    @property
+    def tiles(self):
+        """
+        Συμβατότητα με κώδικα που διαβάζει level.tiles[y][x].
+
+        Δημιουργεί ΑΝΤΙΓΡΑΦΟ σε μορφή λίστας από λίστες,
+        οπότε δεν πρέπει να χρησιμοποιείται σε hot paths.
+        """
+
+        w = self.width
+        return [
+            [CODE_TO_TILE[c] for c in self._cells[y * w:(y + 1) * w]]
+            for y in range(self.height)
+        ]
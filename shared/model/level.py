@@ -2,6 +2,9 @@ from shared.model.types import TileType
 # Εισαγωγή του Enum TileType που περιγράφει
 # όλους τους δυνατούς τύπους πλακιδίων (χώμα, σήραγγα, διαμάντια κ.λπ.)
 
+from shared.model.passability import PassabilityIndex
+# Bits προσβασιμότητας ανά μορφή εχθρού (για την AI)
+
 
 class Level:
     """
@@ -17,49 +20,111 @@ class Level:
         # Ύψος του επιπέδου (αριθμός γραμμών)
         self.height = height
 
-        # Δημιουργία δισδιάστατου πίνακα tiles
+        # Δημιουργία αποθήκευσης tiles
         # Αρχικά ΟΛΟ το επίπεδο γεμίζει με χώμα (DIRT)
-        # self.tiles[y][x]
-        self.tiles = [
-            [TileType.DIRT for _ in range(width)]
-            for _ in range(height)
-        ]
+        self._alloc_tiles()
 
         # ==================================================
         # Spawn παίκτη και αρχικό τούνελ
         # ==================================================
 
         # Σημείο εμφάνισης του Player 1
-        self.tiles[5][5] = TileType.SPAWN_P1
+        self._put(5, 5, TileType.SPAWN_P1)
 
         # Δημιουργία αρχικού οριζόντιου τούνελ
         # ώστε ο παίκτης να έχει ελεύθερο χώρο στην αρχή
         for x in range(5, 12):
-            self.tiles[5][x] = TileType.TUNNEL
+            self._put(x, 5, TileType.TUNNEL)
 
         # ==================================================
         # Placeholder θέσεις για gold bags (προς δοκιμή)
         # ==================================================
         # Οι γραμμές αυτές είναι σχολιασμένες
         # και μπορούν να χρησιμοποιηθούν για fixed τοποθέτηση
-        # self.tiles[6][8] = TileType.GOLD_BAG
-        # self.tiles[10][20] = TileType.GOLD_BAG
+        # self._put(8, 6, TileType.GOLD_BAG)
+        # self._put(20, 10, TileType.GOLD_BAG)
 
         # ==================================================
         # Ομάδες διαμαντιών (emerald clusters)
         # ==================================================
 
         # Πρώτο cluster διαμαντιών (2x2)
-        self.tiles[6][6] = TileType.EMERALD
-        self.tiles[6][7] = TileType.EMERALD
-        self.tiles[7][6] = TileType.EMERALD
-        self.tiles[7][7] = TileType.EMERALD
+        self._put(6, 6, TileType.EMERALD)
+        self._put(7, 6, TileType.EMERALD)
+        self._put(6, 7, TileType.EMERALD)
+        self._put(7, 7, TileType.EMERALD)
 
         # Δεύτερο cluster διαμαντιών (2x2)
-        self.tiles[12][18] = TileType.EMERALD
-        self.tiles[12][19] = TileType.EMERALD
-        self.tiles[13][18] = TileType.EMERALD
-        self.tiles[13][19] = TileType.EMERALD
+        self._put(18, 12, TileType.EMERALD)
+        self._put(19, 12, TileType.EMERALD)
+        self._put(18, 13, TileType.EMERALD)
+        self._put(19, 13, TileType.EMERALD)
+
+        # ==================================================
+        # Θέσεις emeralds
+        # ==================================================
+        # Σύνολο (x, y) με ΟΛΑ τα emeralds της πίστας.
+        # Υπολογίζεται μία φορά εδώ και ενημερώνεται στη set_tile(),
+        # ώστε ο έλεγχος ολοκλήρωσης πίστας να είναι O(1)
+        # και η σχεδίαση να αγγίζει μόνο τα πραγματικά emeralds.
+        self._emeralds = {
+            (x, y)
+            for y in range(height)
+            for x in range(width)
+            if self.get_tile(x, y) == TileType.EMERALD
+        }
+
+        # ==================================================
+        # Προσβασιμότητα για την AI
+        # ==================================================
+        # Bits ανά μορφή εχθρού και γειτνίαση tiles.
+        # Ενημερώνεται στη set_tile(), πριν ειδοποιηθούν οι listeners.
+        self.passability = PassabilityIndex(self)
+
+        # ==================================================
+        # Listeners αλλαγών tiles
+        # ==================================================
+        # Callbacks της μορφής callback(x, y, old_tile, new_tile)
+        # που καλούνται κάθε φορά που ένα tile αλλάζει μέσω set_tile().
+        # Χρησιμοποιούνται π.χ. από το TilemapView ώστε να
+        # ξανασχεδιάζει ΜΟΝΟ τα tiles που άλλαξαν.
+        self._listeners = []
+
+        # Σύνολο (x, y) των tiles που άλλαξαν στο τρέχον frame.
+        # Καθαρίζεται από το GameScene στην αρχή κάθε update()
+        # μέσω της clear_dirty().
+        self.dirty_tiles = set()
+
+        # Μετρητής αλλαγών (αυξάνεται σε ΚΑΘΕ αλλαγή tile).
+        # Επιτρέπει σε caches να καταλάβουν φθηνά
+        # αν ο χάρτης άλλαξε από την τελευταία φορά που τον είδαν.
+        self.version = 0
+
+    # ==================================================
+    # Αποθήκευση tiles (backend)
+    # ==================================================
+    # Οι δύο μέθοδοι αυτές είναι το ΜΟΝΑΔΙΚΟ σημείο που γνωρίζει
+    # πώς αποθηκεύονται τα tiles. Υποκλάσεις (π.χ. CompactLevel)
+    # τις αντικαθιστούν μαζί με τη get_tile() για διαφορετικό backend.
+
+    def _alloc_tiles(self):
+        """
+        Δημιουργεί τον δισδιάστατο πίνακα tiles γεμάτο χώμα.
+        Πρόσβαση: self.tiles[y][x]
+        """
+
+        self.tiles = [
+            [TileType.DIRT for _ in range(self.width)]
+            for _ in range(self.height)
+        ]
+
+    def _put(self, x: int, y: int, tile: TileType):
+        """
+        Γράφει ένα tile χωρίς ειδοποιήσεις ή bookkeeping.
+        Χρησιμοποιείται στην κατασκευή της πίστας και από τη set_tile().
+        """
+
+        self.tiles[y][x] = tile
 
     def in_bounds(self, x: int, y: int) -> bool:
         """
@@ -86,6 +151,77 @@ class Level:
         - σκάβεται χώμα
         - συλλέγεται διαμάντι
         - πέφτει gold bag
+
+        Αν ο τύπος του tile αλλάξει πραγματικά,
+        ειδοποιούνται όλοι οι εγγεγραμμένοι listeners.
         """
 
-        self.tiles[y][x] = tile
+        old = self.get_tile(x, y)
+        self._put(x, y, tile)
+
+        # Καμία αλλαγή -> καμία ειδοποίηση
+        if old == tile:
+            return
+
+        # Ενημέρωση συνόλου emeralds
+        if old == TileType.EMERALD:
+            self._emeralds.discard((x, y))
+        if tile == TileType.EMERALD:
+            self._emeralds.add((x, y))
+
+        self.passability.update(x, y, tile)
+
+        self.dirty_tiles.add((x, y))
+        self.version += 1
+
+        for listener in self._listeners:
+            listener(x, y, old, tile)
+
+    @property
+    def emerald_count(self) -> int:
+        """
+        Πλήθος emeralds που απομένουν στην πίστα (O(1)).
+        Όταν γίνει 0, η πίστα έχει ολοκληρωθεί.
+        """
+
+        return len(self._emeralds)
+
+    def iter_emeralds(self):
+        """
+        Επιστρέφει iterator πάνω στις θέσεις (x, y) των emeralds.
+        Δεν πρέπει να αλλάζουν tiles όσο γίνεται η διάσχιση.
+        """
+
+        return iter(self._emeralds)
+
+    def add_listener(self, listener):
+        """
+        Εγγράφει ένα callback που θα καλείται σε κάθε αλλαγή tile.
+
+        listener : callable(x, y, old_tile, new_tile)
+        """
+
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Διαγράφει ένα callback που είχε εγγραφεί με add_listener().
+        Αν δεν είχε εγγραφεί, δεν γίνεται τίποτα.
+        """
+
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def clear_dirty(self):
+        """
+        Αδειάζει το σύνολο των tiles που άλλαξαν.
+
+        Καλείται μία φορά ανά frame, ώστε το dirty_tiles
+        να περιέχει πάντα μόνο τις αλλαγές του τρέχοντος frame.
+        Επιστρέφει τις αλλαγές που μόλις "καθαρίστηκαν".
+        """
+
+        changed = self.dirty_tiles
+        self.dirty_tiles = set()
+        return changed
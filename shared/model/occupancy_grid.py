@@ -0,0 +1,130 @@
+class OccupancyGrid:
+    """
+    Ευρετήριο θέσεων: tile (x, y) -> οντότητες που βρίσκονται εκεί.
+
+    Αντί κάθε έλεγχος σύγκρουσης να διατρέχει όλους τους εχθρούς
+    (π.χ. ανά σφαίρα, ανά σακί, ανά παίκτη), ρωτάμε απευθείας
+    ποιος βρίσκεται σε ένα tile:
+
+        for entity in grid.at(x, y): ...
+
+    Κρατά:
+    - _cells : (x, y) -> λίστα οντοτήτων (μόνο για tiles που έχουν κάποια)
+    - _where : οντότητα -> (x, y) όπως ήταν στην τελευταία ενημέρωση
+    - _order : οντότητα -> αύξων αριθμός προσθήκης
+
+    Οι οντότητες κάθε tile επιστρέφονται με τη σειρά που προστέθηκαν
+    στο grid. Έτσι, όταν δύο εχθροί μοιράζονται ένα tile, "πρώτος"
+    είναι αυτός που δημιουργήθηκε πρώτος, όπως και στη λίστα enemies.
+
+    Το grid ΔΕΝ παρακολουθεί μόνο του τις αλλαγές θέσης:
+    όποιος αλλάζει tile_x / tile_y καλεί update()
+    (το GridMovementSystem.try_move το κάνει αυτόματα).
+    """
+
+    def __init__(self):
+        self._cells = {}
+        self._where = {}
+        self._order = {}
+        self._next_order = 0
+
+    # ==================================================
+    # Ενημέρωση
+    # ==================================================
+
+    def add(self, entity) -> None:
+        """
+        Προσθέτει μια οντότητα στη θέση (tile_x, tile_y) της.
+        """
+
+        if entity in self._where:
+            self.update(entity)
+            return
+
+        self._order[entity] = self._next_order
+        self._next_order += 1
+
+        pos = (entity.tile_x, entity.tile_y)
+        self._where[entity] = pos
+        self._insert(pos, entity)
+
+    def remove(self, entity) -> None:
+        """
+        Αφαιρεί μια οντότητα (αγνοείται αν δεν υπάρχει).
+        """
+
+        pos = self._where.pop(entity, None)
+        if pos is None:
+            return
+
+        self._discard(pos, entity)
+        del self._order[entity]
+
+    def update(self, entity) -> None:
+        """
+        Μεταφέρει την οντότητα στη νέα της θέση μετά από κίνηση.
+        Οντότητες που δεν έχουν προστεθεί αγνοούνται.
+        """
+
+        old = self._where.get(entity)
+        if old is None:
+            return
+
+        pos = (entity.tile_x, entity.tile_y)
+        if pos == old:
+            return
+
+        self._discard(old, entity)
+        self._where[entity] = pos
+        self._insert(pos, entity)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._where.clear()
+        self._order.clear()
+
+    def _insert(self, pos, entity):
+        cell = self._cells.get(pos)
+        if cell is None:
+            self._cells[pos] = [entity]
+            return
+
+        # Τα tiles έχουν ελάχιστες οντότητες: γραμμική εισαγωγή
+        # ώστε να διατηρείται η σειρά προσθήκης
+        order = self._order
+        key = order[entity]
+        i = len(cell)
+        while i > 0 and order[cell[i - 1]] > key:
+            i -= 1
+        cell.insert(i, entity)
+
+    def _discard(self, pos, entity):
+        cell = self._cells[pos]
+        cell.remove(entity)
+        if not cell:
+            del self._cells[pos]
+
+    # ==================================================
+    # Ερωτήματα
+    # ==================================================
+
+    def at(self, x: int, y: int):
+        """
+        Οντότητες στο tile (x, y), με σειρά προσθήκης.
+        Η λίστα ανήκει στο grid: δεν πρέπει να τροποποιείται.
+        """
+
+        return self._cells.get((x, y), ())
+
+    def order(self, entity) -> int:
+        """
+        Αύξων αριθμός προσθήκης (για επιλογή ανάμεσα σε πολλά tiles).
+        """
+
+        return self._order[entity]
+
+    def __contains__(self, entity) -> bool:
+        return entity in self._where
+
+    def __len__(self) -> int:
+        return len(self._where)
@@ -0,0 +1,94 @@
+from shared.model.types import TileType, MonsterForm
+# TileType    : τύποι πλακιδίων της πίστας
+# MonsterForm : μορφές εχθρών (Nobbin / Hobbin)
+
+
+# ==================================================
+# Bits προσβασιμότητας
+# ==================================================
+# Κάθε μορφή εχθρού έχει ΕΝΑ bit.
+# Ένα tile είναι προσβάσιμο για μια μορφή αν (bits & FORM_BITS[form]) != 0.
+FORM_BITS = {
+    MonsterForm.NOBBIN: 0b01,
+    MonsterForm.HOBBIN: 0b10,
+}
+
+# Bits κάθε τύπου tile:
+# - Nobbin: κινείται ΜΟΝΟ σε tunnels
+# - Hobbin: κινείται σε tunnels, χώμα και διαμάντια (σκάβει)
+TILE_BITS = {tile: 0 for tile in TileType}
+TILE_BITS[TileType.TUNNEL] = FORM_BITS[MonsterForm.NOBBIN] | FORM_BITS[MonsterForm.HOBBIN]
+TILE_BITS[TileType.DIRT] = FORM_BITS[MonsterForm.HOBBIN]
+TILE_BITS[TileType.EMERALD] = FORM_BITS[MonsterForm.HOBBIN]
+
+
+class PassabilityIndex:
+    """
+    Ευρετήριο προσβασιμότητας μιας πίστας για την AI των εχθρών.
+
+    Κρατά:
+    - bits       : bytearray με ένα byte ανά tile (index = y * width + x),
+                   όπου κάθε bit δηλώνει αν το tile είναι προσβάσιμο
+                   για μία μορφή εχθρού (βλ. FORM_BITS)
+    - neighbours : για κάθε index, tuple με τα indices των γειτόνων
+                   εντός ορίων (σειρά: πάνω, κάτω, αριστερά, δεξιά)
+
+    Οι γείτονες υπολογίζονται μία φορά. Τα bits ενημερώνονται
+    σταδιακά από τη Level.set_tile(), οπότε ο εσωτερικός βρόχος
+    μιας αναζήτησης γίνεται απλός έλεγχος bit:
+
+        if bits[n] & mask: ...
+    """
+
+    def __init__(self, level):
+        w, h = level.width, level.height
+
+        self.width = w
+        self.height = h
+
+        # Bits προσβασιμότητας ανά tile
+        self.bits = bytearray(w * h)
+        for y in range(h):
+            row = y * w
+            for x in range(w):
+                self.bits[row + x] = TILE_BITS[level.get_tile(x, y)]
+
+        # Προϋπολογισμένη γειτνίαση (ίδια σειρά με το DIRS της AI)
+        self.neighbours = []
+        for y in range(h):
+            for x in range(w):
+                adj = []
+                for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < w and 0 <= ny < h:
+                        adj.append(ny * w + nx)
+                self.neighbours.append(tuple(adj))
+
+    def update(self, x: int, y: int, tile: TileType):
+        """
+        Ενημερώνει τα bits ενός tile (καλείται από τη Level.set_tile()).
+        """
+
+        self.bits[y * self.width + x] = TILE_BITS[tile]
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Μετατρέπει (x, y) σε επίπεδο (flat) index.
+        """
+
+        return y * self.width + x
+
+    def position(self, index: int):
+        """
+        Μετατρέπει επίπεδο index σε (x, y).
+        """
+
+        return index % self.width, index // self.width
+
+    def is_passable(self, x: int, y: int, form: MonsterForm) -> bool:
+        """
+        True αν η μορφή εχθρού μπορεί να μπει στο tile (x, y).
+        Δεν κάνει έλεγχο ορίων.
+        """
+
+        return bool(self.bits[y * self.width + x] & FORM_BITS[form])
@@ -1,5 +1,6 @@
 import sqlite3
 import os
+import threading
 from datetime import datetime
 # sqlite3: ενσωματωμένη βιβλιοθήκη της Python για βάσεις δεδομένων SQLite
 # os: για ασφαλή χειρισμό διαδρομών αρχείων
@@ -14,27 +15,109 @@ class ScoreRepository:
     Αποτελεί το επίπεδο πρόσβασης δεδομένων (Data Access Layer)
     και απομονώνει πλήρως τη λογική της βάσης δεδομένων
     από το υπόλοιπο παιχνίδι.
+
+    Η κατάταξη (top 10) κρατιέται σε cache ανά αρχείο βάσης:
+    διαβάζεται από τη βάση μόνο την πρώτη φορά και ξανά μόνο
+    αφού προστεθεί νέο score (add_score / add_scores).
     """
 
-    def __init__(self):
+    # Cache κατάταξης: διαδρομή βάσης -> (γενιά, tuple γραμμών του top_10())
+    # Κοινό για όλα τα instances (π.χ. Game Over, High Scores και
+    # ScoreWriter thread), ώστε ένα add_score από οποιοδήποτε να το ακυρώνει
+    _leaderboard_cache = {}
+
+    # Γενιά ανά διαδρομή βάσης: αυξάνεται μετά από κάθε commit εγγραφών.
+    # Μια καταχώριση του cache ισχύει μόνο για τη γενιά της.
+    _generations = {}
+
+    # Προστατεύει τα δύο dicts (εγγραφές γίνονται και από άλλο thread)
+    _cache_lock = threading.Lock()
+
+    # Μεταβλητή περιβάλλοντος για τη θέση της βάσης
+    # (αν δεν δοθεί db_path στον constructor)
+    DB_PATH_ENV = "DIGGER_SCORES_DB"
+
+    # Έκδοση σχήματος της βάσης (PRAGMA user_version)
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: str | None = None):
         """
         Constructor της κλάσης.
 
-        Δημιουργεί ή ανοίγει τη βάση δεδομένων scores.db
-        και εξασφαλίζει ότι ο πίνακας scores υπάρχει.
+        Δημιουργεί ή ανοίγει τη βάση δεδομένων και εξασφαλίζει ότι
+        το σχήμα της είναι στην τρέχουσα έκδοση.
+
+        db_path:
+        αρχείο της βάσης. Αν δεν δοθεί, χρησιμοποιείται η μεταβλητή
+        περιβάλλοντος DIGGER_SCORES_DB ή, αλλιώς, το scores.db
+        δίπλα σε αυτό το αρχείο.
         """
 
-        # Εντοπίζουμε τον φάκελο στον οποίο βρίσκεται το αρχείο αυτό
-        base_dir = os.path.dirname(__file__)
+        if not db_path:
+            db_path = os.environ.get(self.DB_PATH_ENV)
+
+        if not db_path:
+            # Εντοπίζουμε τον φάκελο στον οποίο βρίσκεται το αρχείο αυτό
+            base_dir = os.path.dirname(__file__)
+
+            # Δημιουργούμε τη διαδρομή προς το αρχείο της βάσης
+            db_path = os.path.join(base_dir, "scores.db")
 
-        # Δημιουργούμε τη διαδρομή προς το αρχείο της βάσης
-        db_path = os.path.join(base_dir, "scores.db")
+        self.db_path = db_path
 
         # Δημιουργούμε σύνδεση με τη βάση δεδομένων SQLite
         self.conn = sqlite3.connect(db_path)
 
-        # Δημιουργούμε τον πίνακα αν δεν υπάρχει
-        self._create_table()
+        # WAL: οι αναγνώσεις (High Scores) δεν μπλοκάρονται από εγγραφές
+        # και κάθε commit είναι ένα append στο -wal αρχείο.
+        # Με WAL, το synchronous=NORMAL είναι ασφαλές για τη βάση.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        # Δημιουργία / αναβάθμιση σχήματος
+        self._migrate()
+
+    def close(self) -> None:
+        """
+        Κλείνει τη σύνδεση με τη βάση.
+        """
+        self.conn.close()
+
+    # ==================================================
+    # Σχήμα (migrations)
+    # ==================================================
+
+    def _migrate(self):
+        """
+        Φέρνει τη βάση στην έκδοση SCHEMA_VERSION.
+
+        Η τρέχουσα έκδοση κρατιέται στο PRAGMA user_version
+        (0 σε νέα βάση ή σε βάση παλαιότερης έκδοσης του παιχνιδιού).
+        Κάθε βήμα τρέχει μία φορά, σε δική του transaction.
+        """
+
+        conn = self.conn
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+
+        # Βήμα 0 -> 1: πίνακας scores και index στο score
+        if version < 1:
+            # Ρητό BEGIN: ο sqlite3 driver ανοίγει αυτόματα transaction
+            # μόνο πριν από INSERT/UPDATE/DELETE, όχι για CREATE / PRAGMA
+            conn.execute("BEGIN")
+            try:
+                self._create_table()
+
+                # Το top_10() (ORDER BY score DESC LIMIT 10) διαβάζει
+                # μόνο τις 10 πρώτες γραμμές του index, όχι όλο τον πίνακα
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_scores_score "
+                    "ON scores (score DESC)"
+                )
+                conn.execute("PRAGMA user_version = 1")
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
 
     def _create_table(self):
         """
@@ -56,25 +139,23 @@ class ScoreRepository:
             )
         """)
 
-        # Επιβεβαιώνουμε τις αλλαγές στη βάση
-        self.conn.commit()
+    # ==================================================
+    # Εγγραφή
+    # ==================================================
 
-    def _next_game_name(self) -> str:
+    def _last_game_number(self) -> int:
         """
-        Δημιουργεί αυτόματα όνομα παιχνιδιού τύπου:
-        GAME01, GAME02, GAME03, ...
+        Ο αριθμός του τελευταίου αποθηκευμένου παιχνιδιού.
 
-        Το όνομα βασίζεται στο πλήθος των ήδη αποθηκευμένων scores.
+        Διαβάζεται από τον μετρητή του AUTOINCREMENT (sqlite_sequence),
+        μία γραμμή ανά πίνακα, αντί για SELECT COUNT(*) σε όλο τον πίνακα.
         """
 
-        cur = self.conn.cursor()
-
-        # Μετράμε πόσες εγγραφές υπάρχουν ήδη
-        cur.execute("SELECT COUNT(*) FROM scores")
-        count = cur.fetchone()[0] + 1
+        row = self.conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'scores'"
+        ).fetchone()
 
-        # Επιστρέφουμε το όνομα σε μορφή GAME##
-        return f"GAME{count:02d}"
+        return row[0] if row else 0
 
     def add_score(self, score: int):
         """
@@ -84,27 +165,58 @@ class ScoreRepository:
         το τελικό σκορ του παιχνιδιού
         """
 
+        self.add_scores([score])
+
+    def add_scores(self, scores):
+        """
+        Αποθηκεύει πολλά scores με ΜΙΑ transaction (ένα commit).
+
+        Κάθε score παίρνει αυτόματο όνομα παιχνιδιού τύπου
+        GAME01, GAME02, GAME03, ... με τη σειρά που δίνεται.
+        """
+
+        scores = list(scores)
+        if not scores:
+            return
+
         # Παίρνουμε την τρέχουσα ημερομηνία και ώρα
         now = datetime.now()
+        date = now.strftime("%d/%m/%Y")
+        time = now.strftime("%H:%M")
 
-        # Δημιουργούμε αυτόματο όνομα παιχνιδιού
-        name = self._next_game_name()
+        conn = self.conn
 
-        cur = self.conn.cursor()
+        # BEGIN IMMEDIATE: κανείς άλλος δεν γράφει ανάμεσα στην
+        # ανάγνωση του μετρητή και στις εισαγωγές
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            first = self._last_game_number() + 1
 
-        # Εισάγουμε νέα εγγραφή στον πίνακα scores
-        cur.execute(
-            "INSERT INTO scores (name, score, date, time) VALUES (?, ?, ?, ?)",
-            (
-                name,
-                score,
-                now.strftime("%d/%m/%Y"),
-                now.strftime("%H:%M"),
+            # Εισάγουμε τις νέες εγγραφές στον πίνακα scores
+            conn.executemany(
+                "INSERT INTO scores (name, score, date, time) VALUES (?, ?, ?, ?)",
+                [
+                    (f"GAME{first + i:02d}", score, date, time)
+                    for i, score in enumerate(scores)
+                ]
             )
-        )
 
-        # Επιβεβαιώνουμε την εισαγωγή
-        self.conn.commit()
+            # Επιβεβαιώνουμε τις εισαγωγές
+            # (και αποτυχημένο COMMIT αφήνει ανοιχτή transaction)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+        # Η κατάταξη μπορεί να άλλαξε: νέα γενιά
+        # (μετά το commit, ώστε όποια ανάγνωση ξεκίνησε πριν να ακυρωθεί)
+        with ScoreRepository._cache_lock:
+            generations = ScoreRepository._generations
+            generations[self.db_path] = generations.get(self.db_path, 0) + 1
+
+    # ==================================================
+    # Ανάγνωση
+    # ==================================================
 
     def top_10(self):
         """
@@ -124,3 +236,30 @@ class ScoreRepository:
 
         # Επιστρέφουμε όλα τα αποτελέσματα
         return cur.fetchall()
+
+    def leaderboard(self):
+        """
+        Όπως η top_10(), αλλά από το cache: η βάση διαβάζεται
+        μόνο αν έχει προστεθεί score από την τελευταία φορά.
+
+        Η γενιά διαβάζεται ΠΡΙΝ από το ερώτημα: αν ένα commit
+        ολοκληρωθεί ενώ διαβάζουμε, η γενιά του αλλάζει και οι
+        (πιθανώς παλιές) γραμμές δεν ξαναχρησιμοποιούνται.
+        Το lock δεν κρατιέται κατά το ερώτημα ή το commit.
+        """
+
+        path = self.db_path
+
+        with ScoreRepository._cache_lock:
+            generation = ScoreRepository._generations.get(path, 0)
+            cached = ScoreRepository._leaderboard_cache.get(path)
+
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        rows = tuple(self.top_10())
+
+        with ScoreRepository._cache_lock:
+            ScoreRepository._leaderboard_cache[path] = (generation, rows)
+
+        return rows
@@ -0,0 +1,189 @@
+import queue
+import sys
+import threading
+
+from shared.persistence.score_repository import ScoreRepository
+
+
+class ScoreWriter:
+    """
+    Αποθήκευση scores σε background thread.
+
+    Το commit στη βάση μπορεί να αργήσει (π.χ. σε κάρτα SD) και
+    δεν πρέπει να σταματά το game loop. Γι' αυτό:
+    - το submit() απλώς βάζει το score σε μια ουρά (δεν περιμένει)
+    - ένα thread τα γράφει με ScoreRepository.add_scores(),
+      όσα έχουν μαζευτεί μαζί σε μία transaction
+    - το close() γράφει ό,τι έχει μείνει και τερματίζει το thread
+      (καλείται στον τερματισμό της εφαρμογής, ώστε να μη χαθεί score)
+
+    Αν μια εγγραφή αποτύχει (ή η βάση δεν ανοίγει), τα scores δεν
+    χάνονται: κρατιούνται και ξαναδοκιμάζονται στην επόμενη εγγραφή,
+    στο flush() και στο close().
+
+    Το thread έχει δική του σύνδεση SQLite (οι συνδέσεις δεν
+    μοιράζονται ανάμεσα σε threads). Μετά από κάθε εγγραφή, το cache
+    κατάταξης του ScoreRepository ακυρώνεται όπως σε κάθε add_scores.
+    """
+
+    # Σήμα τερματισμού για το thread
+    _STOP = object()
+
+    def __init__(self, db_path: str | None = None):
+        self.db_path = db_path
+
+        self._queue = queue.Queue()
+
+        # Scores που δεν γράφτηκαν λόγω σφάλματος (ξαναδοκιμάζονται
+        # στην επόμενη εγγραφή, στο flush και στο close)
+        self._unsaved = []
+        self._unsaved_lock = threading.Lock()
+
+        # Τελευταίο σφάλμα ανοίγματος της βάσης στο thread (None = όλα καλά)
+        self.error = None
+
+        self._thread = threading.Thread(
+            target=self._run, name="ScoreWriter", daemon=True
+        )
+        self._closed = False
+        self._thread.start()
+
+    # ==================================================
+    # API (main thread)
+    # ==================================================
+
+    def submit(self, score: int) -> None:
+        """
+        Προσθέτει ένα score στην ουρά εγγραφής (επιστρέφει αμέσως).
+
+        Δεν κάνει ποτέ I/O: ακόμη κι αν η βάση δεν ανοίγει, την
+        εγγραφή την ξαναδοκιμάζει το thread, το flush() ή το close().
+        """
+
+        if self._closed:
+            raise RuntimeError("ScoreWriter is closed")
+
+        self._queue.put(score)
+
+    def flush(self) -> None:
+        """
+        Περιμένει μέχρι να γραφτούν όλα τα scores της ουράς.
+        Ό,τι απέτυχε στο thread ξαναδοκιμάζεται εδώ.
+        """
+
+        self._queue.join()
+        self._write_unsaved()
+
+    def close(self) -> None:
+        """
+        Γράφει ό,τι έχει μείνει στην ουρά και τερματίζει το thread.
+        """
+
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+        # Τελευταία προσπάθεια για scores που απέτυχαν στο thread
+        self._write_unsaved()
+
+    # ==================================================
+    # Αποτυχημένες εγγραφές
+    # ==================================================
+
+    def _keep_unsaved(self, scores):
+        with self._unsaved_lock:
+            self._unsaved.extend(scores)
+
+    def _take_unsaved(self):
+        with self._unsaved_lock:
+            scores = self._unsaved
+            self._unsaved = []
+        return scores
+
+    def _write_unsaved(self):
+        """
+        Γράφει σύγχρονα (με δική του σύνδεση) τα scores που απέτυχαν.
+        Αν αποτύχει ξανά, κρατούνται και αναφέρεται το σφάλμα.
+        """
+
+        scores = self._take_unsaved()
+        if not scores:
+            return
+
+        repo = None
+        try:
+            repo = ScoreRepository(self.db_path)
+            repo.add_scores(scores)
+        except Exception as e:
+            self._keep_unsaved(scores)
+            print(f"Could not save scores {scores}: {e}", file=sys.stderr)
+        finally:
+            if repo is not None:
+                repo.close()
+
+    # ==================================================
+    # Background thread
+    # ==================================================
+
+    def _open_repo(self):
+        """
+        Ανοίγει τη σύνδεση του thread (None αν η βάση δεν ανοίγει).
+        """
+
+        try:
+            repo = ScoreRepository(self.db_path)
+        except Exception as e:
+            self.error = e
+            print(f"Could not open scores database: {e}", file=sys.stderr)
+            return None
+
+        self.error = None
+        return repo
+
+    def _run(self):
+        # Το thread δεν πρέπει να τερματίσει πριν από το STOP:
+        # αλλιώς το flush θα περίμενε για πάντα (queue.join).
+        # Γι' αυτό κάθε σφάλμα πιάνεται και τα scores κρατιούνται.
+        repo = self._open_repo()
+
+        try:
+            while True:
+                # Αναμονή για το πρώτο score, μετά ό,τι άλλο έχει μαζευτεί
+                items = [self._queue.get()]
+                while True:
+                    try:
+                        items.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                stop = self._STOP in items
+                scores = [item for item in items if item is not self._STOP]
+
+                try:
+                    # Η βάση δεν άνοιξε προηγουμένως: νέα προσπάθεια
+                    if repo is None and scores:
+                        repo = self._open_repo()
+
+                    if repo is None:
+                        # Χωρίς βάση: τα ξαναδοκιμάζει το flush / close
+                        self._keep_unsaved(scores)
+                    else:
+                        # Μαζί με όσα είχαν αποτύχει προηγουμένως
+                        scores = self._take_unsaved() + scores
+                        try:
+                            repo.add_scores(scores)
+                        except Exception as e:
+                            self._keep_unsaved(scores)
+                            print(f"Could not save scores {scores}: {e}", file=sys.stderr)
+                finally:
+                    for _ in items:
+                        self._queue.task_done()
+
+                if stop:
+                    return
+        finally:
+            if repo is not None:
+                repo.close()
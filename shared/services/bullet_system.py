@@ -3,6 +3,9 @@ from shared.model.types import TileType, Direction
 # - TileType: τα είδη πλακιδίων του επιπέδου (DIRT, TUNNEL, GOLD_BAG κ.λπ.)
 # - Direction: τις κατευθύνσεις κίνησης (UP, DOWN, LEFT, RIGHT)
 
+from shared.model.enemy import Enemy
+# Για να ξεχωρίζουμε τους εχθρούς από τους παίκτες στο OccupancyGrid
+
 from shared.services.audio_manager import AudioManager
 # Διαχειρίζεται την αναπαραγωγή ήχων (π.χ. έκρηξη)
 
@@ -33,14 +36,16 @@ class BulletSystem:
     Αυτό γίνεται σε ανώτερο επίπεδο (GameScene).
     """
 
-    def update(self, bullets, level, enemies, dt):
+    def update(self, bullets, level, enemies, dt, occupancy=None):
         """
         Ενημερώνει όλες τις σφαίρες για ένα frame.
 
-        bullets : λίστα αντικειμένων Bullet
-        level   : το επίπεδο του παιχνιδιού
-        enemies : λίστα εχθρών
-        dt      : χρόνος που πέρασε από το προηγούμενο frame
+        bullets   : λίστα αντικειμένων Bullet
+        level     : το επίπεδο του παιχνιδιού
+        enemies   : λίστα εχθρών
+        dt        : χρόνος που πέρασε από το προηγούμενο frame
+        occupancy : OccupancyGrid (προαιρετικό). Αν δοθεί, οι εχθροί
+                    του tile βρίσκονται απευθείας αντί για σάρωση της enemies
 
         Επιστρέφει:
         - λίστα από tuples (enemy, owner_id)
@@ -90,7 +95,12 @@ class BulletSystem:
 
             # Έλεγχος σύγκρουσης με εχθρούς
             # Δεν αποδίδουμε σκορ εδώ, μόνο δηλώνουμε το kill
-            for enemy in enemies:
+            if occupancy is not None:
+                candidates = [e for e in occupancy.at(nx, ny) if isinstance(e, Enemy)]
+            else:
+                candidates = enemies
+
+            for enemy in candidates:
                 if enemy.alive and enemy.tile_x == nx and enemy.tile_y == ny:
 
                     # Ο εχθρός πεθαίνει
@@ -101,6 +101,32 @@ class DifficultyScaler:
         # για να μην γίνει το παιχνίδι non playable
         return max(0.18, base_delay - reduction)
 
+    # =========================
+    # Εύρεση διαδρομής εχθρών
+    # =========================
+    def pathfinding_for_level(self, level: int):
+        """
+        Επιλέγει τρόπο εύρεσης διαδρομής των εχθρών για την πίστα.
+
+        Κανόνας:
+        - Πίστες 1-3 : A* με μικρό όριο επεκτάσεων
+          (λίγοι εχθροί, "χαλαρό" κυνηγητό)
+        - Πίστες 4-9 : bidirectional BFS με μεγαλύτερο όριο
+        - Πίστα 10+  : κοινόχρηστα flow fields
+          (πολλοί εχθροί μοιράζονται ένα BFS ανά παίκτη)
+
+        level : ο αριθμός της πίστας
+        επιστρέφει : (όνομα στρατηγικής, όριο επεκτάσεων ή None)
+        """
+
+        if level <= 3:
+            return "astar", 400 + (level - 1) * 200
+
+        if level <= 9:
+            return "bidirectional", 1200
+
+        return "flow", None
+
     # =========================
     # Υπάρχει επόμενη πίστα;
     # =========================
@@ -18,13 +18,18 @@ class EnemyFormSystem:
     - Η λογική είναι ανεξάρτητη από AI, κίνηση ή collisions
     """
 
-    def __init__(self):
+    def __init__(self, rng=None):
         """
         Constructor του συστήματος.
-        Δεν απαιτεί αρχικοποίηση μεταβλητών, επειδή
-        τα timers αποθηκεύονται δυναμικά πάνω στο αντικείμενο enemy.
+        Τα timers αποθηκεύονται δυναμικά πάνω στο αντικείμενο enemy.
+
+        rng:
+        πηγή τυχαιότητας (π.χ. random.Random με seed για
+        ντετερμινιστική προσομοίωση). Αν δεν δοθεί,
+        χρησιμοποιείται το global random.
         """
-        pass
+
+        self.rng = rng if rng is not None else random
 
     def update(self, enemy, dt):
         """
@@ -46,7 +51,7 @@ class EnemyFormSystem:
         # Αν δεν υπάρχει προγραμματισμένος χρόνος αλλαγής μορφής,
         # δημιουργούμε έναν τυχαίο (μεταξύ 4 και 9 δευτερολέπτων)
         if not hasattr(enemy, "next_form_change"):
-            enemy.next_form_change = random.uniform(4.0, 9.0)
+            enemy.next_form_change = self.rng.uniform(4.0, 9.0)
 
         # ==================================================
         # UPDATE TIMER
@@ -81,4 +86,4 @@ class EnemyFormSystem:
         enemy.form_timer = 0.0
 
         # Ορίζουμε νέο τυχαίο χρόνο για την επόμενη αλλαγή μορφής
-        enemy.next_form_change = random.uniform(4.0, 9.0)
+        enemy.next_form_change = self.rng.uniform(4.0, 9.0)
@@ -21,15 +21,22 @@ class EnemySpawner:
     - ορίζει την αρχική του μορφή
     """
 
-    def __init__(self, spawn_x, spawn_y):
+    def __init__(self, spawn_x, spawn_y, rng=None):
         """
         Αρχικοποιεί το σύστημα δημιουργίας εχθρών.
 
         spawn_x, spawn_y:
         οι αρχικές συντεταγμένες (tile-based) όπου μπορούν
         να εμφανιστούν εχθροί.
+
+        rng:
+        πηγή τυχαιότητας (π.χ. random.Random με seed).
+        Αν δεν δοθεί, χρησιμοποιείται το global random.
         """
 
+        # Πηγή τυχαιότητας για την επιλογή spawn point
+        self.rng = rng if rng is not None else random
+
         # Η λίστα spawn_points περιέχει όλα τα επιτρεπτά σημεία εμφάνισης
         # Κάθε στοιχείο είναι ένα tuple (x, y)
         self.spawn_points = [(spawn_x, spawn_y)]
@@ -58,7 +65,7 @@ class EnemySpawner:
         """
 
         # Επιλέγουμε τυχαία ένα από τα διαθέσιμα spawn points
-        x, y = random.choice(self.spawn_points)
+        x, y = self.rng.choice(self.spawn_points)
 
         # Δημιουργούμε νέο Enemy στη θέση (x, y)
         enemy = Enemy("enemy", x, y)
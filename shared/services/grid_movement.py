@@ -29,8 +29,19 @@ class GridMovementSystem:
     Ασχολείται αποκλειστικά με:
     - τον υπολογισμό της νέας θέσης
     - τον έλεγχο ορίων του επιπέδου
+    - την ενημέρωση του OccupancyGrid (αν δοθεί)
     """
 
+    def __init__(self, occupancy=None):
+        """
+        occupancy:
+        OccupancyGrid που ενημερώνεται σε κάθε επιτυχημένη κίνηση,
+        ώστε οι έλεγχοι συγκρούσεων να βρίσκουν ποιος είναι σε ένα tile
+        χωρίς σάρωση όλων των οντοτήτων. Προαιρετικό.
+        """
+
+        self.occupancy = occupancy
+
     def try_move(self, entity, direction, level):
         """
         Προσπαθεί να μετακινήσει μια οντότητα κατά ένα πλακίδιο.
@@ -65,6 +76,10 @@ class GridMovementSystem:
         entity.tile_x = nx
         entity.tile_y = ny
 
+        # Ενημέρωση ευρετηρίου θέσεων
+        if self.occupancy is not None:
+            self.occupancy.update(entity)
+
         # Αν η οντότητα διαθέτει ιδιότητα "direction"
         # (π.χ. Player, αλλά όχι απαραίτητα Enemy),
         # αποθηκεύουμε τη φορά που κοιτάζει
@@ -0,0 +1,1044 @@
+# ------------------------------------------------------------
+# Βασικές βιβλιοθήκες
+# ------------------------------------------------------------
+
+# random: προεπιλεγμένη πηγή τυχαιότητας (αν δεν δοθεί δική μας rng)
+import random
+
+
+# ------------------------------------------------------------
+# MODEL layer – αντικείμενα παιχνιδιού (καθαρά δεδομένα)
+# ------------------------------------------------------------
+from shared.model.compact_level import CompactLevel
+from shared.model.player import Player
+from shared.model.enemy import Enemy
+from shared.model.gold_bag import GoldBag
+from shared.model.score import Score
+from shared.model.lives import Lives
+from shared.model.weapon import Weapon
+from shared.model.occupancy_grid import OccupancyGrid
+from shared.model.types import Direction, TileType, GameMode
+
+
+# ------------------------------------------------------------
+# SYSTEMS – λογική παιχνιδιού (gameplay rules)
+# ------------------------------------------------------------
+from shared.services.grid_movement import GridMovementSystem
+from shared.services.tile_interaction import TileInteractionSystem
+from shared.services.enemy_ai_system import EnemyAISystem
+from shared.services.enemy_form_system import EnemyFormSystem
+from shared.services.hobbin_digging_system import HobbinDiggingSystem
+from shared.services.gold_bag_system import GoldBagSystem
+from shared.services.gold_bag_push_system import GoldBagPushSystem
+from shared.services.score_system import ScoreSystem
+from shared.services.weapon_system import WeaponSystem
+from shared.services.bullet_system import BulletSystem
+from shared.services.enemy_spawner import EnemySpawner
+from shared.services.difficulty_scaler import DifficultyScaler
+from shared.services.audio_manager import AudioManager
+
+
+# ------------------------------------------------------------
+# AI
+# ------------------------------------------------------------
+from shared.ai.enemy_brain import EnemyBrain
+
+
+# ------------------------------------------------------------
+# CORE
+# ------------------------------------------------------------
+from shared.core.profiler import NULL_PROFILER
+
+
+class GameWorld:
+    """
+    Ο κόσμος του παιχνιδιού ΧΩΡΙΣ γραφικά (headless simulation).
+
+    Περιέχει ΟΛΗ τη λογική gameplay που πριν βρισκόταν στο GameScene:
+    πίστα, παίκτες, εχθρούς, σφαίρες, σακιά χρυσού, συγκρούσεις,
+    σκορ, ζωές και αλλαγή πίστας.
+
+    Δεν χρησιμοποιεί οθόνη, fonts ή πληκτρολόγιο:
+    - η είσοδος δίνεται ως InputSnapshot ανά παίκτη στη step()
+    - η τυχαιότητα προέρχεται από μία rng (random.Random),
+      οπότε με ίδιο seed και ίδια είσοδο η προσομοίωση είναι ίδια
+    - τα οπτικά γεγονότα (εκρήξεις) μένουν σε ουρά
+      και τα καταναλώνει το GameScene (pop_explosions)
+    - το τέλος του παιχνιδιού δηλώνεται με τη σημαία game_over
+
+    Χρησιμοποιείται:
+    - από το GameScene (παιχνίδι με γραφικά)
+    - από το headless_runner (χιλιάδες παιχνίδια για balancing / benchmarks)
+    """
+
+    # ==================================================
+    # ΣΤΑΘΕΡΕΣ
+    # ==================================================
+
+    # Χρόνος (σε δευτερόλεπτα) που ο παίκτης είναι άτρωτος
+    # μετά από respawn
+    INVULN_SECONDS = 0.70
+
+    # Αρχική θέση respawn του παίκτη στο grid
+    RESPAWN_X = 5
+    RESPAWN_Y = 5
+
+    # Καθυστέρηση πριν περάσουμε στο επόμενο level
+    # αφού καθαριστεί η πίστα
+    LEVEL_COMPLETE_DELAY = 2.0
+
+    # Cooldown κίνησης παίκτη (grid-based)
+    MOVE_COOLDOWN = 0.12
+
+    def __init__(self, player_count: int = 1, seed=None, rng=None, width: int = 60, height: int = 40,
+                 profiler=None):
+        """
+        player_count : 1 ή 2 παίκτες
+        seed         : seed για νέα random.Random (ντετερμινιστική προσομοίωση)
+        rng          : έτοιμη πηγή τυχαιότητας (υπερισχύει του seed)
+        width/height : μέγεθος πίστας σε tiles
+        profiler     : Profiler για χρόνους ανά σύστημα (προεπιλογή: κανένας)
+
+        Χωρίς seed και rng χρησιμοποιείται το global random,
+        όπως στο κανονικό παιχνίδι.
+        """
+
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random
+
+        # Πηγή τυχαιότητας για ΟΛΗ την προσομοίωση
+        self.rng = rng
+
+        # Μέτρηση χρόνου ανά σύστημα στη step()
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
+
+        # Μέγεθος πίστας
+        self.width = width
+        self.height = height
+
+        # ==================================================
+        # SYSTEMS (ΛΟΓΙΚΗ ΠΑΙΧΝΙΔΙΟΥ)
+        # ==================================================
+
+        # Όλη η λογική δυσκολίας βρίσκεται στο DifficultyScaler
+        self.scaler = DifficultyScaler()
+
+        # Ευρετήριο θέσεων: tile -> παίκτες / εχθροί σε αυτό
+        # (οι συγκρούσεις γίνονται με lookup, όχι με σάρωση όλων των εχθρών)
+        self.occupancy = OccupancyGrid()
+
+        # Σύστημα κίνησης σε grid (ενημερώνει και το occupancy)
+        self.movement = GridMovementSystem(self.occupancy)
+
+        # Σύστημα αλληλεπίδρασης με tiles (σκάψιμο κ.λπ.)
+        self.tile_interaction = TileInteractionSystem()
+
+        # Enemy AI
+        # EnemyBrain: αποφασίζει κατεύθυνση
+        # EnemyAISystem: εφαρμόζει την απόφαση
+        # Ο τρόπος εύρεσης διαδρομής (flow fields ή A*/BFS με όριο)
+        # επιλέγεται ανά πίστα από το DifficultyScaler
+        self.enemy_brain = EnemyBrain(use_flow_field=True)
+        self.enemy_ai = EnemyAISystem(self.enemy_brain)
+
+        # Σύστημα αλλαγής μορφής εχθρού (Nobbin ↔ Hobbin)
+        self.enemy_form_system = EnemyFormSystem(rng=self.rng)
+
+        # Σύστημα σκαψίματος Hobbin
+        self.hobbin_digging = HobbinDiggingSystem()
+
+        # Σύστημα πτώσης σακιών χρυσού
+        self.gold_bag_system = GoldBagSystem()
+
+        # Σύστημα σπρωξίματος σακιών χρυσού
+        self.gold_bag_push = GoldBagPushSystem()
+
+        # ==================================================
+        # SCORE & LIVES
+        # ==================================================
+
+        # Score / ζωές Player 1
+        self.score = Score()
+        self.score_system = ScoreSystem(self.score)
+        self.lives = Lives(start_lives=3)
+
+        # Score / ζωές Player 2
+        self.score_p2 = Score()
+        self.lives_p2 = Lives(start_lives=3)
+
+        # ==================================================
+        # WEAPON & BULLETS
+        # ==================================================
+
+        # Όπλο με cooldown (κοινό για τους δύο παίκτες)
+        self.weapon = Weapon(cooldown=2.0)
+
+        # Σύστημα χρήσης όπλου
+        self.weapon_system = WeaponSystem()
+
+        # Σύστημα bullets (κίνηση, συγκρούσεις)
+        self.bullet_system = BulletSystem()
+
+        # Λίστα ενεργών bullets
+        self.bullets = []
+
+        # ==================================================
+        # PLAYERS
+        # ==================================================
+
+        # Player 1 (υπάρχει ΠΑΝΤΑ)
+        self.player = Player("p1", self.RESPAWN_X, self.RESPAWN_Y)
+
+        # Player 2 (δημιουργείται μόνο σε multiplayer)
+        self.player2 = None
+        self.players = [self.player]
+
+        # ==================================================
+        # ENEMIES & GOLD BAGS
+        # ==================================================
+
+        self.enemies: list[Enemy] = []
+        self.gold_bags = []
+
+        # Καθυστέρηση ανάμεσα σε spawns
+        self.spawn_delay = 0.8
+
+        # ==================================================
+        # TIMING
+        # ==================================================
+
+        # Cooldown κίνησης παίκτη (grid-based)
+        self._move_cooldown = 0.0
+
+        # Πλήθος βημάτων προσομοίωσης από το reset()
+        self.ticks = 0
+
+        self.reset(player_count)
+
+    # ==================================================
+    # Reset – ΚΑΘΕ ΝΕΟ GAME (SINGLE ή MULTI)
+    # ==================================================
+
+    def reset(self, player_count: int = 1, seed=None):
+        """
+        Επαναφέρει τον κόσμο στην αρχική κατάσταση ενός νέου παιχνιδιού,
+        σαν να άνοιξε μόλις το παιχνίδι.
+
+        seed: αν δοθεί, η προσομοίωση ξεκινά με νέα random.Random(seed)
+        (χρησιμοποιείται για καταγραφή / επανάληψη παιχνιδιού)
+        """
+
+        self.player_count = player_count
+
+        if seed is not None:
+            self.rng = random.Random(seed)
+            self.enemy_form_system.rng = self.rng
+
+        # --------------------------------------------------
+        # Reset Level
+        # --------------------------------------------------
+        # Επαναφορά στο πρώτο επίπεδο
+        self.level_index = 1
+
+        # Δημιουργία ΝΕΟΥ αντικειμένου Level
+        # Η παλιά πίστα πετιέται και ξεκινάμε από καθαρό grid
+        self.level = CompactLevel(self.width, self.height)
+
+        # --------------------------------------------------
+        # Reset Difficulty
+        # --------------------------------------------------
+        # Υπολογισμός συνολικών εχθρών για το level 1
+        self.total_enemies = self.scaler.enemies_for_level(self.level_index)
+
+        # Μέγιστοι ενεργοί εχθροί στην πίστα
+        # (αρχικά περιορισμένοι για ομαλή δυσκολία)
+        self.max_active = min(2, self.total_enemies)
+
+        # Καθυστέρηση κίνησης εχθρών
+        # Όσο μικρότερη, τόσο πιο γρήγοροι
+        self.enemy_delay = self.scaler.enemy_move_delay(self.level_index)
+
+        # Εύρεση διαδρομής εχθρών για το level 1
+        self.enemy_brain.configure(*self.scaler.pathfinding_for_level(self.level_index))
+
+        # Δημιουργία EnemySpawner
+        # Καθορίζει από πού εμφανίζονται οι εχθροί
+        self.enemy_spawner = EnemySpawner(
+            spawn_x=self.level.width - 2,
+            spawn_y=2,
+            rng=self.rng,
+        )
+
+        # ==================================================
+        # Players
+        # ==================================================
+
+        # --------------------------------------------------
+        # Player 1 (υπάρχει ΠΑΝΤΑ)
+        # --------------------------------------------------
+        self.player.alive = True
+        self.player.tile_x = self.RESPAWN_X
+        self.player.tile_y = self.RESPAWN_Y
+
+        # Μηδενισμός κατεύθυνσης (ώστε να μην πυροβολεί άμεσα)
+        self.player.direction = None
+
+        # --------------------------------------------------
+        # Player 2 (μόνο αν επιλεγεί multiplayer)
+        # --------------------------------------------------
+        if player_count == 2:
+
+            # Αν δεν υπάρχει ήδη Player 2, τον δημιουργούμε
+            if self.player2 is None:
+                self.player2 = Player(
+                    "p2",
+                    self.RESPAWN_X + 2,
+                    self.RESPAWN_Y
+                )
+
+            # Reset κατάστασης Player 2
+            self.player2.alive = True
+            self.player2.tile_x = self.RESPAWN_X + 2
+            self.player2.tile_y = self.RESPAWN_Y
+            self.player2.direction = None
+
+            self.players = [self.player, self.player2]
+
+        else:
+            # Single Player
+            # Ο Player 2 απενεργοποιείται πλήρως
+            self.player2 = None
+            self.players = [self.player]
+
+        # Reset προηγούμενων εχθρών (για explosion detection)
+        self._alive_enemy_ids_prev = set()
+
+        # ==================================================
+        # Spawn περιεχομένου πίστας
+        # ==================================================
+        # ΠΡΟΣΟΧΗ:
+        # Γίνεται ΠΑΝΩ ΣΕ ΝΕΟ, ΚΑΘΑΡΟ Level
+        self._spawn_emeralds()
+        self._spawn_gold_bags()
+
+        # ==================================================
+        # Stats & Runtime State
+        # ==================================================
+
+        # Reset score
+        self.score.points = 0
+        self.score_p2.points = 0
+
+        # Reset ζωών
+        self.lives.count = 3
+        self.lives_p2.count = 3
+
+        # Καθαρισμός λιστών gameplay
+        self.enemies.clear()
+        self.bullets.clear()
+        self._reset_occupancy()
+
+        # Reset spawn counters
+        self.spawned_total = 0
+        self._spawn_timer = 0.0
+
+        # Reset cooldowns (να μη μεταφέρονται από το προηγούμενο παιχνίδι)
+        self._move_cooldown = 0.0
+        self.weapon = Weapon(cooldown=2.0)
+
+        # Ενεργοποίηση άτρωτου μετά το respawn
+        self.invuln_timer = self.INVULN_SECONDS
+
+        # Reset κατάστασης παιχνιδιού
+        self.game_mode = GameMode.NORMAL
+        self.level_complete_timer = 0.0
+
+        # Γεγονότα για το view και τέλος παιχνιδιού
+        self._explosions = []
+        self.game_over = False
+        self.ticks = 0
+
+    # ==================================================
+    # Αποτελέσματα / γεγονότα
+    # ==================================================
+
+    def final_scores(self) -> dict:
+        """
+        Σκορ των παικτών (payload για το GameOverScene).
+
+        players : 2 αν έπαιξε και δεύτερος παίκτης, αλλιώς 1
+        """
+
+        return {
+            "players": 1 if self.player2 is None else 2,
+            "score_p1": self.score.points,
+            "score_p2": self.score_p2.points,
+        }
+
+    def pop_explosions(self):
+        """
+        Επιστρέφει και αδειάζει τη λίστα (tile_x, tile_y)
+        των εχθρών που σκοτώθηκαν από την τελευταία κλήση.
+        """
+
+        events = self._explosions
+        self._explosions = []
+        return events
+
+    def _end_game(self):
+        # Τέλος παιχνιδιού: ο κόσμος σταματά να προχωρά
+        self.game_over = True
+
+    # ==================================================
+    # Helpers (βοηθητικές μέθοδοι gameplay)
+    # ==================================================
+
+    def _reset_occupancy(self):
+        # Νέο ευρετήριο θέσεων: μόνο οι παίκτες (οι εχθροί
+        # προστίθενται ένας-ένας όταν εμφανίζονται)
+        self.occupancy.clear()
+        for player in self.players:
+            self.occupancy.add(player)
+
+    def _enemies_at(self, x, y):
+        # Ζωντανοί εχθροί στο tile (x, y), με σειρά εμφάνισης
+        return [
+            e for e in self.occupancy.at(x, y)
+            if isinstance(e, Enemy) and e.alive
+        ]
+
+    def _respawn_player2(self):
+        # Επαναφορά Player 2 μετά από απώλεια ζωής
+
+        # Αν δεν υπάρχει Player 2 (single player),
+        # δεν κάνουμε τίποτα
+        if not self.player2:
+            return
+
+        # Τοποθέτηση Player 2 στο προκαθορισμένο respawn
+        self.player2.tile_x = self.RESPAWN_X + 2
+        self.player2.tile_y = self.RESPAWN_Y
+
+        # Μηδενισμός κατεύθυνσης
+        # ώστε να μην πυροβολήσει αμέσως
+        self.player2.direction = None
+
+        self.occupancy.update(self.player2)
+
+    def _spawn_emeralds(self):
+        """
+        Δημιουργία emeralds στην πίστα.
+
+        Κανόνας παιχνιδιού:
+        - Level 1: 40 emeralds
+        - Κάθε επόμενο level: +10
+        """
+
+        # Υπολογισμός πλήθους emeralds
+        count = 40 + (self.level_index - 1) * 10
+
+        placed = 0          # πόσα emeralds έχουν τοποθετηθεί
+        attempts = 0        # πόσες προσπάθειες έγιναν
+        max_attempts = count * 10  # όριο για αποφυγή infinite loop
+
+        # Προσπαθούμε μέχρι να τοποθετηθούν όλα
+        # ή να ξεπεραστεί το όριο προσπαθειών
+        while placed < count and attempts < max_attempts:
+            attempts += 1
+
+            # Τυχαία θέση ΜΕΣΑ στα όρια της πίστας
+            x = self.rng.randint(1, self.level.width - 2)
+            y = self.rng.randint(1, self.level.height - 2)
+
+            # Emerald μπορεί να μπει ΜΟΝΟ πάνω σε DIRT
+            if self.level.get_tile(x, y) == TileType.DIRT:
+                self.level.set_tile(x, y, TileType.EMERALD)
+                placed += 1
+
+    def _spawn_gold_bags(self):
+        """
+        Δημιουργία gold bags (σάκοι χρυσού).
+
+        Κανόνας παιχνιδιού:
+        - Level 1: 5 σάκοι
+        - Κάθε επόμενο level: +2
+        """
+
+        # Υπολογισμός πλήθους σάκων
+        count = 5 + (self.level_index - 1) * 2
+
+        # Καθαρισμός παλιάς λίστας
+        self.gold_bags.clear()
+
+        placed = 0
+        attempts = 0
+        max_attempts = count * 15
+
+        while placed < count and attempts < max_attempts:
+            attempts += 1
+
+            # Επιλέγουμε θέση όχι κοντά στα άκρα
+            x = self.rng.randint(2, self.level.width - 3)
+            y = self.rng.randint(2, self.level.height - 3)
+
+            # Κανόνας:
+            # - το tile ΠΡΕΠΕΙ να είναι DIRT
+            # - από κάτω ΠΡΕΠΕΙ επίσης να είναι DIRT
+            #   (ώστε να μπορεί να πέσει αργότερα)
+            if (
+                self.level.get_tile(x, y) == TileType.DIRT
+                and self.level.get_tile(x, y + 1) == TileType.DIRT
+            ):
+                # Δημιουργία αντικειμένου GoldBag
+                bag_id = f"g{placed}_{self.level_index}"
+                bag = GoldBag(bag_id, x, y)
+
+                # Προσθήκη στη λίστα gold bags
+                self.gold_bags.append(bag)
+
+                # Ενημέρωση tile map
+                self.level.set_tile(x, y, TileType.GOLD_BAG)
+
+                placed += 1
+
+    def _respawn_player(self):
+        # Επαναφορά Player 1 μετά από απώλεια ζωής
+
+        # Τοποθέτηση στο respawn
+        self.player.tile_x = self.RESPAWN_X
+        self.player.tile_y = self.RESPAWN_Y
+        self.occupancy.update(self.player)
+
+        # Μηδενισμός κατεύθυνσης
+        self.player.direction = None
+
+        # Καθαρισμός bullets
+        # (δεν συνεχίζουν να υπάρχουν μετά τον θάνατο)
+        self.bullets.clear()
+
+        # Ενεργοποίηση προσωρινής αθανασίας
+        self.invuln_timer = self.INVULN_SECONDS
+
+    def _handle_player_hit(self):
+        # Διαχείριση σύγκρουσης Player 1 με enemy
+
+        # Αν ο παίκτης είναι ακόμα άτρωτος,
+        # αγνοούμε το χτύπημα
+        if self.invuln_timer > 0.0:
+            return
+
+        # Χάνει μία ζωή
+        if not self.lives.lose_life():
+            # -----------------------------------------
+            # Player 1 ΠΕΘΑΝΕ ΟΡΙΣΤΙΚΑ
+            # -----------------------------------------
+            self.player.alive = False
+
+            # Αν υπάρχει Player 2 και έχει ζωές,
+            # το παιχνίδι συνεχίζεται σε co-op
+            if self.player2 and self.lives_p2.count > 0:
+                return
+
+            # Αλλιώς → Game Over
+            self._end_game()
+            return
+
+        # -----------------------------------------
+        # Player 1 έχει ακόμα ζωές → respawn
+        # -----------------------------------------
+        self._respawn_player()
+
+    def _load_next_level(self):
+        # --------------------------------------------------
+        # ΦΟΡΤΩΣΗ ΕΠΟΜΕΝΟΥ LEVEL
+        # --------------------------------------------------
+        # Η μέθοδος καλείται όταν:
+        # - έχουν συλλεχθεί ΟΛΑ τα emeralds
+        # - έχει ολοκληρωθεί το delay ολοκλήρωσης level
+        # --------------------------------------------------
+
+        # Έλεγχος αν υπάρχει επόμενο level
+        # Το DifficultyScaler γνωρίζει πόσα levels υποστηρίζονται
+        if not self.scaler.has_next_level(self.level_index):
+            # Δεν υπάρχει επόμενο level → ΤΕΛΟΣ ΠΑΙΧΝΙΔΙΟΥ
+            self._end_game()
+            return
+
+        # --------------------------------------------------
+        # Αύξηση δείκτη level & δημιουργία ΝΕΟΥ Level
+        # --------------------------------------------------
+        self.level_index += 1
+        self.level = CompactLevel(self.width, self.height)
+
+        # --------------------------------------------------
+        # RESET Player 1
+        # --------------------------------------------------
+        self.player.tile_x = self.RESPAWN_X
+        self.player.tile_y = self.RESPAWN_Y
+        self.player.direction = None
+
+        # ΣΗΜΑΝΤΙΚΟ:
+        # Αν ο Player είχε πεθάνει στο τέλος του προηγούμενου level,
+        # εδώ τον επαναφέρουμε ΖΩΝΤΑΝΟ
+        self.player.alive = True
+
+        # --------------------------------------------------
+        # RESET Player 2 (αν υπάρχει)
+        # --------------------------------------------------
+        if self.player2:
+            self.player2.tile_x = self.RESPAWN_X + 2
+            self.player2.tile_y = self.RESPAWN_Y
+            self.player2.direction = None
+
+            # Αντίστοιχα επαναφέρουμε τον Player 2
+            self.player2.alive = True
+
+        # --------------------------------------------------
+        # RESET runtime αντικειμένων
+        # --------------------------------------------------
+        self.enemies.clear()
+        self._reset_occupancy()
+
+        # Reset spawn counters
+        self.spawned_total = 0
+        self._spawn_timer = 0.0
+
+        self.bullets.clear()
+
+        # Επιστροφή σε κανονικό game mode
+        self.game_mode = GameMode.NORMAL
+
+        # Reset timer ολοκλήρωσης level
+        self.level_complete_timer = 0.0
+
+        # --------------------------------------------------
+        # Difficulty scaling για νέο level
+        # --------------------------------------------------
+        self.total_enemies = self.scaler.enemies_for_level(self.level_index)
+
+        # Όσο ανεβαίνει το level:
+        # - αυξάνεται το max πλήθος ταυτόχρονων enemies
+        self.max_active = min(
+            2 + self.level_index // 2,
+            self.total_enemies
+        )
+
+        # Enemy movement delay (πιο γρήγοροι enemies)
+        self.enemy_delay = self.scaler.enemy_move_delay(self.level_index)
+
+        # Εύρεση διαδρομής εχθρών (στρατηγική + όριο ανά level)
+        self.enemy_brain.configure(*self.scaler.pathfinding_for_level(self.level_index))
+
+        # --------------------------------------------------
+        # Spawn περιεχομένου πίστας
+        # --------------------------------------------------
+        self._spawn_emeralds()
+        self._spawn_gold_bags()
+
+    @staticmethod
+    def _direction_from(inp):
+        # Αντιστοίχιση input σε Direction enum
+        # (με σειρά προτεραιότητας: πάνω, κάτω, αριστερά, δεξιά)
+        if inp.up:
+            return Direction.UP
+        if inp.down:
+            return Direction.DOWN
+        if inp.left:
+            return Direction.LEFT
+        if inp.right:
+            return Direction.RIGHT
+        return None
+
+    def _handle_player2_input(self, inp):
+        # --------------------------------------------------
+        # ΧΕΙΡΙΣΜΟΣ INPUT ΓΙΑ PLAYER 2 (CO-OP)
+        # --------------------------------------------------
+
+        # Αν δεν υπάρχει Player 2 ή είναι νεκρός → αγνοούμε
+        if not self.player2 or not self.player2.alive or self.lives_p2.count <= 0:
+            return
+
+        if inp is None:
+            return
+
+        direction = self._direction_from(inp)
+
+        # Αν έχει πατηθεί κατεύθυνση
+        # και δεν υπάρχει cooldown κίνησης
+        if direction and self._move_cooldown <= 0:
+            self.player2.direction = direction
+
+            # Προσπάθεια μετακίνησης στο grid
+            if self.movement.try_move(self.player2, direction, self.level):
+                # Αν μπήκε σε νέο tile:
+                # ελέγχουμε interactions (emerald, dirt κ.λπ.)
+                self.tile_interaction.on_enter(self.player2, self.level)
+
+                # Θέτουμε cooldown για επόμενη κίνηση
+                self._move_cooldown = self.MOVE_COOLDOWN
+
+        # --------------------------------------------------
+        # FIRE
+        # --------------------------------------------------
+        if inp.fire:
+            # Αποθηκεύουμε πόσες σφαίρες υπήρχαν πριν
+            before = len(self.bullets)
+
+            # Προσπάθεια πυροβολισμού
+            self.weapon_system.try_fire(
+                self.weapon,
+                self.player2,
+                self.bullets
+            )
+
+            # Όσες σφαίρες δημιουργήθηκαν τώρα
+            # δηλώνονται ως bullets του Player 2
+            for b in self.bullets[before:]:
+                b.owner_id = "p2"
+
+            # Αν όντως πυροβόλησε
+            if len(self.bullets) > before:
+                AudioManager.play_sound("shot")
+
+    def _get_closest_player(self, enemy):
+        # --------------------------------------------------
+        # ΕΠΙΛΟΓΗ ΣΤΟΧΟΥ ΓΙΑ ENEMY
+        # --------------------------------------------------
+        # Επιστρέφει τον κοντινότερο ΖΩΝΤΑΝΟ παίκτη
+        # Χρησιμοποιείται από το Enemy AI
+        # --------------------------------------------------
+
+        alive_players = []
+
+        # Player 1
+        if self.player and self.player.alive:
+            alive_players.append(self.player)
+
+        # Player 2
+        if self.player2 and self.player2.alive:
+            alive_players.append(self.player2)
+
+        # Αν δεν υπάρχει ΚΑΝΕΝΑΣ ζωντανός παίκτης
+        # → enemy δεν έχει στόχο
+        if not alive_players:
+            return None
+
+        # Manhattan distance (grid-based απόσταση)
+        def dist(p):
+            return abs(p.tile_x - enemy.tile_x) + abs(p.tile_y - enemy.tile_y)
+
+        # Επιστροφή παίκτη με τη μικρότερη απόσταση
+        return min(alive_players, key=dist)
+
+    # ==================================================
+    # Step
+    # ==================================================
+
+    def step(self, dt, p1_input=None, p2_input=None):
+        # ==================================================
+        # ΕΝΑ ΒΗΜΑ ΠΡΟΣΟΜΟΙΩΣΗΣ
+        #
+        # dt       : χρόνος σε δευτερόλεπτα από το προηγούμενο βήμα
+        # p1_input : InputSnapshot του Player 1 (ή None)
+        # p2_input : InputSnapshot του Player 2 (ή None)
+        # ==================================================
+
+        # Μετά το τέλος του παιχνιδιού ο κόσμος δεν προχωρά
+        if self.game_over:
+            return
+
+        self.ticks += 1
+
+        # Νέο βήμα: οι αλλαγές tiles του προηγούμενου βήματος
+        # έχουν ήδη καταναλωθεί (listeners / render)
+        self.level.clear_dirty()
+
+        # Μείωση cooldown κίνησης παίκτη
+        self._move_cooldown = max(0.0, self._move_cooldown - dt)
+
+        # Ενημέρωση weapon cooldown
+        self.weapon.update(dt)
+
+        # Ενημέρωση invulnerability timer του Player 1
+        if self.invuln_timer > 0.0:
+            self.invuln_timer = max(0.0, self.invuln_timer - dt)
+
+        # ==================================================
+        # BONUS MODE
+        # ==================================================
+        # Σε bonus mode οι εχθροί αλλάζουν συμπεριφορά
+        if self.game_mode == GameMode.BONUS:
+            self.bonus_timer -= dt
+            if self.bonus_timer <= 0:
+                self.game_mode = GameMode.NORMAL
+
+        # ==================================================
+        # LEVEL COMPLETE MODE
+        # ==================================================
+        # Όταν τελειώσουν όλα τα emeralds, μπαίνουμε εδώ
+        if self.game_mode == GameMode.LEVEL_COMPLETE:
+            self.level_complete_timer -= dt
+            if self.level_complete_timer <= 0:
+                self._load_next_level()
+            return  # σταματάμε update όσο περιμένουμε
+
+        # ==================================================
+        # ΕΛΕΓΧΟΣ ΟΛΟΚΛΗΡΩΣΗΣ ΠΙΣΤΑΣ
+        # ==================================================
+        # Αν υπάρχει έστω ένα emerald στο grid, συνεχίζουμε
+        # (μετρητής του Level, O(1))
+        if self.level.emerald_count == 0:
+            self.game_mode = GameMode.LEVEL_COMPLETE
+            self.level_complete_timer = self.LEVEL_COMPLETE_DELAY
+            return
+
+        inp = p1_input
+
+        # Μέτρηση χρόνου ανά σύστημα (κενή αν δεν γίνεται profiling)
+        prof = self.profiler
+
+        with prof.section("players"):
+            # ==================================================
+            # PLAYER 1 MOVEMENT
+            # ==================================================
+            if self.player.alive and inp and self._move_cooldown <= 0:
+
+                direction = self._direction_from(inp)
+
+                if direction:
+                    # Αποθήκευση direction (χρησιμοποιείται στο sprite)
+                    self.player.direction = direction
+
+                    # Grid-based μετακίνηση
+                    if self.movement.try_move(self.player, direction, self.level):
+                        # Αλληλεπίδραση με tile (DIRT -> TUNNEL κ.λπ.)
+                        self.tile_interaction.on_enter(self.player, self.level)
+
+                        # Έλεγχος για emerald pickup και scoring
+                        self.score_system.on_player_enter(self.player, self.level)
+
+                        # Θέτουμε cooldown κίνησης
+                        self._move_cooldown = self.MOVE_COOLDOWN
+
+            # ==================================================
+            # PLAYER 2 EMERALD PICKUP (ΧΩΡΙΣ TileInteraction)
+            # ==================================================
+            if self.player2:
+                tx = self.player2.tile_x
+                ty = self.player2.tile_y
+
+                if self.level.get_tile(tx, ty) == TileType.EMERALD:
+                    self.level.set_tile(tx, ty, TileType.TUNNEL)
+                    self.score_p2.add_points(100)
+                    AudioManager.play_sound("menu_select")
+
+            # ==================================================
+            # PLAYER 1 FIRE WEAPON
+            # ==================================================
+            if self.player.alive and inp and inp.fire:
+
+                before = len(self.bullets)
+
+                # Δημιουργία bullet αν το weapon επιτρέπει fire
+                self.weapon_system.try_fire(self.weapon, self.player, self.bullets)
+
+                # Όλα τα νέα bullets ανήκουν στον Player 1
+                for b in self.bullets[before:]:
+                    b.owner_id = "p1"
+
+                if len(self.bullets) > before:
+                    AudioManager.play_sound("shot")
+
+            # ==================================================
+            # PLAYER 2 MOVEMENT & FIRE
+            # ==================================================
+            self._handle_player2_input(p2_input)
+
+        with prof.section("spawn"):
+            # ==================================================
+            # ENEMY SPAWN
+            # ==================================================
+            self._spawn_timer += dt
+
+            if (
+                    len(self.enemies) < self.max_active
+                    and self._spawn_timer >= self.spawn_delay
+            ):
+                # Δημιουργία enemy μέσω EnemySpawner
+                enemy = self.enemy_spawner.spawn()
+                enemy.move_timer = 0.0
+
+                self.enemies.append(enemy)
+                self.occupancy.add(enemy)
+                self.spawned_total += 1
+                self._spawn_timer = 0.0
+
+        with prof.section("ai"):
+            # ==================================================
+            # ENEMY UPDATE
+            # ==================================================
+            for enemy in self.enemies:
+                if not enemy.alive:
+                    continue
+
+                # Εναλλαγή NOBBIN / HOBBIN
+                self.enemy_form_system.update(enemy, dt)
+
+                enemy.move_timer += dt
+
+                if enemy.move_timer >= self.enemy_delay:
+                    # Επιλογή κοντινότερου ζωντανού παίκτη
+                    target_player = self._get_closest_player(enemy)
+
+                    if target_player:
+                        # AI απόφαση κίνησης
+                        # Κλάση: EnemyAISystem + EnemyBrain
+                        self.enemy_ai.update(
+                            enemies=[enemy],
+                            player=target_player,
+                            level=self.level,
+                            movement_system=self.movement,
+                            game_mode=self.game_mode,
+                        )
+
+                    # Αν είναι Hobbin, σκάβει
+                    self.hobbin_digging.on_enter(enemy, self.level)
+
+                    enemy.move_timer = 0.0
+
+        with prof.section("bullets"):
+            # ==================================================
+            # BULLETS UPDATE
+            # ==================================================
+            kills = self.bullet_system.update(
+                self.bullets,
+                self.level,
+                self.enemies,
+                dt,
+                occupancy=self.occupancy,
+            )
+
+            # ==================================================
+            # BULLET KILLS -> SCORE
+            # ==================================================
+            for enemy, owner in kills:
+                if owner == "p2":
+                    self.score_p2.add_points(250)
+                else:
+                    self.score.add_points(250)
+
+        with prof.section("collisions"):
+            # ==================================================
+            # PLAYER 1 VS ENEMY
+            # ==================================================
+            if self.player.alive and self.invuln_timer <= 0.0:
+                if self._enemies_at(self.player.tile_x, self.player.tile_y):
+                    self._handle_player_hit()
+
+            # ==================================================
+            # PLAYER 2 VS ENEMY
+            # ==================================================
+            if self.player2 and self.lives_p2.count > 0:
+                if self._enemies_at(self.player2.tile_x, self.player2.tile_y):
+                    if not self.lives_p2.lose_life():
+                        self.player2.alive = False
+                    else:
+                        self._respawn_player2()
+
+            # ==================================================
+            # GAME OVER CHECK
+            # ==================================================
+            if (
+                    not self.player.alive
+                    and (not self.player2 or not self.player2.alive)
+                    and self.invuln_timer <= 0.0
+            ):
+                self._end_game()
+                return
+
+            # ==================================================
+            # ENEMY DEATH EXPLOSIONS
+            # ==================================================
+            alive_now = set(id(e) for e in self.enemies if e.alive)
+            dead_ids = self._alive_enemy_ids_prev - alive_now
+
+            if dead_ids:
+                for e in self.enemies:
+                    if id(e) in dead_ids:
+                        self._explosions.append((e.tile_x, e.tile_y))
+
+            self._alive_enemy_ids_prev = alive_now
+
+        # ==================================================
+        # CLEANUP
+        # ==================================================
+        for e in self.enemies:
+            if not e.alive:
+                self.occupancy.remove(e)
+
+        self.enemies = [e for e in self.enemies if e.alive]
+
+        with prof.section("gold_bags"):
+            # Ενημέρωση gold sack physics
+            self.gold_bag_system.update(self.gold_bags, self.level, dt)
+
+            # ==================================================
+            # GOLD BAG INTERACTIONS
+            # ==================================================
+            for bag in self.gold_bags:
+                if bag.collected:
+                    continue
+
+                # Player 1 eats sack
+                if not bag.is_gold and not bag.falling:
+                    if bag.tile_x == self.player.tile_x and bag.tile_y == self.player.tile_y:
+                        bag.collected = True
+                        self.level.set_tile(bag.tile_x, bag.tile_y, TileType.TUNNEL)
+                        AudioManager.play_sound("menu_select")
+                        continue
+
+                # Player 2 eats sack
+                if self.player2 and not bag.is_gold and not bag.falling:
+                    if bag.tile_x == self.player2.tile_x and bag.tile_y == self.player2.tile_y:
+                        bag.collected = True
+                        self.level.set_tile(bag.tile_x, bag.tile_y, TileType.TUNNEL)
+                        AudioManager.play_sound("menu_select")
+                        continue
+
+                # Gold pile pickup
+                if bag.is_gold:
+                    if bag.tile_x == self.player.tile_x and bag.tile_y == self.player.tile_y:
+                        bag.collected = True
+                        self.score_system.add_points(500)
+                        AudioManager.play_sound("menu_select")
+                        continue
+
+                if self.player2 and bag.is_gold:
+                    if bag.tile_x == self.player2.tile_x and bag.tile_y == self.player2.tile_y:
+                        bag.collected = True
+                        self.score_p2.add_points(500)
+                        AudioManager.play_sound("menu_select")
+                        continue
+
+                # Enemy interactions with gold
+                # (lookup στα tiles του σακιού αντί για σάρωση όλων των εχθρών)
+                if bag.falling:
+                    # Όλοι οι εχθροί στη στήλη που διέσχισε το σακί
+                    y_min = min(bag.prev_tile_y, bag.tile_y)
+                    y_max = max(bag.prev_tile_y, bag.tile_y)
+
+                    hit = [
+                        e
+                        for y in range(y_min, y_max + 1)
+                        for e in self._enemies_at(bag.tile_x, y)
+                    ]
+
+                    if hit:
+                        # Σκοτώνεται ένας εχθρός: αυτός που εμφανίστηκε πρώτος
+                        enemy = min(hit, key=self.occupancy.order)
+                        enemy.alive = False
+                        self._explosions.append((enemy.tile_x, enemy.tile_y))
+                        self.score_system.add_points(250)
+
+                elif bag.is_gold and self._enemies_at(bag.tile_x, bag.tile_y):
+                    bag.collected = True
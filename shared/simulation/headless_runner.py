@@ -0,0 +1,141 @@
+"""
+Headless εκτέλεση πολλών παιχνιδιών (χωρίς οθόνη) με τον GameWorld.
+
+Κάθε παιχνίδι παίζεται από έναν απλό "bot" με τυχαία αλλά
+ντετερμινιστική είσοδο (κρατά μια κατεύθυνση για λίγα βήματα και
+πυροβολεί περιστασιακά). Με ίδιο seed τα αποτελέσματα είναι ίδια,
+οπότε ο runner χρησιμεύει για balancing και για regression benchmarks.
+
+Εκτέλεση (από τον φάκελο του project):
+
+    python -m shared.simulation.headless_runner
+    python -m shared.simulation.headless_runner --games 500 --players 2 --seed 7
+    python -m shared.simulation.headless_runner --games 5000 --workers 16
+"""
+
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from shared.config.game_config import GameConfig
+from shared.services.input import InputSnapshot
+from shared.simulation.game_world import GameWorld
+
+
+class ScriptedBot:
+    """
+    Παράγει InputSnapshot για έναν παίκτη από δική του rng.
+
+    - κρατά μία κατεύθυνση για hold_min..hold_max βήματα
+    - πυροβολεί με πιθανότητα fire_chance ανά βήμα
+    """
+
+    DIRECTIONS = ("up", "down", "left", "right")
+
+    def __init__(self, rng, hold_min=6, hold_max=40, fire_chance=0.03):
+        self.rng = rng
+        self.hold_min = hold_min
+        self.hold_max = hold_max
+        self.fire_chance = fire_chance
+
+        self._direction = None
+        self._hold = 0
+
+    def next_input(self) -> InputSnapshot:
+        if self._hold <= 0:
+            self._direction = self.rng.choice(self.DIRECTIONS)
+            self._hold = self.rng.randint(self.hold_min, self.hold_max)
+
+        self._hold -= 1
+
+        return InputSnapshot(
+            **{self._direction: True},
+            fire=self.rng.random() < self.fire_chance,
+        )
+
+
+def play_game(seed, players=1, max_ticks=60 * 60 * 3, dt=None):
+    """
+    Παίζει ένα παιχνίδι μέχρι game over ή max_ticks βήματα.
+
+    Επιστρέφει λεξικό με τα αποτελέσματα.
+    """
+
+    if dt is None:
+        dt = 1.0 / GameConfig.default().fps
+
+    world = GameWorld(player_count=players, seed=seed)
+
+    # Ξεχωριστή rng για την είσοδο, ώστε ο bot να μην
+    # επηρεάζει την τυχαιότητα του ίδιου του κόσμου
+    input_rng = random.Random(seed ^ 0x5EED)
+    bot1 = ScriptedBot(input_rng)
+    bot2 = ScriptedBot(input_rng) if players == 2 else None
+
+    while not world.game_over and world.ticks < max_ticks:
+        world.step(
+            dt,
+            bot1.next_input(),
+            bot2.next_input() if bot2 else None,
+        )
+
+    return {
+        "seed": seed,
+        "ticks": world.ticks,
+        "level": world.level_index,
+        "game_over": world.game_over,
+        **world.final_scores(),
+    }
+
+
+def run(games, players, seed, max_ticks, workers=1):
+    seeds = range(seed, seed + games)
+    start = time.perf_counter()
+
+    if workers > 1:
+        # Κάθε παιχνίδι είναι ανεξάρτητο, οπότε μοιράζονται σε processes.
+        # Το αποτέλεσμα κάθε seed είναι ίδιο με τη σειριακή εκτέλεση.
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(
+                play_game,
+                seeds,
+                [players] * games,
+                [max_ticks] * games,
+                chunksize=max(1, games // (workers * 4)),
+            ))
+    else:
+        results = [play_game(s, players, max_ticks) for s in seeds]
+
+    elapsed = time.perf_counter() - start
+
+    total_ticks = sum(r["ticks"] for r in results)
+    ended = sum(1 for r in results if r["game_over"])
+
+    print(f"games        : {games} ({players}P, seeds {seed}..{seed + games - 1}, {workers} workers)")
+    print(f"elapsed      : {elapsed:.2f} s ({games / elapsed * 60:.0f} games/min, "
+          f"{total_ticks / elapsed:.0f} ticks/s)")
+    print(f"game over    : {ended}/{games}")
+    print(f"mean ticks   : {total_ticks / games:.0f}")
+    print(f"mean level   : {sum(r['level'] for r in results) / games:.2f}")
+    print(f"mean score P1: {sum(r['score_p1'] for r in results) / games:.1f}")
+    if players == 2:
+        print(f"mean score P2: {sum(r['score_p2'] for r in results) / games:.1f}")
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Digger simulation")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--players", type=int, choices=(1, 2), default=1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-ticks", type=int, default=60 * 60 * 3)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    run(args.games, args.players, args.seed, args.max_ticks, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+Καταγραφή και επανάληψη (replay) παιχνιδιού.
+
+Ένα παιχνίδι του GameWorld είναι πλήρως ντετερμινιστικό όταν:
+- ξεκινά με γνωστό seed (GameWorld.reset(..., seed=...))
+- κάθε βήμα έχει σταθερό dt (1 / tick_rate)
+- η είσοδος κάθε βήματος είναι γνωστή
+
+Οπότε αρκεί να αποθηκεύσουμε το seed και την είσοδο ανά tick.
+Κάθε InputSnapshot χωράει σε ένα byte (ένα bit ανά πλήκτρο),
+δηλαδή 1 byte / tick για 1 παίκτη και 2 bytes / tick για 2 παίκτες.
+
+Μορφή αρχείου (little endian):
+
+    header : magic "DGRP", version, players, tick_rate, seed,
+             πλήθος ticks, checksum τελικής κατάστασης (crc32)
+    body   : ticks * players bytes (P1, [P2]) ανά tick
+
+Εκτέλεση replay χωρίς οθόνη (από τον φάκελο του project):
+
+    python -m shared.simulation.replay recording.dgr
+    python -m shared.simulation.replay recording.dgr --profile
+"""
+
+import argparse
+import struct
+import time
+import zlib
+
+from shared.services.input import InputSnapshot
+from shared.simulation.game_world import GameWorld
+
+
+# ==================================================
+# ΜΟΡΦΗ ΑΡΧΕΙΟΥ
+# ==================================================
+
+MAGIC = b"DGRP"
+VERSION = 1
+
+# magic, version, players, tick_rate, seed, ticks, checksum
+_HEADER = struct.Struct("<4sBBHqII")
+
+# Bits ενός InputSnapshot (με αυτή τη σειρά)
+_INPUT_FIELDS = ("up", "down", "left", "right", "fire", "pause")
+
+
+class ReplayError(ValueError):
+    """
+    Μη έγκυρο ή ασύμβατο αρχείο replay.
+    """
+
+
+def pack_input(snapshot) -> int:
+    """
+    InputSnapshot -> byte (None = καμία είσοδος).
+    """
+
+    if snapshot is None:
+        return 0
+
+    bits = 0
+    for i, name in enumerate(_INPUT_FIELDS):
+        if getattr(snapshot, name):
+            bits |= 1 << i
+    return bits
+
+
+def unpack_input(bits: int) -> InputSnapshot:
+    """
+    byte -> InputSnapshot.
+    """
+
+    return InputSnapshot(**{
+        name: bool(bits & (1 << i))
+        for i, name in enumerate(_INPUT_FIELDS)
+    })
+
+
+def world_checksum(world) -> int:
+    """
+    crc32 της κατάστασης του κόσμου που επηρεάζει το gameplay:
+    πίστα, παίκτες, εχθροί, σακιά, σφαίρες, σκορ και ζωές.
+
+    Δύο runs είναι ίδια αν δίνουν ίδιο checksum στο ίδιο tick.
+    """
+
+    level = world.level
+
+    tiles = bytes(
+        level.get_tile(x, y).value & 0xFF
+        for y in range(level.height)
+        for x in range(level.width)
+    )
+
+    players = [
+        (p.tile_x, p.tile_y, p.alive)
+        for p in (world.player, world.player2) if p is not None
+    ]
+
+    state = (
+        world.ticks,
+        world.level_index,
+        world.game_over,
+        players,
+        [(e.tile_x, e.tile_y, e.alive, e.form.name) for e in world.enemies],
+        [(b.tile_x, b.tile_y, b.falling, b.is_gold, b.collected) for b in world.gold_bags],
+        [(b.tile_x, b.tile_y) for b in world.bullets],
+        world.score.points,
+        world.score_p2.points,
+        world.lives.count,
+        world.lives_p2.count,
+    )
+
+    return zlib.crc32(repr(state).encode("utf-8"), zlib.crc32(tiles))
+
+
+# ==================================================
+# ΚΑΤΑΓΡΑΦΗ
+# ==================================================
+
+class InputRecorder:
+    """
+    Κρατά στη μνήμη την είσοδο κάθε tick και τη γράφει
+    σε αρχείο στο τέλος (save). Κόστος ανά tick: 1-2 bytes.
+    """
+
+    def __init__(self, seed: int, player_count: int = 1, tick_rate: int = 60):
+        self.seed = seed
+        self.player_count = player_count
+        self.tick_rate = tick_rate
+
+        self._data = bytearray()
+        self.ticks = 0
+
+    def record(self, p1_input, p2_input=None) -> None:
+        """
+        Καταγράφει την είσοδο ενός tick (πριν από το GameWorld.step).
+        """
+
+        self._data.append(pack_input(p1_input))
+        if self.player_count == 2:
+            self._data.append(pack_input(p2_input))
+        self.ticks += 1
+
+    def save(self, path: str, world=None) -> None:
+        """
+        Γράφει το αρχείο. Αν δοθεί ο κόσμος, αποθηκεύεται και το checksum
+        της τελικής του κατάστασης για έλεγχο κατά το replay.
+        """
+
+        checksum = world_checksum(world) if world is not None else 0
+
+        header = _HEADER.pack(
+            MAGIC, VERSION, self.player_count, self.tick_rate,
+            self.seed, self.ticks, checksum,
+        )
+
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(self._data)
+
+
+# ==================================================
+# ΕΠΑΝΑΛΗΨΗ
+# ==================================================
+
+class Replay:
+    """
+    Ένα φορτωμένο αρχείο replay.
+
+    Η είσοδος διαβάζεται σειριακά με next_inputs(),
+    ένα ζεύγος (p1, p2) ανά tick.
+    """
+
+    def __init__(self, seed, player_count, tick_rate, inputs, checksum=0):
+        self.seed = seed
+        self.player_count = player_count
+        self.tick_rate = tick_rate
+        self.checksum = checksum
+
+        self._inputs = inputs
+        self._pos = 0
+
+        # Τα bytes είναι λίγες τιμές: κρατάμε έτοιμα snapshots ανά τιμή
+        self._snapshots = {}
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if len(data) < _HEADER.size:
+            raise ReplayError(f"Replay file too short: {path}")
+
+        magic, version, players, tick_rate, seed, ticks, checksum = \
+            _HEADER.unpack_from(data)
+
+        if magic != MAGIC:
+            raise ReplayError(f"Not a replay file: {path}")
+        if version != VERSION:
+            raise ReplayError(f"Unsupported replay version {version}: {path}")
+        if players not in (1, 2):
+            raise ReplayError(f"Invalid player count {players}: {path}")
+
+        inputs = data[_HEADER.size:]
+        if len(inputs) != ticks * players:
+            raise ReplayError(f"Truncated replay file: {path}")
+
+        return cls(seed, players, tick_rate, inputs, checksum)
+
+    def __len__(self):
+        return len(self._inputs) // self.player_count
+
+    @property
+    def finished(self) -> bool:
+        return self._pos >= len(self._inputs)
+
+    def _snapshot(self, bits):
+        snapshot = self._snapshots.get(bits)
+        if snapshot is None:
+            snapshot = self._snapshots[bits] = unpack_input(bits)
+        return snapshot
+
+    def next_inputs(self):
+        """
+        (p1, p2) InputSnapshots του επόμενου tick
+        (p2 = None σε single player).
+        """
+
+        data = self._inputs
+        pos = self._pos
+
+        p1 = self._snapshot(data[pos])
+        p2 = self._snapshot(data[pos + 1]) if self.player_count == 2 else None
+
+        self._pos = pos + self.player_count
+        return p1, p2
+
+    def rewind(self) -> None:
+        self._pos = 0
+
+
+def play_headless(replay: Replay, world=None, profiler=None):
+    """
+    Ξαναπαίζει ολόκληρο το replay σε GameWorld χωρίς οθόνη.
+    Επιστρέφει τον κόσμο στην τελική του κατάσταση.
+    """
+
+    if world is None:
+        world = GameWorld(profiler=profiler)
+
+    world.reset(replay.player_count, seed=replay.seed)
+    replay.rewind()
+
+    dt = 1.0 / replay.tick_rate
+    step = world.step
+
+    while not replay.finished:
+        if profiler is not None:
+            profiler.begin_frame()
+
+        p1, p2 = replay.next_inputs()
+        step(dt, p1, p2)
+
+        if profiler is not None:
+            profiler.end_frame()
+
+    return world
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Digger replay")
+    parser.add_argument("path")
+    parser.add_argument("--profile", action="store_true",
+                        help="χρόνοι ανά σύστημα (p50/p95/p99 ανά tick)")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.path)
+
+    profiler = None
+    if args.profile:
+        from shared.core.profiler import Profiler
+        profiler = Profiler(enabled=True, window=max(1, len(replay)))
+
+    start = time.perf_counter()
+    world = play_headless(replay, profiler=profiler)
+    elapsed = time.perf_counter() - start
+
+    checksum = world_checksum(world)
+
+    print(f"replay       : {args.path} ({replay.player_count}P, seed {replay.seed})")
+    print(f"ticks        : {world.ticks} ({world.ticks / max(elapsed, 1e-9):.0f} ticks/s)")
+    print(f"level        : {world.level_index}   game over: {world.game_over}")
+    print(f"scores       : P1 {world.score.points}   P2 {world.score_p2.points}")
+
+    if replay.checksum:
+        status = "OK" if checksum == replay.checksum else "MISMATCH"
+        print(f"checksum     : {checksum:08x} (recorded {replay.checksum:08x}) {status}")
+    else:
+        print(f"checksum     : {checksum:08x}")
+
+    if profiler is not None:
+        print()
+        print(f"{'section':>12} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+        for name, entry in profiler.stats().items():
+            print(f"{name:>12} {entry['p50']:>8.3f} {entry['p95']:>8.3f} "
+                  f"{entry['p99']:>8.3f} {entry['max']:>8.3f}")
+
+    if replay.checksum and checksum != replay.checksum:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()